@@ -0,0 +1,210 @@
+"""Automatic, load-balanced assignment of requests to staff.
+
+Each staff member's load is the weighted sum of their open requests:
+priority weight times request-type weight, so one urgent body cam request
+counts as much as many routine reports.  ``AssignmentEngine`` keeps the
+loads in a min-heap, so choosing the least-loaded staff member costs
+O(log n).  Load changes push a fresh heap entry instead of re-sorting; an
+entry whose load no longer matches is stale and is skipped when popped
+(lazy deletion).
+
+The heap lives in process memory and is rebuilt from Mongo at startup and
+every ``AUTO_ASSIGN_REBUILD_SECONDS``.  That resync also corrects drift
+from other worker processes and from changes the engine isn't told about.
+Routes that move requests between staff or in and out of the open
+statuses call ``request_opened`` / ``request_closed``.  Rarer changes
+(staff created, demoted or deleted, requests deleted) call ``invalidate``,
+which forces a rebuild before the next pick.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from codec import to_document
+from database import db
+from denormalize import staff_fields
+from models import Notification
+
+logger = logging.getLogger(__name__)
+
+# Statuses that count towards a staff member's workload
+OPEN_STATUSES = ["assigned", "in_progress"]
+
+PRIORITY_WEIGHTS = {"low": 1.0, "medium": 2.0, "high": 3.0, "urgent": 5.0}
+# Footage has to be reviewed and redacted frame by frame
+TYPE_WEIGHTS = {
+    "body_cam_footage": 3.0,
+    "case_file": 1.5,
+    "incident_report": 1.0,
+    "police_report": 1.0,
+    "other": 1.0,
+}
+
+
+def request_weight(request: dict) -> float:
+    return PRIORITY_WEIGHTS.get(request.get("priority"), 2.0) * TYPE_WEIGHTS.get(request.get("request_type"), 1.0)
+
+
+async def weighted_workload(staff_ids: List[str]) -> Tuple[Dict[str, float], Dict[str, int]]:
+    """Weighted load and open request count per staff member, in one aggregation."""
+    pipeline = [
+        {"$match": {"status": {"$in": OPEN_STATUSES}, "assigned_staff_id": {"$in": staff_ids}}},
+        {"$group": {
+            "_id": {"staff": "$assigned_staff_id", "priority": "$priority", "type": "$request_type"},
+            "count": {"$sum": 1},
+        }},
+    ]
+    load = {staff_id: 0.0 for staff_id in staff_ids}
+    open_count = {staff_id: 0 for staff_id in staff_ids}
+    async for row in db.requests.aggregate(pipeline):
+        staff_id = row["_id"]["staff"]
+        load[staff_id] += row["count"] * request_weight({"priority": row["_id"].get("priority"), "request_type": row["_id"].get("type")})
+        open_count[staff_id] += row["count"]
+    return load, open_count
+
+
+class AssignmentEngine:
+    def __init__(self):
+        self._heap = []
+        self._load: Dict[str, float] = {}
+        self._open: Dict[str, int] = {}
+        self._staff: Dict[str, dict] = {}
+        self._counter = itertools.count()
+        self._lock = asyncio.Lock()
+        self._stale = True
+        self.rebuilt_at: Optional[datetime] = None
+
+    async def rebuild(self):
+        """Reload active staff and their open workload (one find, one aggregation)."""
+        staff = await db.users.find(
+            {"role": "staff", "is_active": {"$ne": False}}, {"_id": 0, "id": 1, "full_name": 1, "email": 1}
+        ).to_list(None)
+        load, open_count = await weighted_workload([member["id"] for member in staff])
+
+        self._staff = {member["id"]: member for member in staff}
+        self._load = load
+        self._open = open_count
+        self._heap = [(value, next(self._counter), staff_id) for staff_id, value in load.items()]
+        heapq.heapify(self._heap)
+        self._stale = False
+        self.rebuilt_at = datetime.now(timezone.utc)
+        logger.info("Assignment queue rebuilt for %d staff", len(staff))
+
+    def invalidate(self):
+        self._stale = True
+
+    def request_opened(self, staff_id: Optional[str], request: dict):
+        """``request`` became open work for ``staff_id`` (assigned or reopened)."""
+        self._adjust(staff_id, request_weight(request), 1)
+
+    def request_closed(self, staff_id: Optional[str], request: dict):
+        """``request`` stopped being open work for ``staff_id`` (finished, denied or reassigned)."""
+        self._adjust(staff_id, -request_weight(request), -1)
+
+    def status_changed(self, request: dict, old_status: str, new_status: str):
+        """Track a status transition of an assigned request."""
+        was_open, is_open = old_status in OPEN_STATUSES, new_status in OPEN_STATUSES
+        if was_open and not is_open:
+            self.request_closed(request.get("assigned_staff_id"), request)
+        elif is_open and not was_open:
+            self.request_opened(request.get("assigned_staff_id"), request)
+
+    def reassigned(self, request: dict, new_staff_id: str):
+        """Track ``request`` (as stored before the change) moving to ``new_staff_id``."""
+        if request.get("status") in OPEN_STATUSES:
+            self.request_closed(request.get("assigned_staff_id"), request)
+        self.request_opened(new_staff_id, request)
+
+    def _adjust(self, staff_id: Optional[str], weight: float, count: int):
+        if staff_id not in self._load:
+            return
+        self._load[staff_id] = max(self._load[staff_id] + weight, 0.0)
+        self._open[staff_id] = max(self._open[staff_id] + count, 0)
+        heapq.heappush(self._heap, (self._load[staff_id], next(self._counter), staff_id))
+        # Stale entries pile up as loads change; compact once they dominate
+        if len(self._heap) > 4 * len(self._load) + 64:
+            self._heap = [(value, next(self._counter), sid) for sid, value in self._load.items()]
+            heapq.heapify(self._heap)
+
+    def _peek(self) -> Optional[str]:
+        while self._heap:
+            value, _, staff_id = self._heap[0]
+            if self._load.get(staff_id) == value:
+                return staff_id
+            heapq.heappop(self._heap)
+        return None
+
+    async def assign(self, request: dict) -> Optional[dict]:
+        """Give ``request`` to the least-loaded staff member.
+
+        Returns the staff user (``id``, ``full_name``, ``email``), or None
+        when there is no active staff member or the request was assigned
+        meanwhile.
+        """
+        async with self._lock:
+            if self._stale:
+                await self.rebuild()
+            staff_id = self._peek()
+            if staff_id is None:
+                return None
+            staff = self._staff[staff_id]
+            result = await db.requests.update_one(
+                {"id": request["id"], "assigned_staff_id": None},
+                {"$set": {
+                    "assigned_staff_id": staff_id,
+                    "status": "assigned",
+                    "updated_at": datetime.now(timezone.utc).isoformat(),
+                    **staff_fields(staff),
+                }, "$inc": {"version": 1}},
+            )
+            if result.modified_count == 0:
+                return None
+            self.request_opened(staff_id, request)
+
+        notification = Notification(
+            user_id=staff_id,
+            title="Request Assigned",
+            message=f"You have been assigned request: {request['title']}",
+        )
+        await db.notifications.insert_one(to_document(notification))
+        return staff
+
+    async def plan(self, requests: List[dict]) -> Dict[str, List[dict]]:
+        """Spread ``requests`` over staff, least loaded first; staff id -> requests.
+
+        Loads are updated as if the plan were applied; the caller writes it
+        and calls ``request_closed`` for any request it didn't write.
+        """
+        plan: Dict[str, List[dict]] = {}
+        async with self._lock:
+            if self._stale:
+                await self.rebuild()
+            for request in requests:
+                staff_id = self._peek()
+                if staff_id is None:
+                    break
+                plan.setdefault(staff_id, []).append(request)
+                self.request_opened(staff_id, request)
+        return plan
+
+    def staff(self, staff_id: str) -> Optional[dict]:
+        return self._staff.get(staff_id)
+
+    def snapshot(self) -> List[dict]:
+        """Staff in the order they will receive work, least loaded first."""
+        order = sorted(self._load, key=lambda staff_id: (self._load[staff_id], self._staff[staff_id]["full_name"]))
+        return [
+            {
+                "staff_id": staff_id,
+                "full_name": self._staff[staff_id]["full_name"],
+                "weighted_load": round(self._load[staff_id], 2),
+                "open_requests": self._open[staff_id],
+            }
+            for staff_id in order
+        ]
+
+
+assignment_engine = AssignmentEngine()
@@ -0,0 +1,66 @@
+"""Password hashing, JWT issuing and the ``get_current_user`` dependency."""
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from passlib.context import CryptContext
+import jwt
+
+from codec import from_document, projection_for
+from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from database import primary_db
+from models import User
+
+# Password hashing
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+security = HTTPBearer()
+
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.now(timezone.utc) + expires_delta
+    else:
+        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+def create_link_token(user_id: str, purpose: str, seconds: int) -> str:
+    """Short-lived token for a URL the browser opens itself, without the Authorization header.
+
+    It only opens what ``purpose`` names (see ``get_link_user``) and is
+    refused as a bearer token.
+    """
+    return create_access_token({"sub": user_id, "purpose": purpose}, timedelta(seconds=seconds))
+
+async def _token_user(token: str, purpose: Optional[str]) -> User:
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id: str = payload.get("sub")
+        if user_id is None or payload.get("purpose") != purpose:
+            raise credentials_exception
+    except jwt.PyJWTError:
+        raise credentials_exception
+    
+    user = await primary_db.users.find_one({"id": user_id}, projection_for(User))
+    if user is None:
+        raise credentials_exception
+    return from_document(User, user)
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    return await _token_user(credentials.credentials, None)
+
+async def get_link_user(token: str, purpose: str) -> User:
+    """The user a ``create_link_token`` link for ``purpose`` was issued to."""
+    return await _token_user(token, purpose)
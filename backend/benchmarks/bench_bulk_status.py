@@ -0,0 +1,81 @@
+"""Benchmark: closing out a batch of requests one call at a time vs in bulk.
+
+Run from the backend directory:
+
+    python benchmarks/bench_bulk_status.py [--requests 500]
+
+Seeds an in-process mongomock database, then moves one staff member's
+requests to "completed" through ``PUT /api/requests/{id}/status`` per
+request and through a single ``POST /api/requests/bulk-status``.  There is
+no network here, so against a real MongoDB the gap is wider: each single
+call also pays several database round trips.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["MONGO_URL"] = "mongomock://"
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+import config  # noqa: E402
+
+config.UPLOAD_DIR = Path(tempfile.mkdtemp())
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import database  # noqa: E402
+import seeding  # noqa: E402
+from server import create_app  # noqa: E402
+
+
+def login(client, account):
+    response = client.post("/api/auth/login", json={"email": account[1], "password": seeding.SEED_PASSWORD})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    spec = seeding.SeedSpec(
+        users=50,
+        staff=1,
+        admins=1,
+        requests=args.requests * 2,
+        messages_per_request=0,
+        files_per_request=0,
+        notifications_per_request=0,
+        status_weights={"in_progress": 1},
+    )
+    with TestClient(create_app()) as client:
+        result = client.portal.call(seeding.seed_database, database.db, spec)
+        headers = login(client, result.accounts["staff"][0])
+        ids = [request["id"] for request in client.get("/api/requests", headers=headers).json()]
+        single_ids, bulk_ids = ids[:args.requests], ids[args.requests:]
+
+        start = time.perf_counter()
+        for request_id in single_ids:
+            response = client.put(f"/api/requests/{request_id}/status", params={"new_status": "completed"}, headers=headers)
+            response.raise_for_status()
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        response = client.post("/api/requests/bulk-status", json={"request_ids": bulk_ids, "new_status": "completed"}, headers=headers)
+        response.raise_for_status()
+        bulk = time.perf_counter() - start
+        assert set(response.json()["results"].values()) == {"updated"}
+
+    print(f"{args.requests} requests to completed")
+    print(f"single calls : {single * 1000:8.1f} ms ({args.requests / single:8.0f} requests/s)")
+    print(f"bulk call    : {bulk * 1000:8.1f} ms ({args.requests / bulk:8.0f} requests/s)")
+    print(f"speedup      : {single / bulk:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark: deleting a heavy requester per request vs with the set-based cascade.
+
+Run from the backend directory:
+
+    python benchmarks/bench_cascade.py [--requests 5000]
+
+Seeds two citizens with ``--requests`` requests each (plus messages and
+file records) into an in-process mongomock database.  One is deleted the
+way ``DELETE /api/admin/users/{id}`` used to do it - two ``delete_many``
+per request - and the other with ``cascade.delete_user``.  mongomock
+has no network, so this measures query count rather than latency; each
+query saved is also a round trip saved against a real MongoDB.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["MONGO_URL"] = "mongomock://"
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+import config  # noqa: E402
+
+config.UPLOAD_DIR = Path(tempfile.mkdtemp())
+
+import cascade  # noqa: E402
+import database  # noqa: E402
+import seeding  # noqa: E402
+from database import db  # noqa: E402
+
+
+async def delete_user_per_request(user_id: str):
+    """The previous implementation, kept here for comparison."""
+    for request in await db.requests.find({"user_id": user_id}).to_list(None):
+        await db.files.delete_many({"request_id": request["id"]})
+        await db.messages.delete_many({"request_id": request["id"]})
+    await db.requests.delete_many({"user_id": user_id})
+    await db.requests.update_many({"assigned_staff_id": user_id}, {"$set": {"assigned_staff_id": None}})
+    await db.users.delete_one({"id": user_id})
+
+
+async def run(args):
+    await database.connect()
+    try:
+        spec = seeding.SeedSpec(
+            users=2,
+            staff=5,
+            admins=1,
+            requests=args.requests * 2,
+            messages_per_request=args.messages_per_request,
+            files_per_request=1,
+            notifications_per_request=1,
+            requester_skew=0,
+        )
+        result = await seeding.seed_database(db, spec)
+        (old_id, *_), (new_id, *_) = result.accounts["user"]
+        counts = {user_id: await db.requests.count_documents({"user_id": user_id}) for user_id in (old_id, new_id)}
+
+        start = time.perf_counter()
+        await delete_user_per_request(old_id)
+        per_request = time.perf_counter() - start
+
+        start = time.perf_counter()
+        report = await cascade.delete_user(new_id)
+        set_based = time.perf_counter() - start
+        assert report.requests == counts[new_id]
+    finally:
+        database.close()
+
+    print(f"per request : {counts[old_id]:6} requests in {per_request * 1000:8.1f} ms ({2 * counts[old_id] + 4} queries)")
+    print(f"set based   : {counts[new_id]:6} requests in {set_based * 1000:8.1f} ms (8 queries)")
+    print(f"removed     : {report.summary()}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--messages-per-request", type=float, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
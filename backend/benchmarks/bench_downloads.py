@@ -0,0 +1,180 @@
+"""Benchmark: large local downloads streamed by the API worker vs offloaded to the proxy.
+
+Run from the backend directory (Linux: worker CPU is read from /proc):
+
+    python benchmarks/bench_downloads.py [--size-mb 2048] [--downloads 3]
+
+Writes one ``--size-mb`` upload, then for each mode starts the API in a
+uvicorn subprocess (in-process mongomock database) and downloads the file
+``--downloads`` times over HTTP, reporting throughput and the CPU time the
+API process spent:
+
+* ``stream``: ``DOWNLOAD_OFFLOAD`` unset, the worker reads the file and
+  writes every byte to the socket.
+* ``nginx``: the worker only checks permissions and answers with
+  ``X-Accel-Redirect``.  No nginx is started; the proxy's side is played by
+  this script with ``os.sendfile`` into a local socket, which is what
+  nginx does with ``sendfile on``.
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["MONGO_URL"] = "mongomock://"
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+BLOB = "ab" * 32
+USER_ID = "bench-admin"
+FILE_ID = "bench-file"
+CHUNK = 1024 * 1024
+
+
+def serve(args):
+    """Subprocess: the API with one admin, one request and one file record."""
+    import config
+
+    config.UPLOAD_DIR = Path(args.upload_dir)
+    config.DOWNLOAD_OFFLOAD = args.offload
+
+    import uvicorn
+
+    from codec import to_document
+    from database import db
+    from models import FileUpload, RecordRequest, RequestType, User, UserRole
+    from server import create_app
+
+    app = create_app()
+    startup = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app):
+        async with startup(app) as state:
+            user = User(id=USER_ID, email="bench@police.gov", full_name="Bench Admin", role=UserRole.ADMIN)
+            request = RecordRequest(user_id=USER_ID, title="Bench", description="Bench", request_type=RequestType.OTHER)
+            await db.users.insert_one(to_document(user))
+            await db.requests.insert_one(to_document(request))
+            await db.files.insert_one(to_document(FileUpload(
+                id=FILE_ID, request_id=request.id, filename=BLOB, original_name="bodycam.mp4",
+                file_size=args.size, content_type="video/mp4", uploaded_by=USER_ID,
+            )))
+            yield state
+
+    app.router.lifespan_context = lifespan
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="error")
+
+
+def cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def proxy_sendfile(path: Path) -> int:
+    """What the proxy does with an internal redirect: sendfile into the client socket."""
+    proxy, client = socket.socketpair()
+    received = 0
+
+    def drain():
+        nonlocal received
+        while data := client.recv(CHUNK):
+            received += len(data)
+
+    reader = threading.Thread(target=drain)
+    reader.start()
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        offset = 0
+        while offset < size:
+            offset += os.sendfile(proxy.fileno(), file.fileno(), offset, size - offset)
+    proxy.close()
+    reader.join()
+    client.close()
+    return received
+
+
+def run_mode(mode: str, args, upload_dir: Path, size: int):
+    import httpx
+
+    import config
+    from auth import create_access_token
+
+    port = free_port()
+    server = subprocess.Popen([
+        sys.executable, __file__, "--serve", "--port", str(port), "--upload-dir", str(upload_dir),
+        "--offload", "" if mode == "stream" else mode, "--size", str(size),
+    ])
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': USER_ID})}"}
+    url = f"http://127.0.0.1:{port}/api/download/{FILE_ID}"
+    try:
+        with httpx.Client(timeout=None) as client:
+            for _ in range(100):
+                try:
+                    client.get(f"http://127.0.0.1:{port}/api/")  # any answer means it is up
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            cpu_before = cpu_seconds(server.pid)
+            start = time.perf_counter()
+            for _ in range(args.downloads):
+                received = 0
+                with client.stream("GET", url, headers=headers) as response:
+                    response.raise_for_status()
+                    redirect = response.headers.get("x-accel-redirect")
+                    for chunk in response.iter_raw(CHUNK):
+                        received += len(chunk)
+                if redirect:
+                    received = proxy_sendfile(upload_dir / redirect[len(config.DOWNLOAD_OFFLOAD_PREFIX):])
+                assert received == size, (mode, received)
+            elapsed = time.perf_counter() - start
+            cpu = cpu_seconds(server.pid) - cpu_before
+    finally:
+        server.terminate()
+        server.wait()
+    total_mb = size * args.downloads / 1024 / 1024
+    print(f"{mode:<7}: {total_mb / elapsed:8.0f} MB/s  {elapsed:7.2f} s wall  {cpu:7.2f} s API CPU")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=2048)
+    parser.add_argument("--downloads", type=int, default=3)
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--upload-dir", help=argparse.SUPPRESS)
+    parser.add_argument("--offload", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        return serve(args)
+
+    with tempfile.TemporaryDirectory() as upload_dir:
+        upload_dir = Path(upload_dir)
+        path = upload_dir / BLOB[:2] / BLOB[2:4] / BLOB
+        path.parent.mkdir(parents=True)
+        block = os.urandom(CHUNK)
+        with open(path, "wb") as file:
+            for _ in range(args.size_mb):
+                file.write(block)
+        size = path.stat().st_size
+        print(f"{args.downloads} x {args.size_mb} MB download")
+        for mode in ("stream", "nginx"):
+            run_mode(mode, args, upload_dir, size)
+
+
+if __name__ == "__main__":
+    main()
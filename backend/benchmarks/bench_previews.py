@@ -0,0 +1,126 @@
+"""Benchmark: backfilling previews for thousands of existing uploads.
+
+Run from the backend directory:
+
+    python benchmarks/bench_previews.py [--files 2000] [--workers 1,2,4]
+
+Stores ``--files`` uploads in a temporary local store with file records in
+an in-process mongomock database - 12-megapixel JPEG photos, PNG
+screenshots and (with PyMuPDF installed) PDF reports - then runs
+``previews.backfill`` once per worker count, starting from no previews
+each time.  A last single-worker run decodes JPEGs at full size, which is
+what rendering cost before ``Image.draft``.
+
+Every upload is a distinct blob: the same source file with unique
+trailing bytes, which decoders ignore.
+"""
+import argparse
+import asyncio
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ["MONGO_URL"] = "mongomock://"
+os.environ.setdefault("DB_NAME", "benchmark")
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+import config  # noqa: E402
+
+config.UPLOAD_DIR = Path(tempfile.mkdtemp())
+
+from PIL import Image, JpegImagePlugin  # noqa: E402
+
+import database  # noqa: E402
+import previews  # noqa: E402
+from database import db  # noqa: E402
+from storage import PREVIEW_DIR, get_storage  # noqa: E402
+
+
+def sources():
+    # Smooth gradients with a little sensor noise: compresses like a photo, unlike pure noise
+    size = (4000, 3000)
+    base = Image.radial_gradient("L").resize(size)
+    grain = Image.blend(base, Image.effect_noise(size, 30), 0.15)
+    photo = io.BytesIO()
+    Image.merge("RGB", (grain, base.rotate(90), base.transpose(Image.Transpose.FLIP_LEFT_RIGHT))).save(photo, "JPEG", quality=90)
+    screenshot = io.BytesIO()
+    Image.linear_gradient("L").resize((1920, 1080)).convert("RGBA").save(screenshot, "PNG")
+    kinds = [("image/jpeg", photo.getvalue(), 6), ("image/png", screenshot.getvalue(), 3)]
+    if previews.pdf_supported():
+        from codec import to_document
+        from models import RecordRequest, RequestType, User
+        from pdf import generate_request_pdf
+
+        requester = User(email="bench@example.org", full_name="Bench Citizen")
+        request = RecordRequest(user_id=requester.id, title="Bench", description="Bench " * 200, request_type=RequestType.OTHER)
+        report = generate_request_pdf(to_document(request), to_document(requester), [])
+        kinds.append(("application/pdf", report.getvalue(), 1))
+    return kinds
+
+
+def store(count: int):
+    storage = get_storage()
+    kinds = sources()
+    cycle = [kind for kind in kinds for _ in range(kind[2])]
+    records = []
+    for index in range(count):
+        content_type, data, _ = cycle[index % len(cycle)]
+        writer = storage.open_incoming()
+        writer.write(data + uuid.uuid4().bytes)
+        writer.close()
+        name = uuid.uuid4().hex + uuid.uuid4().hex
+        storage.publish(writer.ref, name)
+        records.append({
+            "id": str(uuid.uuid4()), "request_id": "bench", "filename": name, "original_name": f"upload{index}",
+            "file_size": len(data) + 16, "content_type": content_type,
+        })
+    return records
+
+
+async def backfill(workers: int, count: int, label: str):
+    shutil.rmtree(config.UPLOAD_DIR / PREVIEW_DIR, ignore_errors=True)
+    await db.files.update_many({}, {"$unset": {"preview": ""}})
+    start = time.perf_counter()
+    counts = await previews.backfill(workers=workers)
+    elapsed = time.perf_counter() - start
+    assert counts.get(previews.READY) == count, counts
+    print(f"{label:<24}: {count / elapsed:8.1f} files/s  ({elapsed:6.1f} s)")
+
+
+async def run(args):
+    await database.connect()
+    try:
+        records = store(args.files)
+        await db.files.insert_many(records)
+        types = sorted({record["content_type"] for record in records})
+        print(f"{args.files} uploads ({', '.join(types)}), {os.cpu_count()} CPUs")
+        for workers in args.workers:
+            await backfill(workers, args.files, f"{workers} worker(s)")
+
+        draft = JpegImagePlugin.JpegImageFile.draft
+        JpegImagePlugin.JpegImageFile.draft = lambda self, mode, size: None
+        try:
+            await backfill(1, args.files, "1 worker, full decode")
+        finally:
+            JpegImagePlugin.JpegImageFile.draft = draft
+    finally:
+        database.close()
+        shutil.rmtree(config.UPLOAD_DIR, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--workers", type=lambda value: [int(item) for item in value.split(",")], default=[1, 2, 4])
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: rendering a 10k-row admin master list.
+
+Run from the backend directory:
+
+    python benchmarks/bench_responses.py [--rows 10000]
+
+Compares FastAPI's default path for a handler returning plain dicts
+(``jsonable_encoder`` + stdlib ``json`` via ``JSONResponse``) with the
+passthrough path used by the list endpoints (``ORJSONResponse`` directly).
+"""
+import argparse
+import os
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "benchmark")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from codec import document_response, to_document  # noqa: E402
+from models import RecordRequest, RequestType  # noqa: E402
+
+
+def make_rows(count: int):
+    rows = []
+    types = list(RequestType)
+    for i in range(count):
+        doc = to_document(RecordRequest(
+            user_id=str(uuid.uuid4()),
+            title=f"Records request #{i}",
+            description="Copy of the incident report and any supplemental narratives. " * 3,
+            request_type=types[i % len(types)],
+            assigned_staff_id=str(uuid.uuid4()) if i % 3 else None,
+        ))
+        doc.update({
+            "requester_name": "Jane Citizen",
+            "requester_email": "jane@example.org",
+            "assigned_staff_name": "Officer Smith" if i % 3 else None,
+            "assigned_staff_email": "smith@police.gov" if i % 3 else None,
+            "file_count": i % 4,
+            "message_count": i % 7,
+        })
+        rows.append(doc)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+
+    def default_path():
+        return JSONResponse(content=jsonable_encoder(rows)).body
+
+    def fast_path():
+        return document_response(rows).body
+
+    assert len(default_path()) > 0 and len(fast_path()) > 0
+
+    old = min(timeit.repeat(default_path, number=1, repeat=args.repeat))
+    new = min(timeit.repeat(fast_path, number=1, repeat=args.repeat))
+    print(f"{args.rows} rows, best of {args.repeat}")
+    print(f"jsonable_encoder + json : {old * 1000:8.1f} ms")
+    print(f"orjson passthrough      : {new * 1000:8.1f} ms")
+    print(f"speedup                 : {old / new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
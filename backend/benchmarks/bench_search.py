@@ -0,0 +1,95 @@
+"""Benchmark: search latency on a large dataset.
+
+Needs a real MongoDB (mongomock has no ``$text``).  Run from the backend
+directory against a scratch database:
+
+    MONGO_URL=mongodb://localhost:27017 DB_NAME=records_search_bench \\
+        python benchmarks/bench_search.py --seed
+
+``--seed`` drops and reloads the database with 100k requests and ~1M
+messages (see ``cli.py seed``) and builds the indexes.  The script then
+runs a fixed query mix as an admin and as a staff member and reports
+p50/p95 per query against the target.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+import database  # noqa: E402
+import seeding  # noqa: E402
+from search import search_requests  # noqa: E402
+
+# Common words, rare words, names, phrases that hit many messages, and filters
+QUERIES = [
+    ("footage", {}),
+    ("case 4521", {}),
+    ("Garcia", {}),
+    ("following up", {}),
+    ("incident report", {"status": "completed"}),
+    ("records", {"request_type": "body_cam_footage"}),
+    ("nonexistentword", {}),
+]
+
+
+async def run(args):
+    await database.connect()
+    try:
+        if args.seed:
+            spec = seeding.SeedSpec(
+                users=20_000,
+                staff=50,
+                admins=3,
+                requests=args.requests,
+                messages_per_request=args.messages_per_request,
+                notifications_per_request=1,
+            )
+            start = time.perf_counter()
+            result = await seeding.seed_database(database.db, spec, drop=True)
+            print(f"Seeded {result.counts} in {time.perf_counter() - start:.0f}s")
+        await database.ensure_indexes()
+
+        staff = await database.db.users.find_one({"role": "staff"}, {"_id": 0, "id": 1})
+        scopes = {"admin": {}, "staff": {"assigned_staff_id": {"$in": [staff["id"], None]}}}
+
+        print(f"\n{'scope':<6} {'query':<34} {'p50 ms':>8} {'p95 ms':>8} {'hits':>7}")
+        worst = 0.0
+        for scope, base in scopes.items():
+            for text, filters in QUERIES:
+                samples = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    page = await search_requests(text, base, **filters)
+                    samples.append(time.perf_counter() - start)
+                cuts = statistics.quantiles(samples, n=20, method="inclusive")
+                p50, p95 = statistics.median(samples) * 1000, cuts[18] * 1000
+                worst = max(worst, p95)
+                label = f"{text} {filters}" if filters else text
+                print(f"{scope:<6} {label[:34]:<34} {p50:>8.1f} {p95:>8.1f} {page['total']:>7}")
+        verdict = "OK" if worst <= args.target_p95_ms else "OVER TARGET"
+        print(f"\nworst p95 {worst:.1f} ms, target {args.target_p95_ms:.0f} ms: {verdict}")
+    finally:
+        database.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", action="store_true", help="drop and reseed the database first")
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--messages-per-request", type=float, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--target-p95-ms", type=float, default=250)
+    args = parser.parse_args()
+    if (os.environ.get("MONGO_URL") or "").startswith("mongomock://"):
+        raise SystemExit("Search needs a real MongoDB; mongomock does not implement $text")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
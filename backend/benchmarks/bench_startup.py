@@ -0,0 +1,84 @@
+"""Cold-start benchmark for an API worker, based on ``python -X importtime``.
+
+Run from the backend directory:
+
+    python benchmarks/bench_startup.py [--runs 5] [--target-ms 750]
+
+Each run imports ``server`` in a fresh interpreter (what a uvicorn worker does
+before it can serve), reports the best wall-clock import time and the
+slowest top-level imports, and exits non-zero if the best run misses the
+target.  Heavy libraries (pandas, reportlab, aiosmtplib) must not show up
+here; they are imported lazily by the code paths that need them.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Worker cold start we hold ourselves to: interpreter start + import server
+DEFAULT_TARGET_MS = 750
+
+# Modules that must stay out of the startup path
+LAZY_MODULES = ["pandas", "reportlab", "aiosmtplib", "jinja2"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def run_once():
+    env = dict(os.environ)
+    env.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    env.setdefault("DB_NAME", "benchmark")
+    code = "import time; t = time.perf_counter(); import server; print((time.perf_counter() - t) * 1000)"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall_ms = float(result.stdout.strip().splitlines()[-1])
+
+    # Keep the direct imports of ``server`` (one nesting level down) with cumulative time
+    top_level = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, module = int(match.group(2)), match.group(3), match.group(4)
+        imported.add(module.split(".")[0])
+        if len(indent) == 3:
+            top_level[module] = cumulative_us
+    return wall_ms, top_level, imported
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=DEFAULT_TARGET_MS)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    best_ms, top_level, imported = min(runs, key=lambda run: run[0])
+
+    print(f"import server: best {best_ms:.0f} ms over {args.runs} runs (target {args.target_ms:.0f} ms)\n")
+    print("slowest imports (cumulative):")
+    for module, cumulative_us in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    eager = [module for module in LAZY_MODULES if module in imported]
+    if eager:
+        print(f"\nFAIL: imported at startup but should be lazy: {', '.join(eager)}")
+    if best_ms > args.target_ms:
+        print(f"\nFAIL: cold start {best_ms:.0f} ms exceeds target {args.target_ms:.0f} ms")
+    sys.exit(1 if eager or best_ms > args.target_ms else 0)
+
+
+if __name__ == "__main__":
+    main()
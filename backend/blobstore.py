@@ -0,0 +1,121 @@
+"""Content-addressed storage for uploaded files.
+
+An upload is streamed into the storage backend's incoming area while its
+SHA-256 is computed, then published under its hex digest.  Identical
+content uploaded again - the same clip attached to several requests -
+finds the blob already there and the temporary copy is dropped, so each
+distinct file is stored once.
+
+The ``files`` records are the reference counts: a blob is in use while any
+record has it as ``filename``.  ``release`` frees blobs once their last
+record is gone.  The two sides are ordered so that neither can lose a
+blob the other still needs without a lock:
+
+* an upload inserts its record *before* checking whether the blob exists;
+* a release moves the blob aside *before* re-counting its references, and
+  moves it back if a record appeared meanwhile.
+
+Records written before this store keep their uuid filenames; they are
+single-reference blobs and are released the same way.
+
+Where blobs physically live - ``UPLOAD_DIR`` or an S3 bucket - is up to
+``storage.get_storage()``; nothing here depends on which.
+"""
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Iterable, List
+
+from fastapi import UploadFile
+
+from database import db
+from storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class IncomingBlob:
+    # Backend handle of the temporary copy (a path or an object key)
+    ref: str
+    sha256: str
+    size: int
+
+    @property
+    def filename(self) -> str:
+        return self.sha256
+
+
+async def receive(upload: UploadFile) -> IncomingBlob:
+    """Stream ``upload`` into the incoming area, hashing it on the way."""
+    storage = get_storage()
+    writer = await asyncio.to_thread(storage.open_incoming)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while chunk := await upload.read(CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+            await asyncio.to_thread(writer.write, chunk)
+        await asyncio.to_thread(writer.close)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
+    return IncomingBlob(ref=writer.ref, sha256=digest.hexdigest(), size=size)
+
+
+async def publish(blob: IncomingBlob) -> bool:
+    """Move ``blob`` into place; call after its record is inserted.
+
+    Returns True when the content was already stored (a duplicate).
+    """
+    return await asyncio.to_thread(get_storage().publish, blob.ref, blob.filename)
+
+
+async def discard(blob: IncomingBlob):
+    await asyncio.to_thread(get_storage().discard, blob.ref)
+
+
+async def referenced(filenames: List[str]) -> set:
+    """The names among ``filenames`` that some file record refers to."""
+    return set(await db.files.distinct("filename", {"filename": {"$in": filenames}}))
+
+
+async def release(filenames: Iterable[str]) -> int:
+    """Delete the blobs among ``filenames`` that no record refers to any more.
+
+    Background job for deletes; returns the number of blobs removed.
+    """
+    filenames = list(dict.fromkeys(filenames))
+    if not filenames:
+        return 0
+    in_use = await referenced(filenames)
+    candidates = [name for name in filenames if name not in in_use]
+    if not candidates:
+        return 0
+    storage = get_storage()
+
+    def set_aside() -> List[str]:
+        return [name for name in candidates if storage.quarantine(name)]
+
+    moved = await asyncio.to_thread(set_aside)
+    # An upload of the same content may have claimed the blob meanwhile
+    claimed = await referenced(moved) if moved else set()
+
+    def finish() -> int:
+        removed = 0
+        for name in moved:
+            if name in claimed:
+                storage.restore(name)
+            else:
+                storage.delete_quarantined(name)
+                storage.delete_preview(name)
+                removed += 1
+        return removed
+
+    removed = await asyncio.to_thread(finish)
+    logger.info("Released uploaded files", extra={"requested": len(filenames), "removed": removed, "kept": len(filenames) - removed})
+    return removed
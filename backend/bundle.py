@@ -0,0 +1,106 @@
+"""ZIP bundles of a request's files, streamed while they are built.
+
+``zip_stream`` has ``zipfile`` write into a small buffer that is handed
+out after every chunk, so no temporary file is written and memory stays at
+a chunk or two however large the bundle gets.  On an unseekable output
+``zipfile`` puts each entry's sizes and CRC in a data descriptor after its
+data; ZIP64 is forced so entries over 4 GB work too.
+
+Formats that are already compressed (video, audio, photos, archives) are
+stored as they are; everything else - documents, text - is deflated.
+"""
+import logging
+import zipfile
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+STORED_TYPES = (
+    "video/", "audio/", "image/jpeg", "image/png", "image/gif", "image/webp",
+    "application/zip", "application/gzip", "application/x-7z-compressed", "application/x-rar-compressed",
+)
+MISSING_NOTE = "MISSING_FILES.txt"
+
+
+@dataclass
+class BundleEntry:
+    name: str
+    # Opens the content for reading; returns None if it no longer exists
+    open: Callable[[], Optional[BinaryIO]]
+    content_type: str = "application/octet-stream"
+    modified: Optional[datetime] = None
+
+
+class _Output:
+    """Write end for ``zipfile``; has no ``tell``/``seek``, so it streams."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, data) -> int:
+        self.buffer += data
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def _archive_name(name: str, seen: set) -> str:
+    """A flat, unique member name: no directories, so nothing can unpack outside the target."""
+    name = name.replace("/", "_").replace("\\", "_").lstrip(".") or "file"
+    stem, dot, extension = name.rpartition(".")
+    if not dot:
+        stem, extension = name, ""
+    candidate, number = name, 1
+    while candidate.lower() in seen:
+        number += 1
+        candidate = f"{stem} ({number}){dot}{extension}"
+    seen.add(candidate.lower())
+    return candidate
+
+
+def _member(name: str, content_type: str, modified: Optional[datetime]) -> zipfile.ZipInfo:
+    if modified is None:
+        modified = datetime.now(timezone.utc)
+    info = zipfile.ZipInfo(name, date_time=max(modified.timetuple()[:6], (1980, 1, 1, 0, 0, 0)))
+    info.external_attr = 0o644 << 16
+    info.compress_type = zipfile.ZIP_STORED if content_type.startswith(STORED_TYPES) else zipfile.ZIP_DEFLATED
+    return info
+
+
+def zip_stream(entries: Iterable[BundleEntry]) -> Iterator[bytes]:
+    """The ZIP archive of ``entries``, in chunks.
+
+    Blocking (file and network reads); ``StreamingResponse`` runs a plain
+    iterator like this one in its thread pool.  Entries whose content has
+    gone are left out and listed in ``MISSING_FILES.txt``.
+    """
+    output = _Output()
+    seen = set()
+    missing = []
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for entry in entries:
+            source = entry.open()
+            if source is None:
+                missing.append(entry.name)
+                continue
+            info = _member(_archive_name(entry.name, seen), entry.content_type, entry.modified)
+            with closing(source), archive.open(info, "w", force_zip64=True) as target:
+                while chunk := source.read(CHUNK_SIZE):
+                    target.write(chunk)
+                    if output.buffer:
+                        yield output.take()
+            yield output.take()
+        if missing:
+            logger.warning("Bundle is missing files", extra={"missing": len(missing)})
+            archive.writestr(_member(_archive_name(MISSING_NOTE, seen), "text/plain", None), "".join(f"{name}\n" for name in missing))
+    yield output.take()
@@ -0,0 +1,100 @@
+"""Deleting requests and users together with everything that hangs off them.
+
+A request owns its file records and messages; a user owns their requests,
+their notifications and (as staff) their assignments.  Each cascade is a
+fixed number of set-based queries - one ``$in`` per dependent collection -
+however many requests are involved, so deleting a requester with
+thousands of requests costs the same handful of round trips as deleting
+one.
+
+With ``CASCADE_TRANSACTIONS`` enabled (needs a replica set) the queries run
+in one transaction, so a failure part way leaves nothing half-deleted.
+Uploaded files are never removed inside the cascade: the caller hands
+``CascadeReport.filenames`` to ``blobstore.release`` on the background job
+queue once the database side has succeeded, which keeps any blob another
+request's file record still shares.
+"""
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import List
+
+import config
+from database import db
+from denormalize import staff_fields
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CascadeReport:
+    users: int = 0
+    requests: int = 0
+    files: int = 0
+    file_bytes: int = 0
+    messages: int = 0
+    notifications: int = 0
+    unassigned: int = 0
+    # Blobs the deleted records referred to; not part of the summary
+    filenames: List[str] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        summary = asdict(self)
+        summary.pop("filenames")
+        return summary
+
+
+async def _run(work):
+    if not config.CASCADE_TRANSACTIONS:
+        return await work(None)
+    async with await db.client.start_session() as session:
+        return await session.with_transaction(work)
+
+
+async def _delete_requests(query: dict, report: CascadeReport, session):
+    request_ids = [
+        request["id"]
+        for request in await db.requests.find(query, {"_id": 0, "id": 1}, session=session).to_list(None)
+    ]
+    if not request_ids:
+        return
+    by_request = {"request_id": {"$in": request_ids}}
+    files = await db.files.find(by_request, {"_id": 0, "filename": 1, "file_size": 1}, session=session).to_list(None)
+    report.filenames.extend(record["filename"] for record in files)
+    report.file_bytes += sum(record.get("file_size", 0) for record in files)
+    report.files += (await db.files.delete_many(by_request, session=session)).deleted_count
+    report.messages += (await db.messages.delete_many(by_request, session=session)).deleted_count
+    report.requests += (await db.requests.delete_many({"id": {"$in": request_ids}}, session=session)).deleted_count
+
+
+async def delete_requests(query: dict) -> CascadeReport:
+    """Delete the requests matching ``query`` with their file records and messages."""
+
+    async def work(session):
+        report = CascadeReport()
+        await _delete_requests(query, report, session)
+        return report
+
+    report = await _run(work)
+    logger.info("Deleted requests", extra=report.summary())
+    return report
+
+
+async def delete_user(user_id: str) -> CascadeReport:
+    """Delete a user with their requests (as ``delete_requests``) and
+    notifications, and unassign the requests they were working on."""
+
+    async def work(session):
+        report = CascadeReport()
+        await _delete_requests({"user_id": user_id}, report, session)
+        report.notifications = (await db.notifications.delete_many({"user_id": user_id}, session=session)).deleted_count
+        report.unassigned = (await db.requests.update_many(
+            {"assigned_staff_id": user_id},
+            {"$set": {"assigned_staff_id": None, **staff_fields(None)}, "$inc": {"version": 1}},
+            session=session,
+        )).modified_count
+        report.users = (await db.users.delete_one({"id": user_id}, session=session)).deleted_count
+        return report
+
+    report = await _run(work)
+    logger.info("Deleted user", extra={"user_id": user_id, **report.summary()})
+    return report
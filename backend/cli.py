@@ -0,0 +1,203 @@
+"""Maintenance commands, run from the backend directory.
+
+    python cli.py seed --requests 100000 --messages-per-request 10 --drop
+    python cli.py repair-denormalized
+    python cli.py reconcile-storage --dry-run
+    python cli.py migrate-uploads
+
+Commands use the same MONGO_URL/DB_NAME settings as the API.
+"""
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+import typer
+
+import config
+import database
+import denormalize
+import previews
+import seeding
+from reconcile import storage_reconciler
+from storage import LocalStorage, get_storage
+
+app = typer.Typer(help=__doc__, no_args_is_help=True)
+
+
+@app.callback()
+def main():
+    """Records Request maintenance commands."""
+
+
+def _weights(text: Optional[str], default: dict) -> dict:
+    return seeding.parse_weights(text) if text else dict(default)
+
+
+@app.command()
+def seed(
+    users: int = typer.Option(1000, help="Citizen accounts"),
+    staff: int = typer.Option(25, help="Staff accounts"),
+    admins: int = typer.Option(3, help="Admin accounts"),
+    requests: int = typer.Option(10_000, help="Records requests"),
+    messages_per_request: float = typer.Option(3.0, help="Mean messages per request"),
+    files_per_request: float = typer.Option(1.0, help="Mean file records per request"),
+    notifications_per_request: float = typer.Option(1.0, help="Mean notifications per request"),
+    statuses: Optional[str] = typer.Option(None, help="Status weights, e.g. pending=15,completed=40"),
+    types: Optional[str] = typer.Option(None, help="Request type weights, e.g. body_cam_footage=50,other=5"),
+    priorities: Optional[str] = typer.Option(None, help="Priority weights, e.g. low=20,urgent=10"),
+    staff_skew: float = typer.Option(1.0, help="Zipf exponent for assignments (0 = evenly spread)"),
+    requester_skew: float = typer.Option(0.5, help="Zipf exponent for requests per citizen"),
+    days: int = typer.Option(365, help="Spread creation dates over this many days"),
+    until: Optional[datetime] = typer.Option(None, help="Newest creation date (default: today, UTC)"),
+    random_seed: int = typer.Option(42, "--seed", help="Same seed and --until give the same dataset"),
+    batch_size: int = typer.Option(5000, help="Documents per insert_many"),
+    drop: bool = typer.Option(False, help="Drop the seeded collections first (indexes are rebuilt afterwards)"),
+):
+    """Bulk-insert a synthetic dataset for benchmarks and load tests."""
+    if until is not None and until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    spec = seeding.SeedSpec(
+        users=users,
+        staff=staff,
+        admins=admins,
+        requests=requests,
+        messages_per_request=messages_per_request,
+        files_per_request=files_per_request,
+        notifications_per_request=notifications_per_request,
+        status_weights=_weights(statuses, seeding.DEFAULT_STATUS_WEIGHTS),
+        type_weights=_weights(types, seeding.DEFAULT_TYPE_WEIGHTS),
+        priority_weights=_weights(priorities, seeding.DEFAULT_PRIORITY_WEIGHTS),
+        staff_skew=staff_skew,
+        requester_skew=requester_skew,
+        days=days,
+        until=until,
+        seed=random_seed,
+        batch_size=batch_size,
+    )
+
+    async def run():
+        await database.connect()
+        try:
+            start = time.perf_counter()
+            # Loading into dropped collections is faster without indexes to maintain
+            result = await seeding.seed_database(database.db, spec, drop=drop)
+            elapsed = time.perf_counter() - start
+            await database.ensure_indexes()
+        finally:
+            database.close()
+        for name, count in result.counts.items():
+            typer.echo(f"{name:<14} {count:>10,}")
+        typer.echo(f"Seeded in {elapsed:.1f}s; password for every account: {seeding.SEED_PASSWORD}")
+
+    try:
+        asyncio.run(run())
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+
+
+@app.command()
+def repair_denormalized(
+    batch_size: int = typer.Option(1000, help="Requests per batch"),
+):
+    """Recompute requester/staff names and file/message counters on every request."""
+
+    async def run():
+        await database.connect()
+        try:
+            return await denormalize.repair(batch_size=batch_size)
+        finally:
+            database.close()
+
+    result = asyncio.run(run())
+    typer.echo(f"Checked {result['checked']:,} requests, repaired {result['repaired']:,}")
+
+
+@app.command()
+def reconcile_storage(
+    dry_run: bool = typer.Option(False, help="Only report; don't quarantine or restore anything"),
+):
+    """Find uploads without a file record (quarantined) and records without an upload (reported)."""
+
+    async def run():
+        await database.connect()
+        try:
+            return await storage_reconciler.run(dry_run=dry_run)
+        finally:
+            database.close()
+
+    report = asyncio.run(run())
+    if report is None:
+        typer.echo("Another process is reconciling storage; try again later")
+        raise typer.Exit(code=1)
+    for key, value in report.as_dict().items():
+        if key not in ("slices", "dangling_sample", "started_at", "finished_at"):
+            typer.echo(f"{key:<14} {value}")
+    for record in report.dangling_sample:
+        typer.echo(f"dangling: file {record['id']} of request {record['request_id']} -> {record['filename']}")
+
+
+@app.command()
+def migrate_uploads(
+    batch_size: int = typer.Option(1000, help="Files moved per batch"),
+    pause: float = typer.Option(0.0, help="Seconds to wait between batches, to go easy on a live disk"),
+):
+    """Move uploads from the flat UPLOAD_DIR into the fan-out layout.
+
+    Safe to run while the API is serving and to interrupt; run it again to carry on.
+    """
+
+    storage = get_storage()
+    if not isinstance(storage, LocalStorage):
+        typer.echo("Only local storage has a flat layout to migrate", err=True)
+        raise typer.Exit(code=1)
+
+    def remaining() -> int:
+        with os.scandir(config.UPLOAD_DIR) as entries:
+            return sum(1 for entry in entries if not entry.name.startswith(".") and entry.is_file())
+
+    async def run():
+        total = remaining()
+        moved = 0
+        start = time.perf_counter()
+        # Safe while the API is serving: locate() checks both layouts
+        while count := await asyncio.to_thread(storage.migrate_flat_batch, batch_size):
+            moved += count
+            rate = moved / max(time.perf_counter() - start, 1e-9)
+            typer.echo(f"{moved:>10,} / {total:,} moved ({rate:,.0f} files/s)")
+            if pause:
+                await asyncio.sleep(pause)
+        typer.echo(f"Done: {moved:,} files moved")
+
+    asyncio.run(run())
+
+
+@app.command()
+def generate_previews(
+    workers: int = typer.Option(4, help="Previews rendered at the same time"),
+):
+    """Render the missing thumbnails and PDF previews of existing uploads."""
+    if not previews.pdf_supported():
+        typer.echo("PyMuPDF is not installed (requirements-pdf-previews.txt); PDFs are skipped", err=True)
+    start = time.perf_counter()
+
+    def report(counts):
+        done = sum(counts.values())
+        typer.echo(f"{done:>10,} files ({done / max(time.perf_counter() - start, 1e-9):,.1f} files/s)")
+
+    async def run():
+        await database.connect()
+        try:
+            return await previews.backfill(workers=workers, progress=report)
+        finally:
+            database.close()
+
+    counts = asyncio.run(run())
+    if counts:
+        report(counts)
+    typer.echo(", ".join(f"{state}: {count:,}" for state, count in sorted(counts.items())) or "Nothing to do")
+
+
+if __name__ == "__main__":
+    app()
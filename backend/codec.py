@@ -0,0 +1,88 @@
+"""Document codec: pydantic model -> Mongo document -> JSON response.
+
+Every document we write is produced by ``to_document`` from a pydantic model,
+so what Mongo hands back is already JSON-shaped (ISO-8601 strings, enum
+values, plain lists).  Read paths therefore don't need to rebuild models just
+to have FastAPI serialize them again: they fetch with a projection limited to
+the model's fields and hand the raw documents straight to the response.
+Documents written before a field existed get the model's default for it
+(``with_defaults``), as validation would have filled it in.
+"""
+import copy
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_projections: Dict[type, Dict[str, int]] = {}
+_defaults: Dict[type, Dict[str, Any]] = {}
+
+
+def to_document(model: BaseModel) -> Dict[str, Any]:
+    """Serialize a model into a Mongo-ready document in a single pass."""
+    return model.model_dump(mode="json")
+
+
+def from_document(model_cls: Type[ModelT], document: Dict[str, Any]) -> ModelT:
+    """Validate a stored document back into a model (``_id`` is ignored)."""
+    return model_cls.model_validate(document)
+
+
+def projection_for(model_cls: Type[BaseModel]) -> Dict[str, int]:
+    """Mongo projection returning exactly the fields declared on ``model_cls``.
+
+    Excluding ``_id`` and anything the model doesn't declare (e.g.
+    ``hashed_password`` on users) keeps passthrough responses identical to
+    what ``response_model`` filtering used to produce.
+    """
+    projection = _projections.get(model_cls)
+    if projection is None:
+        projection = {"_id": 0}
+        projection.update({name: 1 for name in model_cls.model_fields})
+        _projections[model_cls] = projection
+    return projection
+
+
+def defaults_for(model_cls: Type[BaseModel]) -> Dict[str, Any]:
+    """JSON-shaped defaults of the fields on ``model_cls`` that have a fixed one.
+
+    Fields with a ``default_factory`` (ids, timestamps) are left out: a
+    document missing those is not something a default can repair.
+    """
+    defaults = _defaults.get(model_cls)
+    if defaults is None:
+        defaults = {
+            name: to_jsonable_python(field.default)
+            for name, field in model_cls.model_fields.items()
+            if not field.is_required() and field.default_factory is None
+        }
+        _defaults[model_cls] = defaults
+    return defaults
+
+
+def with_defaults(model_cls: Type[BaseModel], content: Any) -> Any:
+    """Fill in model defaults missing from a stored document, or a list of them, in place."""
+    defaults = defaults_for(model_cls)
+    for document in content if isinstance(content, list) else [content]:
+        for name, value in defaults.items():
+            if name not in document:
+                # Lists and dicts are copied so no two documents share one
+                document[name] = copy.copy(value) if isinstance(value, (list, dict)) else value
+    return content
+
+
+def document_response(content: Any, status_code: int = 200, model: Optional[Type[BaseModel]] = None) -> ORJSONResponse:
+    """Return stored document(s) as-is, bypassing ``response_model`` validation.
+
+    Returning a response object also skips FastAPI's ``jsonable_encoder``
+    pass, so the documents go straight to orjson.  Only use this for
+    trusted documents fetched with ``projection_for`` (or an equivalent
+    projection that drops ``_id`` and private fields).  Pass ``model`` to
+    fill in its defaults for fields older documents lack.
+    """
+    if model is not None:
+        with_defaults(model, content)
+    return ORJSONResponse(content=content, status_code=status_code)
@@ -0,0 +1,117 @@
+"""Application settings, read once from the environment (and backend/.env)."""
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# Uploads directory (created on startup)
+UPLOAD_DIR = ROOT_DIR / "uploads"
+
+# Where upload blobs live (storage.py): "local" (UPLOAD_DIR) or "s3"
+STORAGE_BACKEND = os.environ.get("STORAGE_BACKEND", "local").lower()
+S3_BUCKET = os.environ.get("S3_BUCKET", "")
+S3_PREFIX = os.environ.get("S3_PREFIX", "")  # e.g. "records/" to share a bucket
+# MinIO or another S3-compatible service; "moto://" runs an in-process stand-in
+S3_ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL", "")
+S3_REGION = os.environ.get("S3_REGION", "")
+# Uploads go up in parts of this size (S3's minimum is 5 MB)
+S3_PART_SIZE_MB = max(5, int(os.environ.get("S3_PART_SIZE_MB", "8")))
+# Lifetime of presigned download URLs
+S3_PRESIGN_SECONDS = int(os.environ.get("S3_PRESIGN_SECONDS", "300"))
+# Local downloads: after the permission check, let the reverse proxy send the file.
+# "nginx" (X-Accel-Redirect), "sendfile" (X-Sendfile: Apache, lighttpd) or "" to stream from the worker
+DOWNLOAD_OFFLOAD = os.environ.get("DOWNLOAD_OFFLOAD", "").lower()
+# nginx internal location that aliases UPLOAD_DIR
+DOWNLOAD_OFFLOAD_PREFIX = os.environ.get("DOWNLOAD_OFFLOAD_PREFIX", "/protected-uploads/")
+# Lifetime of the signed links the browser opens to stream a request's ZIP bundle
+BUNDLE_LINK_SECONDS = int(os.environ.get("BUNDLE_LINK_SECONDS", "60"))
+
+# MongoDB connection
+MONGO_URL = os.environ.get("MONGO_URL")
+DB_NAME = os.environ.get("DB_NAME")
+
+# Motor connection pool; unset values keep the driver defaults
+MONGO_MAX_POOL_SIZE = os.environ.get("MONGO_MAX_POOL_SIZE")
+MONGO_MIN_POOL_SIZE = os.environ.get("MONGO_MIN_POOL_SIZE")
+MONGO_MAX_IDLE_TIME_MS = os.environ.get("MONGO_MAX_IDLE_TIME_MS")
+MONGO_WAIT_QUEUE_TIMEOUT_MS = os.environ.get("MONGO_WAIT_QUEUE_TIMEOUT_MS")
+MONGO_COMPRESSORS = os.environ.get("MONGO_COMPRESSORS", "")  # e.g. "zstd,snappy,zlib"
+# Read preference for ordinary reads; writes and auth lookups always go to the primary
+MONGO_READ_PREFERENCE = os.environ.get("MONGO_READ_PREFERENCE", "primary")
+# Analytics and bulk exports can tolerate replication lag, e.g. "secondaryPreferred"
+MONGO_ANALYTICS_READ_PREFERENCE = os.environ.get("MONGO_ANALYTICS_READ_PREFERENCE", "primary")
+
+# JWT and Password settings
+SECRET_KEY = os.environ.get("JWT_SECRET_KEY", "your-super-secret-jwt-key-change-in-production")
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 480  # 8 hours for better user experience
+
+# Email settings
+SMTP_SERVER = os.environ.get("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(os.environ.get("SMTP_PORT", "587"))
+SMTP_USERNAME = os.environ.get("SMTP_USERNAME", "")
+SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD", "")
+FROM_EMAIL = os.environ.get("FROM_EMAIL", "noreply@police.gov")
+
+# Background workers
+EMAIL_QUEUE_SIZE = int(os.environ.get("EMAIL_QUEUE_SIZE", "1000"))
+BACKGROUND_QUEUE_SIZE = int(os.environ.get("BACKGROUND_QUEUE_SIZE", "1000"))
+SHUTDOWN_DRAIN_SECONDS = float(os.environ.get("SHUTDOWN_DRAIN_SECONDS", "10"))
+# Thumbnails and PDF previews (previews.py), rendered in worker threads
+PREVIEW_WORKERS = int(os.environ.get("PREVIEW_WORKERS", "2"))
+PREVIEW_QUEUE_SIZE = int(os.environ.get("PREVIEW_QUEUE_SIZE", "1000"))
+PREVIEW_SIZE = int(os.environ.get("PREVIEW_SIZE", "320"))  # longest side, in pixels
+PREVIEW_MAX_MB = int(os.environ.get("PREVIEW_MAX_MB", "100"))  # larger uploads get no preview
+# Run cascade deletes (cascade.py) in a transaction; needs a replica set or sharded cluster
+CASCADE_TRANSACTIONS = os.environ.get("CASCADE_TRANSACTIONS", "false").lower() == "true"
+CLEANUP_INTERVAL_SECONDS = int(os.environ.get("CLEANUP_INTERVAL_SECONDS", "3600"))
+# Upload/record reconciliation (reconcile.py): one slice of 16 per interval, 0 disables the schedule
+RECONCILE_INTERVAL_SECONDS = int(os.environ.get("RECONCILE_INTERVAL_SECONDS", "600"))
+# Orphans younger than this may be uploads whose record isn't inserted yet
+RECONCILE_GRACE_SECONDS = int(os.environ.get("RECONCILE_GRACE_SECONDS", "3600"))
+RECONCILE_QUARANTINE_DAYS = int(os.environ.get("RECONCILE_QUARANTINE_DAYS", "7"))
+# One process reconciles at a time; a crashed one holds the others off at most this long
+RECONCILE_LEASE_SECONDS = int(os.environ.get("RECONCILE_LEASE_SECONDS", "900"))
+# Directory names sorted in memory at once; larger listings spill to temporary files
+RECONCILE_RUN_SIZE = int(os.environ.get("RECONCILE_RUN_SIZE", "100000"))
+# Read notifications older than this are purged by the cleanup worker (0 keeps them forever)
+NOTIFICATION_RETENTION_DAYS = int(os.environ.get("NOTIFICATION_RETENTION_DAYS", "0"))
+
+# Automatic assignment: give new requests to the least-loaded staff member on creation
+AUTO_ASSIGN_ON_CREATE = os.environ.get("AUTO_ASSIGN_ON_CREATE", "false").lower() == "true"
+# Resync the in-memory assignment queue with the database this often
+AUTO_ASSIGN_REBUILD_SECONDS = int(os.environ.get("AUTO_ASSIGN_REBUILD_SECONDS", "300"))
+
+# Search: matches considered per source (requests, messages, requesters) before ranking
+SEARCH_MAX_CANDIDATES = int(os.environ.get("SEARCH_MAX_CANDIDATES", "1000"))
+
+# Admin browse endpoint: seconds a filtered page and its facet counts are reused (0 disables)
+BROWSE_CACHE_TTL_SECONDS = float(os.environ.get("BROWSE_CACHE_TTL_SECONDS", "30"))
+
+CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
+
+# Prometheus metrics on /metrics; off unless asked for, since they expose routes and driver internals
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "false").lower() == "true"
+# When set, /metrics answers only "Authorization: Bearer <token>" (Prometheus' bearer_token setting)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# Query profiler: flag requests that issue too many Mongo commands or run too long
+QUERY_PROFILER_ENABLED = os.environ.get("QUERY_PROFILER_ENABLED", "true").lower() == "true"
+SLOW_REQUEST_MS = float(os.environ.get("SLOW_REQUEST_MS", "1000"))
+MAX_DB_COMMANDS_PER_REQUEST = int(os.environ.get("MAX_DB_COMMANDS_PER_REQUEST", "25"))
+# The same command shape repeated this often in one request is reported as a likely N+1 loop
+N_PLUS_ONE_THRESHOLD = int(os.environ.get("N_PLUS_ONE_THRESHOLD", "10"))
+# At most one warning per route in this window, so a hot N+1 route can't flood the logs
+QUERY_PROFILER_WARN_INTERVAL_SECONDS = float(os.environ.get("QUERY_PROFILER_WARN_INTERVAL_SECONDS", "60"))
+
+# Logging: "json" (one object per line) or "text"
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "json")
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+# Keep only a fraction of below-WARNING logs for high-volume routes, e.g. "/api/notifications=0.1"
+LOG_SAMPLE_RATES = {
+    route.strip(): float(rate)
+    for route, _, rate in (item.partition("=") for item in os.environ.get("LOG_SAMPLE_RATES", "").split(",") if item)
+}
@@ -0,0 +1,137 @@
+"""MongoDB connection lifecycle.
+
+No client is created at import time.  The app lifespan calls ``connect()``
+once per worker and ``close()`` on shutdown; route modules import ``db``
+and use it as before (``db.requests.find_one(...)``) - it forwards to the
+connected database.
+
+``analytics_db`` is the same database with ``MONGO_ANALYTICS_READ_PREFERENCE``
+applied, for dashboards and bulk exports that can read from secondaries.
+``primary_db`` always reads from the primary, whatever
+``MONGO_READ_PREFERENCE`` says; authentication uses it so a login or token
+check never sees a lagging copy of the user.  Writes go to the primary on
+any of them.
+"""
+import logging
+from typing import Optional
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ReadPreference
+from pymongo.read_preferences import make_read_preference, read_pref_mode_from_name
+
+import config
+from monitoring import command_metrics, pool_metrics
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[AsyncIOMotorClient] = None
+_database: Optional[AsyncIOMotorDatabase] = None
+_analytics_database: Optional[AsyncIOMotorDatabase] = None
+_primary_database: Optional[AsyncIOMotorDatabase] = None
+
+
+class _DatabaseProxy:
+    """Stand-in for a Motor database until ``connect()`` has run."""
+
+    def __init__(self, attribute: str):
+        self._attribute = attribute
+
+    def _target(self):
+        database = globals()[self._attribute]
+        if database is None:
+            raise RuntimeError("MongoDB is not connected; the application lifespan has not started")
+        return database
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    def __getitem__(self, name):
+        return self._target()[name]
+
+
+db = _DatabaseProxy("_database")
+analytics_db = _DatabaseProxy("_analytics_database")
+primary_db = _DatabaseProxy("_primary_database")
+
+# (collection, keys[, options]) created on startup; create_index is a no-op when the index exists.
+# A collection has at most one text index; changing its fields means dropping it first.
+INDEXES = [
+    ("users", [("id", 1)]),
+    ("users", [("email", 1)]),
+    ("users", [("role", 1)]),
+    ("requests", [("id", 1)]),
+    ("requests", [("user_id", 1)]),
+    ("requests", [("assigned_staff_id", 1), ("status", 1)]),
+    ("requests", [("created_at", 1)]),
+    ("files", [("id", 1)]),
+    ("files", [("request_id", 1)]),
+    ("files", [("filename", 1)]),
+    ("messages", [("request_id", 1), ("created_at", 1)]),
+    ("notifications", [("user_id", 1), ("created_at", -1)]),
+    ("email_templates", [("type", 1)]),
+    # Full-text search (see search.py)
+    ("requests", [("title", "text"), ("description", "text")], {"name": "requests_text", "weights": {"title": 10, "description": 2}}),
+    ("messages", [("content", "text")], {"name": "messages_text"}),
+    ("users", [("full_name", "text"), ("email", "text")], {"name": "users_text", "weights": {"full_name": 5, "email": 3}}),
+]
+
+
+def client_options() -> dict:
+    """Driver options from the environment; unset settings keep pymongo defaults."""
+    options = {
+        "readPreference": config.MONGO_READ_PREFERENCE,
+        "event_listeners": [pool_metrics, command_metrics],
+    }
+    if config.MONGO_MAX_POOL_SIZE:
+        options["maxPoolSize"] = int(config.MONGO_MAX_POOL_SIZE)
+    if config.MONGO_MIN_POOL_SIZE:
+        options["minPoolSize"] = int(config.MONGO_MIN_POOL_SIZE)
+    if config.MONGO_MAX_IDLE_TIME_MS:
+        options["maxIdleTimeMS"] = int(config.MONGO_MAX_IDLE_TIME_MS)
+    if config.MONGO_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = int(config.MONGO_WAIT_QUEUE_TIMEOUT_MS)
+    if config.MONGO_COMPRESSORS:
+        options["compressors"] = config.MONGO_COMPRESSORS
+    return options
+
+
+def _create_client():
+    if config.MONGO_URL.startswith("mongomock://"):
+        # In-process stand-in for load tests and local experiments (dev dependency)
+        from mongomock_motor import AsyncMongoMockClient
+
+        logger.warning("Using in-process mongomock database; data is not persisted")
+        return AsyncMongoMockClient()
+    return AsyncIOMotorClient(config.MONGO_URL, **client_options())
+
+
+async def connect():
+    """Open the connection pool and make sure the server is reachable."""
+    global _client, _database, _analytics_database, _primary_database
+    if not config.MONGO_URL or not config.DB_NAME:
+        raise RuntimeError("MONGO_URL and DB_NAME must be set")
+    _client = _create_client()
+    _database = _client[config.DB_NAME]
+    _analytics_database = _client.get_database(
+        config.DB_NAME,
+        read_preference=make_read_preference(read_pref_mode_from_name(config.MONGO_ANALYTICS_READ_PREFERENCE), None),
+    )
+    _primary_database = _client.get_database(config.DB_NAME, read_preference=ReadPreference.PRIMARY)
+    # Establish the first pooled connection now rather than on the first request
+    await _client.admin.command("ping")
+    logger.info("Connected to MongoDB database %s", config.DB_NAME)
+
+
+async def ensure_indexes():
+    for collection, keys, *options in INDEXES:
+        await _database[collection].create_index(keys, **(options[0] if options else {}))
+
+
+def close():
+    global _client, _database, _analytics_database, _primary_database
+    if _client is not None:
+        _client.close()
+    _client = None
+    _database = None
+    _analytics_database = None
+    _primary_database = None
@@ -0,0 +1,152 @@
+"""Denormalized fields on request documents.
+
+List and export endpoints read everything they show from the request
+document itself instead of joining back to ``users``, ``files`` and
+``messages`` per row:
+
+* ``requester_name`` / ``requester_email`` - set on creation;
+* ``assigned_staff_name`` / ``assigned_staff_email`` - set on assignment;
+* ``file_count`` - ``$inc`` on upload;
+* ``message_count`` / ``last_message_at`` - ``$inc`` / ``$set`` on each message.
+
+A user's name or email change is copied into their requests by
+``propagate_user`` on the background job queue.  ``repair`` recomputes
+every field from the source collections and can be run by hand
+(``python cli.py repair-denormalized``) after any drift.  ``backfill``
+repairs the documents written before these fields existed; every worker
+calls it at startup, but a lease lets one process run it, once per
+database.
+"""
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from pymongo import UpdateOne
+
+import leases
+from database import db
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_LEASE = "denormalize-backfill"
+# A process that dies mid-backfill holds the others off this long
+BACKFILL_LEASE_SECONDS = 3600
+
+DENORMALIZED_FIELDS = [
+    "requester_name",
+    "requester_email",
+    "assigned_staff_name",
+    "assigned_staff_email",
+    "file_count",
+    "message_count",
+    "last_message_at",
+]
+
+
+def requester_fields(user: Optional[dict]) -> dict:
+    return {
+        "requester_name": user.get("full_name") if user else None,
+        "requester_email": user.get("email") if user else None,
+    }
+
+
+def staff_fields(staff: Optional[dict]) -> dict:
+    return {
+        "assigned_staff_name": staff.get("full_name") if staff else None,
+        "assigned_staff_email": staff.get("email") if staff else None,
+    }
+
+
+async def propagate_user(user_id: str):
+    """Copy a user's current name and email into every request that shows them."""
+    user = await db.users.find_one({"id": user_id}, {"_id": 0, "full_name": 1, "email": 1})
+    if user is None:
+        return
+    requested = await db.requests.update_many({"user_id": user_id}, {"$set": requester_fields(user)})
+    assigned = await db.requests.update_many({"assigned_staff_id": user_id}, {"$set": staff_fields(user)})
+    logger.info(
+        "Propagated user details to requests",
+        extra={"user_id": user_id, "requested": requested.modified_count, "assigned": assigned.modified_count},
+    )
+
+
+async def repair(query: Optional[dict] = None, batch_size: int = 1000) -> dict:
+    """Recompute the denormalized fields of requests matching ``query`` (default: all).
+
+    Works in batches: per batch one aggregation each over files and messages,
+    one ``$in`` query on users and one ``bulk_write`` of the documents that
+    actually differ.
+    """
+    projection = {"_id": 0, "id": 1, "user_id": 1, "assigned_staff_id": 1, **{field: 1 for field in DENORMALIZED_FIELDS}}
+    checked = repaired = 0
+    batch = []
+    async for request in db.requests.find(query or {}, projection):
+        batch.append(request)
+        if len(batch) >= batch_size:
+            repaired += await _repair_batch(batch)
+            checked += len(batch)
+            batch = []
+    if batch:
+        repaired += await _repair_batch(batch)
+        checked += len(batch)
+    if repaired:
+        logger.info("Repaired denormalized request fields", extra={"checked": checked, "repaired": repaired})
+    return {"checked": checked, "repaired": repaired}
+
+
+async def backfill() -> Optional[dict]:
+    """Repair requests that predate the denormalized fields, unless some process already has.
+
+    Returns the repair counts, or None when it was done before or another
+    process is doing it.  Once done, later calls cost one read.
+    """
+    done = await db.leases.find_one({"_id": BACKFILL_LEASE, "completed_at": {"$ne": None}}, {"_id": 1})
+    if done or await leases.acquire(BACKFILL_LEASE, BACKFILL_LEASE_SECONDS) is None:
+        return None
+    try:
+        result = await repair({"file_count": {"$exists": False}})
+    except Exception:
+        await leases.release(BACKFILL_LEASE)
+        raise
+    await leases.release(BACKFILL_LEASE, completed_at=datetime.now(timezone.utc), result=result)
+    return result
+
+
+async def _repair_batch(requests: list) -> int:
+    ids = [request["id"] for request in requests]
+    files = {
+        row["_id"]: row["count"]
+        async for row in db.files.aggregate([
+            {"$match": {"request_id": {"$in": ids}}},
+            {"$group": {"_id": "$request_id", "count": {"$sum": 1}}},
+        ])
+    }
+    messages = {
+        row["_id"]: row
+        async for row in db.messages.aggregate([
+            {"$match": {"request_id": {"$in": ids}}},
+            {"$group": {"_id": "$request_id", "count": {"$sum": 1}, "last": {"$max": "$created_at"}}},
+        ])
+    }
+    user_ids = {request["user_id"] for request in requests} | {request["assigned_staff_id"] for request in requests if request.get("assigned_staff_id")}
+    users = {
+        user["id"]: user
+        for user in await db.users.find({"id": {"$in": list(user_ids)}}, {"_id": 0, "id": 1, "full_name": 1, "email": 1}).to_list(None)
+    }
+
+    updates = []
+    for request in requests:
+        thread = messages.get(request["id"], {})
+        expected = {
+            **requester_fields(users.get(request["user_id"])),
+            **staff_fields(users.get(request.get("assigned_staff_id"))),
+            "file_count": files.get(request["id"], 0),
+            "message_count": thread.get("count", 0),
+            "last_message_at": thread.get("last"),
+        }
+        changed = {field: value for field, value in expected.items() if field not in request or request[field] != value}
+        if changed:
+            updates.append(UpdateOne({"id": request["id"]}, {"$set": changed}))
+    if updates:
+        await db.requests.bulk_write(updates, ordered=False)
+    return len(updates)
@@ -0,0 +1,171 @@
+"""Email delivery and the notification emails sent on request events."""
+import logging
+from email.message import EmailMessage
+from typing import List
+
+from codec import from_document
+from config import SMTP_SERVER, SMTP_PORT, SMTP_USERNAME, SMTP_PASSWORD, FROM_EMAIL
+from database import db
+from models import RecordRequest, User
+
+logger = logging.getLogger(__name__)
+
+# Placeholder addresses (seeded and test accounts) never get notification emails
+FAKE_EMAIL_DOMAINS = ["@example.com", "@test.com", "@testdomain.com", "@fake.com", "@dummy.com"]
+
+def is_deliverable(email: str) -> bool:
+    return bool(email) and "@" in email and "." in email and not any(email.endswith(domain) for domain in FAKE_EMAIL_DOMAINS)
+
+async def send_email(to_email: str, subject: str, content: str, html_content: str = None):
+    """Send email notification"""
+    try:
+        if not SMTP_USERNAME or not SMTP_PASSWORD:
+            logger.info("Email not sent (SMTP not configured)", extra={"to": to_email, "subject": subject})
+            logger.debug("Email content: %s", content)
+            return True  # Skip actual sending in development
+        
+        import aiosmtplib  # Imported on first send to keep worker startup fast
+        
+        message = EmailMessage()
+        message["From"] = FROM_EMAIL
+        message["To"] = to_email
+        message["Subject"] = subject
+        message.set_content(content)
+        
+        if html_content:
+            message.add_alternative(html_content, subtype="html")
+        
+        await aiosmtplib.send(
+            message,
+            hostname=SMTP_SERVER,
+            port=SMTP_PORT,
+            start_tls=True,
+            username=SMTP_USERNAME,
+            password=SMTP_PASSWORD
+        )
+        return True
+    except Exception:
+        logger.exception("Failed to send email", extra={"to": to_email, "subject": subject})
+        return False
+
+async def send_new_request_notification(request: RecordRequest, user: User):
+    """Send notification when new request is created"""
+    subject = f"New Records Request: {request.title}"
+    content = f"""
+    A new records request has been submitted.
+    
+    Request Details:
+    - Title: {request.title}
+    - Type: {request.request_type.replace('_', ' ').title()}
+    - Priority: {request.priority.title()}
+    - Submitted by: {user.full_name}
+    - Submitted at: {request.created_at.strftime('%Y-%m-%d %H:%M')}
+    
+    Please log in to the Police Records Portal to review and assign this request.
+    """
+    
+    # Send to all admins with valid email addresses
+    admin_users = await db.users.find({"role": "admin"}).to_list(None)
+    for admin in admin_users:
+        # Skip fake/example/test email addresses
+        admin_email = admin.get("email", "")
+        if is_deliverable(admin_email):
+            try:
+                await send_email(admin_email, subject, content)
+                logger.info(f"New request notification sent to admin: {admin_email}")
+            except Exception as e:
+                logger.error(f"Failed to send email to admin {admin_email}: {str(e)}")
+        else:
+            logger.warning(f"Skipping notification to admin with invalid/fake email: {admin_email}")
+
+async def send_assignment_notification(request: RecordRequest, staff_user: dict):
+    """Send notification when request is assigned to staff"""
+    subject = f"Request Assigned: {request.title}"
+    content = f"""
+    You have been assigned a new records request.
+    
+    Request Details:
+    - Title: {request.title}
+    - Type: {request.request_type.replace('_', ' ').title()}
+    - Priority: {request.priority.title()}
+    - Request ID: {request.id}
+    
+    Please log in to the Police Records Portal to review and process this request.
+    """
+    
+    staff_email = staff_user.get("email", "")
+    if is_deliverable(staff_email):
+        try:
+            await send_email(staff_email, subject, content)
+            logger.info(f"Assignment notification sent to staff: {staff_email}")
+        except Exception as e:
+            logger.error(f"Failed to send assignment email to {staff_email}: {str(e)}")
+    else:
+        logger.warning(f"Skipping assignment notification to staff with invalid/fake email: {staff_email}")
+
+async def send_assignment_digest(staff_user: dict, requests: List[dict]):
+    """Send one email listing every request just assigned to a staff member"""
+    staff_email = staff_user.get("email", "")
+    if not is_deliverable(staff_email):
+        logger.warning(f"Skipping assignment digest to staff with invalid/fake email: {staff_email}")
+        return
+    
+    lines = "\n".join(
+        f"    - {request['title']} ({request['request_type'].replace('_', ' ').title()}, "
+        f"{request.get('priority', 'medium').title()} priority) - ID {request['id']}"
+        for request in requests
+    )
+    noun = "Request" if len(requests) == 1 else "Requests"
+    subject = f"{len(requests)} Records {noun} Assigned to You"
+    content = f"""
+    You have been assigned {len(requests)} records {noun.lower()}.
+    
+{lines}
+    
+    Please log in to the Police Records Portal to review and process them.
+    """
+    
+    await send_email(staff_email, subject, content)
+    logger.info(f"Assignment digest for {len(requests)} requests sent to staff: {staff_email}")
+
+async def send_status_update_notification(request: RecordRequest, user: dict, old_status: str, new_status: str):
+    """Send notification when request status changes"""
+    subject = f"Request Update: {request.title}"
+    content = f"""
+    Your records request status has been updated.
+    
+    Request Details:
+    - Title: {request.title}
+    - Previous Status: {old_status.replace('_', ' ').title()}
+    - New Status: {new_status.replace('_', ' ').title()}
+    - Request ID: {request.id}
+    
+    Please log in to the Police Records Portal to view the latest updates.
+    """
+    
+    await send_email(user["email"], subject, content)
+
+async def send_status_update_digest(user: dict, changes: List[tuple], new_status: str):
+    """Send one email covering several of a requester's requests changing status at once"""
+    if not is_deliverable(user.get("email", "")):
+        logger.warning(f"Skipping status digest to user with invalid/fake email: {user.get('email', '')}")
+        return
+    if len(changes) == 1:
+        request, old_status = changes[0]
+        await send_status_update_notification(from_document(RecordRequest, request), user, old_status, new_status)
+        return
+    
+    lines = "\n".join(
+        f"    - {request['title']}: {old_status.replace('_', ' ').title()} -> {new_status.replace('_', ' ').title()} (ID {request['id']})"
+        for request, old_status in changes
+    )
+    subject = f"{len(changes)} Records Requests Updated"
+    content = f"""
+    The status of {len(changes)} of your records requests has been updated.
+    
+{lines}
+    
+    Please log in to the Police Records Portal to view the latest updates.
+    """
+    
+    await send_email(user["email"], subject, content)
@@ -0,0 +1,47 @@
+"""Leases: at most one process at a time runs a given job.
+
+Every API worker process runs the same periodic tasks (workers.py).  Jobs
+that must not overlap across processes take a lease first - a document in
+``leases`` naming its holder and when it expires.  A holder that dies
+mid-job just lets it run out; other fields on the document carry state
+from one holder to the next.
+"""
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from database import db
+
+# This process; unique even when pids repeat across containers
+OWNER = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+async def acquire(name: str, seconds: float) -> Optional[dict]:
+    """Take or extend the lease ``name`` for ``seconds``.
+
+    Returns the lease document, or None while another process holds it.
+    """
+    now = datetime.now(timezone.utc)
+    try:
+        return await db.leases.find_one_and_update(
+            {"_id": name, "$or": [{"expires_at": {"$lte": now}}, {"owner": OWNER}]},
+            {"$set": {"owner": OWNER, "expires_at": now + timedelta(seconds=seconds)}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+    except DuplicateKeyError:
+        # The document exists and is held by someone else, so the upsert tried to insert it
+        return None
+
+
+async def release(name: str, **fields):
+    """Give up the lease ``name``, saving ``fields`` on it for the next holder."""
+    await db.leases.update_one(
+        {"_id": name, "owner": OWNER},
+        {"$set": {"expires_at": datetime.now(timezone.utc), **fields}},
+    )
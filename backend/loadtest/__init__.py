@@ -0,0 +1,6 @@
+"""Local load and benchmark harness for the API.
+
+Seeds a database with realistic volumes, replays a weighted mix of
+citizen/staff/admin traffic with concurrent virtual users, and reports
+throughput and p50/p95/p99 latency per route.  See ``run.py`` for usage.
+"""
@@ -0,0 +1,161 @@
+"""Run a mixed-traffic load test and report per-route latency.
+
+From the backend directory, fully in-process (no Mongo or API server needed):
+
+    python -m loadtest.run --mongomock --seed --requests 2000 --duration 30
+
+Against a running API and a local Mongo (seeded through MONGO_URL/DB_NAME;
+use a dedicated database, ``--drop`` empties it first):
+
+    MONGO_URL=mongodb://localhost:27017 DB_NAME=records_loadtest \\
+        python -m loadtest.run --seed --drop --base-url http://localhost:8001
+
+Without ``--base-url`` the app is served in-process through an ASGI
+transport, which measures the API without network or uvicorn overhead.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", help="API server to load (default: serve the app in-process)")
+    parser.add_argument("--mongomock", action="store_true", help="use an in-process mongomock database (implies in-process)")
+    parser.add_argument("--seed", action="store_true", help="seed the database before the run")
+    parser.add_argument("--drop", action="store_true", help="drop seeded collections before seeding")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--staff", type=int, default=25)
+    parser.add_argument("--admins", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--messages-per-request", type=float, default=3)
+    parser.add_argument("--files-per-request", type=float, default=1)
+    parser.add_argument("--staff-skew", type=float, default=1.0, help="Zipf exponent for seeded assignments")
+    parser.add_argument("--vus", type=int, default=50, help="concurrent virtual users")
+    parser.add_argument("--mix", default="user=80,staff=15,admin=5", help="role mix of virtual users")
+    parser.add_argument("--duration", type=float, default=60, help="seconds of traffic")
+    parser.add_argument("--think-ms", type=float, default=0, help="pause between a virtual user's calls")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--json", help="also write the report to this file")
+    return parser.parse_args(argv)
+
+
+async def seed(args):
+    import database
+    from seeding import SeedSpec, seed_database
+
+    spec = SeedSpec(
+        users=args.users,
+        staff=args.staff,
+        admins=args.admins,
+        requests=args.requests,
+        messages_per_request=args.messages_per_request,
+        files_per_request=args.files_per_request,
+        staff_skew=args.staff_skew,
+        seed=args.random_seed,
+    )
+    start = time.perf_counter()
+    result = await seed_database(database.db, spec, drop=args.drop)
+    print(f"Seeded {result.counts} in {time.perf_counter() - start:.1f}s")
+    return result
+
+
+async def load_accounts():
+    """Seeded accounts already in the database (when not seeding this run)."""
+    import database
+    from seeding import SEED_EMAIL_PATTERN
+
+    accounts = {}
+    cursor = database.db.users.find({"email": {"$regex": SEED_EMAIL_PATTERN}}, {"_id": 0, "id": 1, "email": 1, "full_name": 1, "role": 1})
+    async for user in cursor:
+        accounts.setdefault(user["role"], []).append((user["id"], user["email"], user["full_name"]))
+    return accounts
+
+
+async def drive(client, accounts, args):
+    from loadtest.scenarios import VirtualUser
+    from loadtest.stats import LatencyRecorder
+
+    rng = random.Random(args.random_seed)
+    recorder = LatencyRecorder()
+    mix = {role: int(weight) for role, _, weight in (item.partition("=") for item in args.mix.split(","))}
+    roles = [role for role in mix if accounts.get(role)]
+    if not roles:
+        raise SystemExit("No seeded accounts found; run with --seed")
+
+    virtual_users = []
+    for i in range(args.vus):
+        role = rng.choices(roles, weights=[mix[role] for role in roles])[0]
+        virtual_users.append(VirtualUser(client, role, rng.choice(accounts[role]), recorder, random.Random(rng.random())))
+    await asyncio.gather(*(vu.login() for vu in virtual_users))
+
+    deadline = time.perf_counter() + args.duration
+
+    async def loop(vu):
+        while time.perf_counter() < deadline:
+            await vu.step()
+            # Always yield: in-process calls against mongomock never suspend,
+            # so without this the first virtual user would own the loop
+            await asyncio.sleep(args.think_ms / 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(loop(vu) for vu in virtual_users))
+    return recorder, time.perf_counter() - start
+
+
+async def main(args):
+    import httpx
+
+    import database
+    from loadtest.stats import format_table
+
+    limits = httpx.Limits(max_connections=args.vus, max_keepalive_connections=args.vus)
+    if args.base_url:
+        if args.seed:
+            await database.connect()
+            try:
+                accounts = (await seed(args)).accounts
+            finally:
+                database.close()
+        else:
+            await database.connect()
+            try:
+                accounts = await load_accounts()
+            finally:
+                database.close()
+        async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=120) as client:
+            recorder, elapsed = await drive(client, accounts, args)
+    else:
+        from server import create_app
+
+        app = create_app()
+        async with app.router.lifespan_context(app):
+            accounts = (await seed(args)).accounts if args.seed else await load_accounts()
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120) as client:
+                recorder, elapsed = await drive(client, accounts, args)
+
+    rows = recorder.summary(elapsed)
+    print(f"\n{args.vus} virtual users for {elapsed:.1f}s\n")
+    print(format_table(rows))
+    if args.json:
+        Path(args.json).write_text(json.dumps({"elapsed": elapsed, "vus": args.vus, "routes": rows}, indent=2))
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    if arguments.mongomock:
+        if arguments.base_url:
+            raise SystemExit("--mongomock runs in-process; drop --base-url")
+        os.environ["MONGO_URL"] = "mongomock://"
+        os.environ.setdefault("DB_NAME", "loadtest")
+    # The harness prints its own report; keep per-request log lines out of it
+    os.environ.setdefault("LOG_LEVEL", "ERROR")
+    asyncio.run(main(arguments))
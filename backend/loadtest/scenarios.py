@@ -0,0 +1,178 @@
+"""Weighted traffic mix per role.
+
+Each entry is ``(weight, action)``; actions report their latency under
+the route template they call.
+"""
+import random
+import time
+
+from seeding import SEED_PASSWORD
+from loadtest.stats import LatencyRecorder
+
+# Request ids a virtual user keeps for detail/message/status calls
+KNOWN_IDS = 200
+STATUSES = ["assigned", "in_progress", "completed"]
+
+
+class VirtualUser:
+    def __init__(self, client, role: str, account: tuple, recorder: LatencyRecorder, rng: random.Random):
+        self.client = client
+        self.role = role
+        self.user_id, self.email, _ = account
+        self.recorder = recorder
+        self.rng = rng
+        self.headers = {}
+        self.request_ids = []
+        self.assigned_ids = []
+        self.staff_ids = []
+
+    async def call(self, name: str, method: str, url: str, **kwargs):
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+            ok = response.status_code < 400
+            return response
+        finally:
+            self.recorder.record(name, time.perf_counter() - start, ok)
+
+    async def login(self):
+        response = await self.call("POST /api/auth/login", "POST", "/api/auth/login",
+                                   json={"email": self.email, "password": SEED_PASSWORD})
+        response.raise_for_status()
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        # Warm-up, not recorded: learn some request ids this user may access
+        response = await self.client.get("/api/requests", headers=self.headers)
+        requests = response.json()
+        ids = [request["id"] for request in requests]
+        self.request_ids = self.rng.sample(ids, min(KNOWN_IDS, len(ids)))
+        # Staff may only move requests assigned to them
+        self.assigned_ids = [request["id"] for request in requests
+                             if request.get("assigned_staff_id") == self.user_id][:KNOWN_IDS]
+        if self.role == "admin":
+            response = await self.client.get("/api/admin/staff-members", headers=self.headers)
+            self.staff_ids = [staff["id"] for staff in response.json()]
+
+    def actions(self):
+        if self.role == "admin":
+            return ADMIN_ACTIONS
+        if self.role == "staff":
+            return STAFF_ACTIONS
+        return USER_ACTIONS
+
+    async def step(self):
+        actions = self.actions()
+        _, action = self.rng.choices(actions, weights=[weight for weight, _ in actions])[0]
+        await action(self)
+
+    def some_request_id(self):
+        return self.rng.choice(self.request_ids) if self.request_ids else "missing"
+
+
+async def list_requests(vu):
+    await vu.call("GET /api/requests", "GET", "/api/requests")
+
+
+async def get_request(vu):
+    await vu.call("GET /api/requests/{request_id}", "GET", f"/api/requests/{vu.some_request_id()}")
+
+
+async def get_messages(vu):
+    await vu.call("GET /api/messages/{request_id}", "GET", f"/api/messages/{vu.some_request_id()}")
+
+
+async def post_message(vu):
+    await vu.call("POST /api/messages", "POST", "/api/messages",
+                  json={"request_id": vu.some_request_id(), "content": "Load test follow-up"})
+
+
+async def get_files(vu):
+    await vu.call("GET /api/files/{request_id}", "GET", f"/api/files/{vu.some_request_id()}")
+
+
+async def get_notifications(vu):
+    await vu.call("GET /api/notifications", "GET", "/api/notifications")
+
+
+async def dashboard_stats(vu):
+    await vu.call("GET /api/dashboard/stats", "GET", "/api/dashboard/stats")
+
+
+async def create_request(vu):
+    response = await vu.call("POST /api/requests", "POST", "/api/requests", json={
+        "title": "Load test request",
+        "description": "Generated by the load test harness",
+        "request_type": vu.rng.choice(["incident_report", "police_report", "body_cam_footage", "case_file", "other"]),
+        "priority": vu.rng.choice(["low", "medium", "high", "urgent"]),
+    })
+    if response.status_code == 200:
+        vu.request_ids.append(response.json()["id"])
+
+
+async def update_status(vu):
+    if not vu.assigned_ids:
+        return
+    await vu.call("PUT /api/requests/{request_id}/status", "PUT",
+                  f"/api/requests/{vu.rng.choice(vu.assigned_ids)}/status", params={"new_status": vu.rng.choice(STATUSES)})
+
+
+async def master_list(vu):
+    await vu.call("GET /api/admin/requests-master-list", "GET", "/api/admin/requests-master-list")
+
+
+async def staff_members(vu):
+    await vu.call("GET /api/admin/staff-members", "GET", "/api/admin/staff-members")
+
+
+async def analytics(vu):
+    await vu.call("GET /api/analytics/dashboard", "GET", "/api/analytics/dashboard")
+
+
+async def all_users(vu):
+    await vu.call("GET /api/admin/users", "GET", "/api/admin/users")
+
+
+async def unassigned(vu):
+    await vu.call("GET /api/admin/unassigned-requests", "GET", "/api/admin/unassigned-requests")
+
+
+async def assign(vu):
+    if not vu.staff_ids:
+        return
+    request_id = vu.some_request_id()
+    await vu.call("POST /api/requests/{request_id}/assign", "POST", f"/api/requests/{request_id}/assign",
+                  json={"request_id": request_id, "staff_id": vu.rng.choice(vu.staff_ids)})
+
+
+USER_ACTIONS = [
+    (30, list_requests),
+    (20, get_request),
+    (15, get_messages),
+    (5, post_message),
+    (15, get_notifications),
+    (10, dashboard_stats),
+    (5, get_files),
+    (2, create_request),
+]
+
+STAFF_ACTIONS = [
+    (25, list_requests),
+    (15, get_request),
+    (15, get_messages),
+    (5, post_message),
+    (5, update_status),
+    (10, dashboard_stats),
+    (10, get_notifications),
+]
+
+ADMIN_ACTIONS = [
+    (5, master_list),
+    (10, staff_members),
+    (5, analytics),
+    (5, all_users),
+    (10, unassigned),
+    (15, dashboard_stats),
+    (20, get_request),
+    (5, assign),
+]
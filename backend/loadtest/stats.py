@@ -0,0 +1,53 @@
+"""Latency recording and the per-route report."""
+import statistics
+from collections import defaultdict
+
+
+class LatencyRecorder:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, name: str, seconds: float, ok: bool):
+        self.samples[name].append(seconds)
+        if not ok:
+            self.errors[name] += 1
+
+    def summary(self, elapsed: float) -> list:
+        rows = []
+        for name in sorted(self.samples):
+            samples = self.samples[name]
+            rows.append(_row(name, samples, self.errors[name], elapsed))
+        everything = [sample for samples in self.samples.values() for sample in samples]
+        if everything:
+            rows.append(_row("TOTAL", everything, sum(self.errors.values()), elapsed))
+        return rows
+
+
+def _row(name: str, samples: list, errors: int, elapsed: float) -> dict:
+    if len(samples) >= 2:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = samples[0]
+    return {
+        "route": name,
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+        "p99_ms": round(p99 * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2),
+    }
+
+
+def format_table(rows: list) -> str:
+    header = f"{'route':<48} {'reqs':>8} {'errs':>6} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['route']:<48} {row['requests']:>8} {row['errors']:>6} {row['rps']:>8.1f} "
+            f"{row['p50_ms']:>9.1f} {row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
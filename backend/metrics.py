@@ -0,0 +1,166 @@
+"""Request-level metrics exported in Prometheus text format on ``/metrics``.
+
+``MetricsMiddleware`` times every HTTP request against its route template
+(``/api/requests/{request_id}``, not the concrete path), tracks in-flight
+requests and response sizes, and attributes the Mongo commands recorded by
+``monitoring.CommandMetrics`` to the route that issued them.  Each worker
+process exposes its own series; Prometheus aggregates across workers.
+
+The same per-request stats feed the query profiler (``profiling.py``).
+``/metrics`` is only mounted with ``METRICS_ENABLED`` and, when
+``METRICS_TOKEN`` is set, only answers scrapers that present it.
+"""
+import hmac
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+
+import config
+from monitoring import RequestStats, command_metrics, current_request_stats, pool_metrics
+
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    ["method", "route"],
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "route"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, float("inf")),
+)
+MONGO_COMMANDS_PER_REQUEST = Histogram(
+    "http_request_mongo_commands",
+    "Mongo commands issued while serving one HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500, 1000, float("inf")),
+)
+MONGO_SECONDS_PER_REQUEST = Histogram(
+    "http_request_mongo_seconds",
+    "Time spent in Mongo commands while serving one HTTP request",
+    ["method", "route"],
+)
+MONGO_COMMANDS_BY_ROUTE = Counter(
+    "http_mongo_commands",
+    "Mongo commands by route and command name",
+    ["route", "command"],
+)
+
+
+class MongoDriverCollector:
+    """Exposes the process-wide pool and command totals kept by ``monitoring``."""
+
+    def collect(self):
+        pool = pool_metrics.snapshot()
+        for name in ("open_connections", "in_use", "waiting"):
+            yield GaugeMetricFamily(f"mongo_pool_{name}", f"Mongo connection pool: {name.replace('_', ' ')}", value=pool[name])
+        yield CounterMetricFamily("mongo_pool_checkouts", "Connections checked out of the pool", value=pool["checkouts"])
+        yield CounterMetricFamily(
+            "mongo_pool_wait_seconds", "Total time spent waiting for a pooled connection", value=pool["wait_seconds_total"]
+        )
+        failures = CounterMetricFamily("mongo_pool_checkout_failures", "Failed pool check-outs", labels=["reason"])
+        for reason, count in pool["checkout_failures"].items():
+            failures.add_metric([reason], count)
+        yield failures
+
+        commands = CounterMetricFamily("mongo_commands", "Mongo commands completed", labels=["command"])
+        seconds = CounterMetricFamily("mongo_command_seconds", "Time spent in Mongo commands", labels=["command"])
+        failed = CounterMetricFamily("mongo_command_failures", "Mongo commands that failed", labels=["command"])
+        for name, (count, total_seconds, failures_count) in command_metrics.snapshot().items():
+            commands.add_metric([name], count)
+            seconds.add_metric([name], total_seconds)
+            failed.add_metric([name], failures_count)
+        yield commands
+        yield seconds
+        yield failed
+
+
+REGISTRY.register(MongoDriverCollector())
+
+
+def route_template(scope) -> str:
+    """The path template of the route that will serve ``scope``."""
+    app = scope.get("app")
+    if app is None:
+        return UNMATCHED_ROUTE
+    for route in app.router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streaming responses are timed to their last byte.
+
+    ``export_metrics`` records the Prometheus series; ``profiler`` (a
+    ``profiling.QueryProfiler``) receives every request's Mongo stats.
+    """
+
+    def __init__(self, app, export_metrics: bool = True, profiler=None):
+        self.app = app
+        self.export_metrics = export_metrics
+        self.profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = route_template(scope)
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method, route) if self.export_metrics else None
+        if in_flight is not None:
+            in_flight.inc()
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        response_size = 0
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request_stats.reset(token)
+            if in_flight is not None:
+                in_flight.dec()
+                HTTP_REQUEST_DURATION.labels(method, route, str(status_code)).observe(elapsed)
+                HTTP_RESPONSE_SIZE.labels(method, route).observe(response_size)
+                record_mongo_usage(method, route, stats)
+            if self.profiler is not None:
+                self.profiler.observe(method, route, elapsed, stats)
+
+
+def record_mongo_usage(method: str, route: str, stats: RequestStats):
+    MONGO_COMMANDS_PER_REQUEST.labels(method, route).observe(stats.command_count)
+    MONGO_SECONDS_PER_REQUEST.labels(method, route).observe(stats.command_seconds)
+    for command, _, _ in stats.commands:
+        MONGO_COMMANDS_BY_ROUTE.labels(route, command).inc()
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    if config.METRICS_TOKEN:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), config.METRICS_TOKEN.encode()):
+            return Response(status_code=401, headers={"WWW-Authenticate": "Bearer"})
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
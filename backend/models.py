@@ -0,0 +1,150 @@
+"""Pydantic models and enums shared by the routers."""
+from pydantic import BaseModel, Field, EmailStr
+from typing import List, Optional
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+
+# Enums
+class UserRole(str, Enum):
+    ADMIN = "admin"
+    STAFF = "staff" 
+    USER = "user"
+
+class RequestStatus(str, Enum):
+    PENDING = "pending"
+    ASSIGNED = "assigned"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    DENIED = "denied"
+
+class AssignmentPolicy(str, Enum):
+    ROUND_ROBIN = "round_robin"
+    LEAST_LOADED = "least_loaded"
+
+class RequestType(str, Enum):
+    INCIDENT_REPORT = "incident_report"
+    POLICE_REPORT = "police_report"
+    BODY_CAM_FOOTAGE = "body_cam_footage"
+    CASE_FILE = "case_file"
+    OTHER = "other"
+
+# Models
+class User(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    email: EmailStr
+    full_name: str
+    role: UserRole = UserRole.USER
+    is_active: bool = True
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class UserCreate(BaseModel):
+    email: EmailStr
+    password: str
+    full_name: str
+    role: UserRole = UserRole.USER
+
+class UserLogin(BaseModel):
+    email: EmailStr
+    password: str
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+    user: User
+
+class FileUpload(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str
+    filename: str
+    original_name: str
+    file_size: int
+    content_type: str
+    uploaded_by: str
+    uploaded_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Content hash; new uploads are stored under it (see blobstore.py)
+    sha256: Optional[str] = None
+    # Thumbnail state: "ready", "failed" or "skipped"; unset until generated (see previews.py)
+    preview: Optional[str] = None
+
+class RecordRequest(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    title: str
+    description: str
+    request_type: RequestType
+    status: RequestStatus = RequestStatus.PENDING
+    assigned_staff_id: Optional[str] = None
+    # Denormalized for list views and exports (see denormalize.py)
+    assigned_staff_name: Optional[str] = None
+    assigned_staff_email: Optional[str] = None
+    requester_name: Optional[str] = None
+    requester_email: Optional[str] = None
+    file_count: int = 0
+    message_count: int = 0
+    last_message_at: Optional[datetime] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    priority: str = "medium"
+    # Bumped by every status or assignment change (see transitions.py)
+    version: int = 0
+    files: List[FileUpload] = []
+
+class RecordRequestCreate(BaseModel):
+    title: str
+    description: str
+    request_type: RequestType
+    priority: str = "medium"
+
+class Message(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    request_id: str
+    sender_id: str
+    sender_name: str
+    sender_role: UserRole
+    content: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class MessageCreate(BaseModel):
+    request_id: str
+    content: str
+
+class Notification(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    title: str
+    message: str
+    is_read: bool = False
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class AnalyticsData(BaseModel):
+    total_requests: int
+    requests_by_status: dict
+    requests_by_type: dict
+    requests_by_priority: dict
+    average_resolution_time: float
+    monthly_trends: List[dict]
+    staff_workload: List[dict]
+
+class RequestAssignment(BaseModel):
+    request_id: str
+    staff_id: str
+    version: Optional[int] = None
+
+class BulkAssignment(BaseModel):
+    request_ids: List[str]
+    # Either one staff member for every request, or a policy spreading them over staff_ids (default: all staff)
+    staff_id: Optional[str] = None
+    policy: AssignmentPolicy = AssignmentPolicy.LEAST_LOADED
+    staff_ids: Optional[List[str]] = None
+
+class BulkStatusUpdate(BaseModel):
+    request_ids: List[str]
+    new_status: RequestStatus
+
+class StaffUser(BaseModel):
+    id: str
+    full_name: str
+    email: str
+    assigned_requests: int
+    completed_requests: int
@@ -0,0 +1,183 @@
+"""pymongo event listeners registered on the Motor client."""
+import threading
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Optional
+
+from pymongo import monitoring
+
+
+class RequestStats:
+    """Mongo commands issued while serving one HTTP request.
+
+    Motor runs driver calls on executor threads but copies the caller's
+    context, so the listener below finds the stats object of the request
+    that issued each command.
+    """
+
+    __slots__ = ("commands", "_started")
+
+    def __init__(self):
+        # (command_name, seconds, shape) in completion order; list.append is thread-safe
+        self.commands = []
+        # driver request_id -> shape, between the started and succeeded/failed events
+        self._started = {}
+
+    @property
+    def command_count(self) -> int:
+        return len(self.commands)
+
+    @property
+    def command_seconds(self) -> float:
+        return sum(seconds for _, seconds, _ in self.commands)
+
+
+def _filter_keys(query) -> str:
+    return ",".join(sorted(query)) if isinstance(query, dict) else ""
+
+
+def command_shape(command_name: str, command) -> str:
+    """Literal-free summary of a command, e.g. ``find users {id}``.
+
+    Two commands with the same shape differ only in their values, so many
+    of one shape inside a single request is the signature of an N+1 loop.
+    """
+    collection = command.get("collection") if command_name == "getMore" else command.get(command_name)
+    if not isinstance(collection, str):
+        collection = ""
+    if command_name == "aggregate":
+        stages = []
+        for stage in command.get("pipeline", []):
+            for operator, argument in stage.items():
+                stages.append(f"{operator}{{{_filter_keys(argument)}}}" if operator == "$match" else operator)
+        detail = "[" + ",".join(stages) + "]"
+    elif command_name in ("update", "delete"):
+        statements = command.get(command_name + "s") or [{}]
+        detail = "{" + _filter_keys(statements[0].get("q")) + "}"
+    elif command_name in ("find", "count", "distinct", "findAndModify"):
+        detail = "{" + _filter_keys(command.get("filter", command.get("query"))) + "}"
+    else:
+        detail = ""
+    return " ".join(part for part in (command_name, collection, detail) if part)
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+class CommandMetrics(monitoring.CommandListener):
+    """Per-command totals for the process, plus attribution to the current request."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # command_name -> [count, seconds, failures]
+        self.totals = defaultdict(lambda: [0, 0.0, 0])
+
+    def started(self, event):
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats._started[event.request_id] = command_shape(event.command_name, event.command)
+
+    def succeeded(self, event):
+        self._record(event, failed=False)
+
+    def failed(self, event):
+        self._record(event, failed=True)
+
+    def _record(self, event, failed: bool):
+        seconds = event.duration_micros / 1e6
+        with self._lock:
+            totals = self.totals[event.command_name]
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] += failed
+        stats = current_request_stats.get()
+        if stats is not None:
+            shape = stats._started.pop(event.request_id, event.command_name)
+            stats.commands.append((event.command_name, seconds, shape))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {name: list(values) for name, values in self.totals.items()}
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Connection pool counters, used to size maxPoolSize against the worker count.
+
+    pymongo calls these hooks synchronously on the thread that checks the
+    connection out, so the check-out start time is kept thread-local.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.checkouts = 0
+        self.checkout_failures = Counter()
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.waiting = 0
+        self.in_use = 0
+        self.open_connections = 0
+
+    def connection_check_out_started(self, event):
+        self._local.started = time.perf_counter()
+        with self._lock:
+            self.waiting += 1
+
+    def connection_checked_out(self, event):
+        waited = time.perf_counter() - getattr(self._local, "started", time.perf_counter())
+        with self._lock:
+            self.waiting -= 1
+            self.in_use += 1
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.waiting -= 1
+            self.checkout_failures[event.reason] += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.in_use -= 1
+
+    def connection_created(self, event):
+        with self._lock:
+            self.open_connections += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.open_connections -= 1
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "open_connections": self.open_connections,
+                "in_use": self.in_use,
+                "waiting": self.waiting,
+                "checkouts": self.checkouts,
+                "checkout_failures": dict(self.checkout_failures),
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+pool_metrics = PoolMetrics()
+command_metrics = CommandMetrics()
@@ -0,0 +1,89 @@
+"""PDF rendering for request exports."""
+import io
+from typing import List
+
+def generate_request_pdf(request_data: dict, user_data: dict, messages: List[dict] = None):
+    """Generate PDF report for a request"""
+    # reportlab is only needed here, so it is imported on first use
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    styles = getSampleStyleSheet()
+    story = []
+    
+    # Title
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=18,
+        spaceAfter=30,
+        alignment=1  # Center alignment
+    )
+    story.append(Paragraph("Police Department Records Request", title_style))
+    story.append(Spacer(1, 20))
+    
+    # Request Information
+    story.append(Paragraph("Request Information", styles['Heading2']))
+    
+    request_info = [
+        ["Request ID:", request_data['id'][:8] + "..."],
+        ["Title:", request_data['title']],
+        ["Type:", request_data['request_type'].replace('_', ' ').title()],
+        ["Priority:", request_data['priority'].title()],
+        ["Status:", request_data['status'].replace('_', ' ').title()],
+        ["Submitted:", request_data['created_at'][:19]],
+        ["Last Updated:", request_data['updated_at'][:19]],
+    ]
+    
+    request_table = Table(request_info, colWidths=[2*inch, 4*inch])
+    request_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]))
+    story.append(request_table)
+    story.append(Spacer(1, 20))
+    
+    # Requester Information
+    story.append(Paragraph("Requester Information", styles['Heading2']))
+    
+    user_info = [
+        ["Name:", user_data['full_name']],
+        ["Email:", user_data['email']],
+        ["Role:", user_data['role'].title()],
+    ]
+    
+    user_table = Table(user_info, colWidths=[2*inch, 4*inch])
+    user_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ]))
+    story.append(user_table)
+    story.append(Spacer(1, 20))
+    
+    # Description
+    story.append(Paragraph("Request Description", styles['Heading2']))
+    story.append(Paragraph(request_data['description'], styles['Normal']))
+    story.append(Spacer(1, 20))
+    
+    # Messages if provided
+    if messages:
+        story.append(Paragraph("Communication History", styles['Heading2']))
+        for msg in messages:
+            msg_text = f"<b>{msg['sender_name']} ({msg['sender_role']}):</b> {msg['content']}"
+            story.append(Paragraph(msg_text, styles['Normal']))
+            story.append(Spacer(1, 10))
+    
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
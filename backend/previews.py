@@ -0,0 +1,199 @@
+"""Thumbnails of uploaded images and first-page previews of PDFs.
+
+``upload_file`` queues ``generate`` on ``preview_jobs`` (workers.py) once
+the upload is committed; ``cli.py generate-previews`` backfills uploads
+from before previews existed.  Rendering runs in worker threads - Pillow
+releases the GIL while decoding and resampling - and JPEGs are decoded at
+reduced scale (``Image.draft``), so a 24-megapixel photo costs a fraction
+of a full decode.
+
+A preview is a JPEG at most ``PREVIEW_SIZE`` pixels on its longest side,
+stored by the backend under the blob's content hash: identical uploads
+share it, and it never changes, so it is served with an immutable cache
+header.  ``files.preview`` records the outcome for every record of the
+blob.
+
+The renderer is picked from the blob's leading bytes, never from the
+``content_type`` the client sent: the claim only decides what is queued.
+Pillow is limited to the sniffed format's decoder, and anything that is
+not a JPEG, PNG, GIF, WebP, BMP, TIFF or PDF is skipped unparsed.
+
+PDF previews need PyMuPDF, an optional AGPL-3.0 dependency installed from
+requirements-pdf-previews.txt.  A deployment without it still previews
+images; PDFs are left alone until a backfill run after installing it
+picks them up.
+"""
+import asyncio
+import io
+import logging
+from contextlib import closing
+from functools import lru_cache
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+import config
+from database import db
+from storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+IMAGE_TYPES = ("image/jpeg", "image/png", "image/gif", "image/webp", "image/bmp", "image/tiff")
+PDF_TYPE = "application/pdf"
+JPEG_QUALITY = 80
+
+# Leading bytes of each previewable format; the name is Pillow's, or "PDF"
+SIGNATURES = (
+    (b"\xff\xd8\xff", "JPEG"),
+    (b"\x89PNG\r\n\x1a\n", "PNG"),
+    (b"GIF87a", "GIF"),
+    (b"GIF89a", "GIF"),
+    (b"BM", "BMP"),
+    (b"II*\x00", "TIFF"),
+    (b"MM\x00*", "TIFF"),
+    (b"%PDF-", "PDF"),
+)
+
+
+def _pymupdf():
+    try:
+        import pymupdf
+    except ImportError:
+        import fitz as pymupdf  # PyMuPDF before 1.24.3
+    return pymupdf
+
+
+@lru_cache(maxsize=None)
+def pdf_supported() -> bool:
+    try:
+        _pymupdf()
+    except ImportError:
+        return False
+    return True
+
+
+def previewable_types() -> List[str]:
+    return [*IMAGE_TYPES, PDF_TYPE] if pdf_supported() else list(IMAGE_TYPES)
+
+
+def is_previewable(content_type: Optional[str]) -> bool:
+    return content_type in previewable_types()
+
+
+def sniff(head: bytes) -> Optional[str]:
+    """The previewable format ``head``, a blob's first 16 bytes, starts with."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    for signature, kind in SIGNATURES:
+        if head.startswith(signature):
+            return kind
+    return None
+
+
+def _first_page(data: bytes, size: int):
+    from PIL import Image
+
+    pymupdf = _pymupdf()
+    with pymupdf.open(stream=data, filetype="pdf") as document:
+        page = document[0]
+        zoom = size / max(page.rect.width, page.rect.height)
+        pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+        return Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+
+
+def render(source: BinaryIO, size: int) -> Optional[bytes]:
+    """The JPEG preview of ``source``, or None if it is not an image or PDF we preview."""
+    from PIL import Image, ImageOps
+
+    head = source.read(16)
+    kind = sniff(head)
+    if kind is None or (kind == "PDF" and not pdf_supported()):
+        return None
+    if kind == "PDF":
+        image = _first_page(head + source.read(), size)
+    else:
+        if source.seekable():
+            source.seek(0)
+        else:
+            source = io.BytesIO(head + source.read())
+        image = Image.open(source, formats=[kind])
+        # JPEG only: let the decoder scale down by up to 8x instead of decoding every pixel
+        image.draft("RGB", (size, size))
+        image = ImageOps.exif_transpose(image)
+    image.thumbnail((size, size))
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, "white")
+        background.paste(image, mask=image.getchannel("A"))
+        image = background
+    elif image.mode != "RGB":
+        image = image.convert("RGB")
+    output = io.BytesIO()
+    image.save(output, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    return output.getvalue()
+
+
+def _render_blob(record: dict) -> Optional[str]:
+    storage = get_storage()
+    name = record["filename"]
+    if storage.has_preview(name):
+        return READY  # the same content uploaded before
+    if record.get("file_size", 0) > config.PREVIEW_MAX_MB * 1024 * 1024:
+        return SKIPPED
+    source = storage.open(name)
+    if source is None:
+        return None  # gone; the reconciler reports it
+    try:
+        with closing(source):
+            data = render(source, config.PREVIEW_SIZE)
+    except Exception as exc:
+        # Corrupt, truncated or decompression-bomb uploads: no preview, not an error
+        logger.warning("Preview failed", extra={"filename": name, "content_type": record["content_type"], "error": repr(exc)})
+        return FAILED
+    if data is None:
+        return SKIPPED  # not what the upload claimed to be
+    storage.put_preview(name, data)
+    return READY
+
+
+async def generate(file_id: str) -> Optional[str]:
+    """Render the preview of a file record's blob; returns the new state."""
+    record = await db.files.find_one({"id": file_id}, {"_id": 0, "filename": 1, "content_type": 1, "file_size": 1})
+    if record is None or not is_previewable(record.get("content_type")):
+        return None
+    state = await asyncio.to_thread(_render_blob, record)
+    if state:
+        await db.files.update_many({"filename": record["filename"]}, {"$set": {"preview": state}})
+    return state
+
+
+async def backfill(workers: int = 4, progress: Optional[Callable[[Dict[str, int]], None]] = None) -> Dict[str, int]:
+    """Generate the missing previews of existing uploads, ``workers`` at a time.
+
+    Returns the number of records per outcome; ``progress`` gets the
+    running counts every 100 records.
+    """
+    query = {"preview": {"$exists": False}, "content_type": {"$in": previewable_types()}}
+    queue = asyncio.Queue(maxsize=workers * 2)
+    counts: Dict[str, int] = {}
+
+    async def work():
+        while (file_id := await queue.get()) is not None:
+            state = await generate(file_id) or "missing"
+            counts[state] = counts.get(state, 0) + 1
+            if progress and sum(counts.values()) % 100 == 0:
+                progress(counts)
+
+    tasks = [asyncio.create_task(work()) for _ in range(workers)]
+    try:
+        async for record in db.files.find(query, {"_id": 0, "id": 1}):
+            await queue.put(record["id"])
+        for _ in tasks:
+            await queue.put(None)
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return counts
@@ -0,0 +1,110 @@
+"""Slow-request and N+1 query detector.
+
+Fed by ``MetricsMiddleware`` with the ``RequestStats`` of every request.  A
+request is flagged when it issues more than ``MAX_DB_COMMANDS_PER_REQUEST``
+Mongo commands, repeats one command shape ``N_PLUS_ONE_THRESHOLD`` times,
+or takes longer than ``SLOW_REQUEST_MS``.  Flagged requests are logged with
+their route and query shapes (rate limited per route), and per-route
+aggregates are kept for ``GET /api/admin/query-profile``.
+"""
+import logging
+import threading
+import time
+from collections import Counter
+
+import config
+from monitoring import RequestStats
+
+logger = logging.getLogger(__name__)
+
+# Shapes listed per flagged request in logs and per route in the report
+TOP_SHAPES = 5
+
+
+class RouteProfile:
+    __slots__ = ("requests", "flagged", "commands", "max_commands", "mongo_seconds", "seconds", "max_seconds", "shapes")
+
+    def __init__(self):
+        self.requests = 0
+        self.flagged = 0
+        self.commands = 0
+        self.max_commands = 0
+        self.mongo_seconds = 0.0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.shapes = Counter()
+
+    def as_dict(self, route: str) -> dict:
+        return {
+            "route": route,
+            "requests": self.requests,
+            "flagged_requests": self.flagged,
+            "avg_commands": round(self.commands / self.requests, 2) if self.requests else 0,
+            "max_commands": self.max_commands,
+            "avg_ms": round(self.seconds / self.requests * 1000, 2) if self.requests else 0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+            "avg_mongo_ms": round(self.mongo_seconds / self.requests * 1000, 2) if self.requests else 0,
+            "top_shapes": [{"shape": shape, "count": count} for shape, count in self.shapes.most_common(TOP_SHAPES)],
+        }
+
+
+class QueryProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._last_warning = {}
+
+    def observe(self, method: str, route: str, seconds: float, stats: RequestStats):
+        shapes = Counter(shape for _, _, shape in stats.commands)
+        reasons = []
+        if stats.command_count > config.MAX_DB_COMMANDS_PER_REQUEST:
+            reasons.append(f"{stats.command_count} Mongo commands")
+        repeated = [shape for shape, count in shapes.items() if count >= config.N_PLUS_ONE_THRESHOLD]
+        if repeated:
+            reasons.append("likely N+1: " + "; ".join(repeated))
+        if seconds * 1000 > config.SLOW_REQUEST_MS:
+            reasons.append(f"slow ({seconds * 1000:.0f} ms)")
+
+        key = f"{method} {route}"
+        with self._lock:
+            profile = self._routes.get(key)
+            if profile is None:
+                profile = self._routes[key] = RouteProfile()
+            profile.requests += 1
+            profile.flagged += bool(reasons)
+            profile.commands += stats.command_count
+            profile.max_commands = max(profile.max_commands, stats.command_count)
+            profile.mongo_seconds += stats.command_seconds
+            profile.seconds += seconds
+            profile.max_seconds = max(profile.max_seconds, seconds)
+            profile.shapes.update(shapes)
+
+            if not reasons:
+                return
+            now = time.monotonic()
+            if now - self._last_warning.get(key, float("-inf")) < config.QUERY_PROFILER_WARN_INTERVAL_SECONDS:
+                return
+            self._last_warning[key] = now
+
+        logger.warning(
+            "Query profile: %s flagged (%s); %d commands, %.0f ms in Mongo; top shapes: %s",
+            key,
+            ", ".join(reasons),
+            stats.command_count,
+            stats.command_seconds * 1000,
+            ", ".join(f"{shape} x{count}" for shape, count in shapes.most_common(TOP_SHAPES)),
+        )
+
+    def report(self) -> list:
+        """Per-route aggregates, heaviest Mongo users first."""
+        with self._lock:
+            rows = [profile.as_dict(route) for route, profile in self._routes.items()]
+        return sorted(rows, key=lambda row: row["avg_commands"] * row["requests"], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+            self._last_warning.clear()
+
+
+query_profiler = QueryProfiler()
@@ -0,0 +1,275 @@
+"""Reconciling stored uploads with the ``files`` collection.
+
+Uploads can drift from their records in both directions: a file whose
+record was never inserted or has been deleted is an *orphan*; a record
+whose file is gone is *dangling* (downloads of it 404).
+
+``StorageReconciler`` finds both in one merge pass over two sorted
+streams - the storage listing and ``files`` sorted by ``filename`` -
+without holding either in memory.  The records come from an
+index-ordered cursor.  S3 lists keys in order already; a directory
+listing is sorted in runs of ``RECONCILE_RUN_SIZE`` names spilled to
+temporary files and merged (an external sort).
+
+The name space is cut into 16 slices by first character (upload names
+are hex: content hashes, or uuids for older uploads).  In the fan-out
+layout a slice is just 16 of the 256 top-level directories (on S3, a
+key range), so the scheduled job does one slice per tick and covers
+everything every 16 ticks.  ``run()`` does all of them.
+
+Every API process schedules the job, but a run first takes the
+``storage-reconcile`` lease (leases.py), so only one process reconciles
+at a time; the lease document also carries the next slice and the
+latest report from one holder to the next.
+
+Orphans are moved into the backend's quarantine rather than deleted,
+and only once they are older than ``RECONCILE_GRACE_SECONDS`` (an upload
+writes its file before inserting its record).  A dangling record whose
+file is in quarantine gets it moved back.  Quarantined files are deleted
+after ``RECONCILE_QUARANTINE_DAYS``, and uploads abandoned half-way
+after a day.  Dangling records are only reported.
+"""
+import asyncio
+import heapq
+import logging
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from itertools import islice
+from typing import AsyncIterator, Iterator, List, Optional
+
+import config
+import leases
+from blobstore import referenced
+from database import db
+from storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+SLICES = "0123456789abcdef"
+# Dangling records listed in a report; the count is always complete
+DANGLING_SAMPLE = 50
+# Orphans / dangling records handled per storage batch
+BATCH_SIZE = 1000
+# An upload still streaming after this long never will finish
+INCOMING_MAX_AGE_SECONDS = 86400
+LEASE = "storage-reconcile"
+
+
+@dataclass
+class ReconcileReport:
+    slices: List[str] = field(default_factory=list)
+    dry_run: bool = False
+    files_stored: int = 0
+    records: int = 0
+    orphans: int = 0
+    orphan_bytes: int = 0
+    quarantined: int = 0
+    # Quarantined orphans put back because an upload of the same content claimed them meanwhile
+    reclaimed: int = 0
+    too_recent: int = 0
+    dangling: int = 0
+    restored: int = 0
+    purged: int = 0
+    dangling_sample: List[dict] = field(default_factory=list)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _slice_bounds(index: int):
+    low = SLICES[index] if index > 0 else None
+    high = SLICES[index + 1] if index + 1 < len(SLICES) else None
+    return low, high
+
+
+def _sorted_names(storage, low: Optional[str], high: Optional[str], run_size: int) -> Iterator[str]:
+    """Blob names in ``[low, high)``, sorted, holding at most ``run_size`` names at a time.
+
+    Lists the storage before returning (call it in a thread); the
+    returned iterator merges the spilled runs lazily.
+    """
+    if storage.lists_sorted:
+        return storage.list_names(low, high)
+    runs = []
+    chunk = []
+    for name in storage.list_names(low, high):
+        chunk.append(name)
+        if len(chunk) >= run_size:
+            runs.append(_spill(chunk))
+            chunk = []
+    if not runs:
+        return iter(sorted(chunk))
+    runs.append(_spill(chunk))
+    return _merge(runs)
+
+
+async def _batched(names: Iterator[str]) -> AsyncIterator[str]:
+    """``names`` as an async iterator, pulled from a thread ``BATCH_SIZE`` at a time."""
+    while batch := await asyncio.to_thread(lambda: list(islice(names, BATCH_SIZE))):
+        for name in batch:
+            yield name
+
+
+def _merge(runs) -> Iterator[str]:
+    try:
+        yield from heapq.merge(*((line.rstrip("\n") for line in run) for run in runs))
+    finally:
+        for run in runs:
+            run.close()
+
+
+def _spill(names: List[str]):
+    run = tempfile.TemporaryFile("w+", encoding="utf-8")
+    run.writelines(f"{name}\n" for name in sorted(names))
+    run.seek(0)
+    return run
+
+
+class StorageReconciler:
+    def __init__(self):
+        # The lease keeps other processes out; this keeps out other tasks of this one
+        self._lock = asyncio.Lock()
+
+    async def run(self, dry_run: bool = False) -> Optional[ReconcileReport]:
+        """Reconcile every slice; None if another process is reconciling."""
+        async with self._lock:
+            if await leases.acquire(LEASE, config.RECONCILE_LEASE_SECONDS) is None:
+                logger.info("Storage reconciliation already running elsewhere")
+                return None
+            report = None
+            try:
+                report = await self._reconcile(range(len(SLICES)), dry_run)
+            finally:
+                await leases.release(LEASE, **({"last_report": report.as_dict()} if report else {}))
+            return report
+
+    async def run_next_slice(self) -> Optional[ReconcileReport]:
+        """Reconcile the next slice (the scheduled job); None if another process is reconciling."""
+        async with self._lock:
+            lease = await leases.acquire(LEASE, config.RECONCILE_LEASE_SECONDS)
+            if lease is None:
+                return None
+            index = lease.get("next_slice", 0)
+            report = None
+            try:
+                report = await self._reconcile([index], dry_run=False)
+            finally:
+                await leases.release(
+                    LEASE, next_slice=(index + 1) % len(SLICES), **({"last_report": report.as_dict()} if report else {})
+                )
+            return report
+
+    async def latest_report(self) -> Optional[dict]:
+        """The report of the latest run in any process."""
+        lease = await db.leases.find_one({"_id": LEASE}, {"_id": 0, "last_report": 1})
+        return lease.get("last_report") if lease else None
+
+    async def _reconcile(self, indexes, dry_run: bool) -> ReconcileReport:
+        storage = get_storage()
+        report = ReconcileReport(dry_run=dry_run, started_at=datetime.now(timezone.utc))
+        for index in indexes:
+            # Extend the lease as we go; a full run can outlast it
+            await leases.acquire(LEASE, config.RECONCILE_LEASE_SECONDS)
+            report.slices.append(SLICES[index])
+            await self._reconcile_slice(storage, index, report)
+        if report.slices[-1] == SLICES[-1] and not dry_run:
+            report.purged = await asyncio.to_thread(self._purge_quarantine, storage)
+        report.finished_at = datetime.now(timezone.utc)
+        if report.orphans or report.dangling or report.purged:
+            logger.warning("Storage reconciliation found drift", extra={
+                key: value for key, value in report.as_dict().items() if key != "dangling_sample"
+            })
+        return report
+
+    async def _reconcile_slice(self, storage, index: int, report: ReconcileReport):
+        low, high = _slice_bounds(index)
+        query = {}
+        if low or high:
+            query["filename"] = {**({"$gte": low} if low else {}), **({"$lt": high} if high else {})}
+        cursor = db.files.find(query, {"_id": 0, "id": 1, "request_id": 1, "filename": 1}).sort("filename", 1)
+
+        names = _batched(await asyncio.to_thread(_sorted_names, storage, low, high, config.RECONCILE_RUN_SIZE))
+        current = await anext(names, None)
+        matched = None
+        orphans, dangling = [], []
+
+        async def flush(force: bool = False):
+            if orphans and (force or len(orphans) >= BATCH_SIZE):
+                moved = await asyncio.to_thread(self._handle_orphans, storage, orphans, report)
+                orphans.clear()
+                if moved:
+                    await self._reclaim(storage, moved, report)
+            if dangling and (force or len(dangling) >= BATCH_SIZE):
+                await asyncio.to_thread(self._handle_dangling, storage, dangling, report)
+                dangling.clear()
+
+        async for record in cursor:
+            report.records += 1
+            filename = record["filename"]
+            # Everything stored sorting before this record has no record of its own
+            while current is not None and current < filename:
+                if current != matched:
+                    orphans.append(current)
+                report.files_stored += 1
+                current = await anext(names, None)
+            if current == filename:
+                matched = filename  # several records may share a file
+            elif filename != matched:
+                dangling.append(record)
+            await flush()
+        while current is not None:
+            if current != matched:
+                orphans.append(current)
+            report.files_stored += 1
+            current = await anext(names, None)
+            await flush()
+        await flush(force=True)
+
+    def _handle_orphans(self, storage, orphans: List[str], report: ReconcileReport) -> List[str]:
+        """Quarantine the orphans past the grace period; returns the names moved."""
+        cutoff = time.time() - config.RECONCILE_GRACE_SECONDS
+        moved = []
+        for name in orphans:
+            stat = storage.stat(name)
+            if stat is None:
+                continue  # removed meanwhile
+            modified, size = stat
+            if modified > cutoff:
+                report.too_recent += 1
+                continue
+            report.orphans += 1
+            report.orphan_bytes += size
+            if not report.dry_run and storage.quarantine(name):
+                report.quarantined += 1
+                moved.append(name)
+        return moved
+
+    async def _reclaim(self, storage, moved: List[str], report: ReconcileReport):
+        # Blobs are shared by content, so an old blob can gain a record after the
+        # merge passed it (its age says nothing); re-count like blobstore.release
+        claimed = await referenced(moved)
+        if not claimed:
+            return
+        restored = await asyncio.to_thread(lambda: sum(1 for name in claimed if storage.restore(name)))
+        report.quarantined -= restored
+        report.reclaimed += restored
+
+    def _handle_dangling(self, storage, records: List[dict], report: ReconcileReport):
+        for record in records:
+            if not report.dry_run and storage.is_quarantined(record["filename"]) and storage.restore(record["filename"]):
+                report.restored += 1
+                continue
+            report.dangling += 1
+            if len(report.dangling_sample) < DANGLING_SAMPLE:
+                report.dangling_sample.append(record)
+
+    def _purge_quarantine(self, storage) -> int:
+        now = time.time()
+        return storage.purge(now - config.RECONCILE_QUARANTINE_DAYS * 86400, now - INCOMING_MAX_AGE_SECONDS)
+
+
+storage_reconciler = StorageReconciler()
@@ -0,0 +1,21 @@
+"""API routes, grouped by area and mounted under ``/api``."""
+from fastapi import APIRouter
+
+from routers import (
+    admin,
+    analytics,
+    auth,
+    dashboard,
+    email_templates,
+    exports,
+    files,
+    messages,
+    notifications,
+    requests,
+    search,
+)
+
+api_router = APIRouter(prefix="/api")
+
+for module in (auth, admin, files, requests, exports, analytics, messages, notifications, dashboard, email_templates, search):
+    api_router.include_router(module.router)
@@ -0,0 +1,483 @@
+"""Admin-only request oversight and user management."""
+import logging
+import os
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+import uuid
+from datetime import datetime, timezone
+
+import blobstore
+import cascade
+from assignment import PRIORITY_WEIGHTS, assignment_engine
+from auth import get_current_user, pwd_context
+from cache import TTLCache
+from config import BROWSE_CACHE_TTL_SECONDS
+from codec import document_response, projection_for, with_defaults
+from database import db, client_options
+from denormalize import propagate_user, repair
+from emails import is_deliverable, send_email
+from models import User, UserRole, UserCreate, StaffUser, RecordRequest, RequestStatus, RequestType
+from monitoring import pool_metrics
+from profiling import query_profiler
+from reconcile import storage_reconciler
+from transitions import requester_of, transition
+from workers import background_jobs, email_worker
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# What cancellation needs back: the old state for the assignment queue, the rest for the email
+CANCEL_PROJECTION = {
+    "_id": 0, "title": 1, "user_id": 1, "requester_name": 1, "requester_email": 1,
+    "status": 1, "assigned_staff_id": 1, "priority": 1, "request_type": 1
+}
+
+# Filtered master-list pages with their facet counts, keyed by the full filter set
+browse_cache = TTLCache(BROWSE_CACHE_TTL_SECONDS)
+
+# Facet name -> grouping expression; ISO-8601 created_at strings start with YYYY-MM
+BROWSE_FACETS = {
+    "status": "$status",
+    "request_type": "$request_type",
+    "priority": "$priority",
+    "assigned_staff": "$assigned_staff_id",
+    "month": {"$substr": ["$created_at", 0, 7]},
+}
+# Facet name -> the filter it excludes from its own counts
+BROWSE_FACET_FIELDS = {
+    "status": "status",
+    "request_type": "request_type",
+    "priority": "priority",
+    "assigned_staff": "assigned_staff_id",
+    "month": "created_at",
+}
+
+@router.get("/admin/staff-members", response_model=List[StaffUser])
+async def get_staff_members(current_user: User = Depends(get_current_user)):
+    """Get all staff members with their workload"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view staff members")
+    
+    staff_users = await db.users.find({"role": "staff"}).to_list(None)
+    
+    # Both counts for every staff member in one aggregation
+    pipeline = [
+        {"$match": {"assigned_staff_id": {"$in": [staff["id"] for staff in staff_users]}}},
+        {"$group": {
+            "_id": "$assigned_staff_id",
+            "assigned": {"$sum": 1},
+            "completed": {"$sum": {"$cond": [{"$eq": ["$status", "completed"]}, 1, 0]}},
+        }},
+    ]
+    counts = {row["_id"]: row async for row in db.requests.aggregate(pipeline)}
+    
+    staff_list = []
+    for staff in staff_users:
+        row = counts.get(staff["id"], {})
+        staff_list.append(StaffUser(
+            id=staff["id"],
+            full_name=staff["full_name"],
+            email=staff["email"],
+            assigned_requests=row.get("assigned", 0),
+            completed_requests=row.get("completed", 0)
+        ))
+    
+    return staff_list
+
+def _fill_list_fields(request: dict) -> dict:
+    """Defaults for list rows, covering documents the startup backfill hasn't reached yet"""
+    request["requester_name"] = request.get("requester_name") or "Unknown"
+    request["requester_email"] = request.get("requester_email") or "Unknown"
+    request.setdefault("assigned_staff_name", None)
+    request.setdefault("assigned_staff_email", None)
+    request.setdefault("file_count", 0)
+    request.setdefault("message_count", 0)
+    return request
+
+@router.get("/admin/requests-master-list")
+async def get_master_requests_list(current_user: User = Depends(get_current_user)):
+    """Get complete master list of all requests with full details"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view master requests list")
+    
+    # Names and counts are denormalized onto each request (see denormalize.py)
+    requests = await db.requests.find({}, {"_id": 0}).to_list(None)
+    for request in requests:
+        _fill_list_fields(request)
+    
+    return document_response(requests)
+
+def _next_month(month: str) -> str:
+    year, number = int(month[:4]), int(month[5:7])
+    return f"{year + number // 12:04d}-{number % 12 + 1:02d}"
+
+@router.get("/admin/requests/browse")
+async def browse_requests(
+    status: Optional[RequestStatus] = None,
+    request_type: Optional[RequestType] = None,
+    priority: Optional[str] = Query(None, pattern=f"^({'|'.join(PRIORITY_WEIGHTS)})$"),
+    assigned_staff_id: Optional[str] = Query(None, description='Staff id, or "unassigned"'),
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-(0[1-9]|1[0-2])$"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user),
+):
+    """One page of the master list plus facet counts, each under the other filters, in one aggregation"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view master requests list")
+    
+    match = {}
+    if status:
+        match["status"] = status.value
+    if request_type:
+        match["request_type"] = request_type.value
+    if priority:
+        match["priority"] = priority
+    if assigned_staff_id:
+        match["assigned_staff_id"] = None if assigned_staff_id == "unassigned" else assigned_staff_id
+    if month:
+        match["created_at"] = {"$gte": month, "$lt": _next_month(month)}
+    
+    key = (tuple(sorted((name, str(value)) for name, value in match.items())), skip, limit)
+    cached = browse_cache.get(key)
+    if cached is not None:
+        return document_response({**cached, "cached": True})
+    
+    # Each facet counts under the other filters only, so the alternatives to a chosen
+    # value stay visible; the outer $match keeps just what some facet needs
+    scopes = {
+        name: {key: value for key, value in match.items() if key != field}
+        for name, field in BROWSE_FACET_FIELDS.items()
+    }
+    widened = [scopes[name] for name, field in BROWSE_FACET_FIELDS.items() if field in match]
+    if not widened:
+        outer = match
+    elif all(widened):
+        outer = {"$or": widened}
+    else:
+        outer = {}  # a single filter: its own facet counts every request
+    
+    def narrowed(scope: dict) -> list:
+        return [{"$match": scope}] if scope != outer else []
+    
+    facets = {
+        name: [*narrowed(scopes[name]), {"$group": {"_id": expression, "count": {"$sum": 1}}}, {"$sort": {"count": -1}}]
+        for name, expression in BROWSE_FACETS.items()
+    }
+    facets["page"] = [
+        *narrowed(match),
+        {"$sort": {"created_at": -1}},
+        {"$skip": skip},
+        {"$limit": limit},
+        {"$project": projection_for(RecordRequest)},
+    ]
+    facets["total"] = [*narrowed(match), {"$count": "count"}]
+    result = (await db.requests.aggregate([{"$match": outer}, {"$facet": facets}]).to_list(None))[0]
+    
+    page = [_fill_list_fields(request) for request in with_defaults(RecordRequest, result["page"])]
+    # Labels for the staff buckets, in one query
+    staff_ids = [bucket["_id"] for bucket in result["assigned_staff"] if bucket["_id"]]
+    users = {
+        user["id"]: user
+        for user in await db.users.find({"id": {"$in": staff_ids}}, {"_id": 0, "id": 1, "full_name": 1}).to_list(None)
+    }
+    
+    response = {
+        "total": result["total"][0]["count"] if result["total"] else 0,
+        "skip": skip,
+        "limit": limit,
+        "results": page,
+        "facets": {
+            name: [{"value": bucket["_id"], "count": bucket["count"]} for bucket in result[name]]
+            for name in BROWSE_FACETS
+        },
+    }
+    for bucket in response["facets"]["assigned_staff"]:
+        bucket["label"] = users.get(bucket["value"], {}).get("full_name", "Unassigned" if bucket["value"] is None else "Unknown")
+    response["facets"]["month"].sort(key=lambda bucket: bucket["value"] or "", reverse=True)
+    
+    browse_cache.set(key, response)
+    return document_response({**response, "cached": False})
+
+@router.get("/admin/unassigned-requests")
+async def get_unassigned_requests(current_user: User = Depends(get_current_user)):
+    """Get all unassigned requests"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # Get unassigned requests
+    unassigned = await db.requests.find({"assigned_staff_id": None}, {
+        "_id": 0, "id": 1, "title": 1, "description": 1, "status": 1, "priority": 1,
+        "request_type": 1, "created_at": 1, "requester_name": 1, "requester_email": 1
+    }).to_list(None)
+    for request in unassigned:
+        request["requester_name"] = request.get("requester_name") or "Unknown"
+        request["requester_email"] = request.get("requester_email") or "Unknown"
+    
+    return document_response(unassigned)
+
+@router.delete("/admin/requests/{request_id}")
+async def delete_request(request_id: str, current_user: User = Depends(get_current_user)):
+    """Delete a request - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    report = await cascade.delete_requests({"id": request_id})
+    if report.requests == 0:
+        raise HTTPException(status_code=404, detail="Request not found")
+    assignment_engine.invalidate()
+    if report.filenames:
+        await background_jobs.submit(blobstore.release, report.filenames)
+    
+    return {"message": "Request deleted successfully", "deleted": report.summary()}
+
+@router.put("/admin/requests/{request_id}/cancel")
+async def cancel_request(request_id: str, reason: dict, current_user: User = Depends(get_current_user)):
+    """Cancel a request - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    cancellation_reason = reason.get("reason", "Cancelled by administrator")
+    
+    # Update request status to cancelled, getting back what it looked like before
+    request_obj = await transition(
+        request_id,
+        {
+            "status": "cancelled",
+            "cancellation_reason": cancellation_reason,
+            "cancelled_at": datetime.now(timezone.utc).isoformat(),
+            "cancelled_by": current_user.id
+        },
+        CANCEL_PROJECTION,
+        version=reason.get("version"),
+    )
+    assignment_engine.status_changed(request_obj, request_obj["status"], "cancelled")
+    
+    # Send cancellation notification to user
+    user = await requester_of(request_obj)
+    if user and is_deliverable(user.get("email", "")):
+        user_email = user["email"]
+        subject = f"Request Cancelled: {request_obj['title']}"
+        content = f"""
+Your records request has been cancelled.
+
+Request Details:
+- Title: {request_obj['title']}
+- Request ID: {request_id}
+- Cancellation Reason: {cancellation_reason}
+- Cancelled Date: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')}
+
+If you have questions about this cancellation, please contact the Records Division at (216) 491-1220.
+
+Best regards,
+Shaker Heights Police Department
+        """
+        await email_worker.submit(send_email, user_email, subject, content)
+        logger.info(f"Cancellation notification queued for user: {user_email}")
+    
+    return {"message": "Request cancelled successfully", "reason": cancellation_reason, "version": request_obj["version"] + 1}
+
+@router.get("/admin/users")
+async def get_all_users(current_user: User = Depends(get_current_user)):
+    """Get all users for admin management"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    users = await db.users.find({}, projection_for(User)).to_list(None)
+    return document_response(users, model=User)
+
+@router.put("/admin/users/{user_id}/role")
+async def update_user_role(user_id: str, role_data: dict, current_user: User = Depends(get_current_user)):
+    """Update user role - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    new_role = role_data.get("role")
+    if new_role not in ["user", "staff", "admin"]:
+        raise HTTPException(status_code=400, detail="Invalid role")
+    
+    result = await db.users.update_one(
+        {"id": user_id},
+        {"$set": {"role": new_role}}
+    )
+    
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    assignment_engine.invalidate()
+    
+    return {"message": f"User role updated to {new_role}"}
+
+@router.put("/admin/users/{user_id}/email")
+async def update_user_email(user_id: str, email_data: dict, current_user: User = Depends(get_current_user)):
+    """Update user email - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    new_email = email_data.get("email")
+    if not new_email or "@" not in new_email:
+        raise HTTPException(status_code=400, detail="Invalid email address")
+    
+    # Check if email already exists
+    existing_user = await db.users.find_one({"email": new_email, "id": {"$ne": user_id}})
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Email already in use")
+    
+    result = await db.users.update_one(
+        {"id": user_id},
+        {"$set": {"email": new_email}}
+    )
+    
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Requests carry a copy of the address; refresh them off the request path
+    await background_jobs.submit(propagate_user, user_id)
+    assignment_engine.invalidate()
+    
+    return {"message": "User email updated successfully"}
+
+@router.put("/admin/users/{user_id}/name")
+async def update_user_name(user_id: str, name_data: dict, current_user: User = Depends(get_current_user)):
+    """Update user full name - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    new_name = (name_data.get("full_name") or "").strip()
+    if not new_name:
+        raise HTTPException(status_code=400, detail="Full name is required")
+    
+    result = await db.users.update_one(
+        {"id": user_id},
+        {"$set": {"full_name": new_name}}
+    )
+    
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Requests show the requester's and the assigned staff member's name
+    await background_jobs.submit(propagate_user, user_id)
+    assignment_engine.invalidate()
+    
+    return {"message": "User name updated successfully"}
+
+@router.post("/admin/create-staff")
+async def create_staff_member(staff_data: UserCreate, current_user: User = Depends(get_current_user)):
+    """Create new staff or admin user - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # Check if user already exists
+    existing_user = await db.users.find_one({"email": staff_data.email})
+    if existing_user:
+        raise HTTPException(status_code=400, detail="User with this email already exists")
+    
+    # Create new user
+    hashed_password = pwd_context.hash(staff_data.password)
+    user_dict = {
+        "id": str(uuid.uuid4()),
+        "email": staff_data.email,
+        "full_name": staff_data.full_name,
+        "role": staff_data.role,
+        "hashed_password": hashed_password,
+        "is_active": True,
+        "created_at": datetime.now(timezone.utc).isoformat()
+    }
+    
+    await db.users.insert_one(user_dict)
+    assignment_engine.invalidate()
+    
+    # Create user object for response
+    user_obj = User(**{k: v for k, v in user_dict.items() if k != "hashed_password"})
+    
+    return {"message": f"{staff_data.role.title()} created successfully", "user": user_obj}
+
+@router.delete("/admin/users/{user_id}")
+async def delete_user(user_id: str, current_user: User = Depends(get_current_user)):
+    """Delete a user - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # Prevent deleting yourself
+    if user_id == current_user.id:
+        raise HTTPException(status_code=400, detail="Cannot delete your own account")
+    
+    # Check if user exists
+    user_to_delete = await db.users.find_one({"id": user_id}, {"_id": 0, "full_name": 1})
+    if not user_to_delete:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Requests, files, messages, notifications and assignments in a fixed number of queries
+    report = await cascade.delete_user(user_id)
+    if report.users == 0:
+        raise HTTPException(status_code=404, detail="User not found")
+    assignment_engine.invalidate()
+    if report.filenames:
+        await background_jobs.submit(blobstore.release, report.filenames)
+    
+    return {"message": f"User {user_to_delete['full_name']} deleted successfully", "deleted": report.summary()}
+
+@router.get("/admin/assignment-queue")
+async def get_assignment_queue(current_user: User = Depends(get_current_user)):
+    """Staff in the order the auto-assigner will pick them, with weighted workload - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return {
+        "pid": os.getpid(),
+        "rebuilt_at": assignment_engine.rebuilt_at,
+        "staff": assignment_engine.snapshot(),
+    }
+
+@router.post("/admin/maintenance/repair-denormalized")
+async def repair_denormalized(current_user: User = Depends(get_current_user)):
+    """Recompute names and counters on every request in the background - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    await background_jobs.submit(repair)
+    return {"message": "Repair queued"}
+
+@router.post("/admin/maintenance/reconcile-storage")
+async def reconcile_storage(dry_run: bool = False, current_user: User = Depends(get_current_user)):
+    """Reconcile uploads with file records in the background - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    await background_jobs.submit(storage_reconciler.run, dry_run=dry_run)
+    return {"message": "Reconciliation queued"}
+
+@router.get("/admin/maintenance/reconcile-storage")
+async def get_storage_reconciliation(current_user: User = Depends(get_current_user)):
+    """Report of the latest reconciliation, whichever worker ran it - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    report = await storage_reconciler.latest_report()
+    return report or {"message": "No reconciliation has run yet"}
+
+@router.get("/admin/db-pool")
+async def get_db_pool_stats(current_user: User = Depends(get_current_user)):
+    """Connection pool metrics for this worker process - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    options = {k: v for k, v in client_options().items() if k != "event_listeners"}
+    return {"pid": os.getpid(), "options": options, **pool_metrics.snapshot()}
+
+@router.get("/admin/query-profile")
+async def get_query_profile(current_user: User = Depends(get_current_user)):
+    """Per-route Mongo command counts and latency for this worker - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return {"pid": os.getpid(), "routes": query_profiler.report()}
+
+@router.delete("/admin/query-profile")
+async def reset_query_profile(current_user: User = Depends(get_current_user)):
+    """Clear the per-route query profile for this worker - admin only"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    query_profiler.reset()
+    return {"message": "Query profile reset"}
@@ -0,0 +1,99 @@
+"""Admin analytics dashboard."""
+from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime, timedelta, timezone
+
+from auth import get_current_user
+from database import analytics_db
+from models import User, UserRole, AnalyticsData
+
+router = APIRouter()
+
+@router.get("/analytics/dashboard", response_model=AnalyticsData)
+async def get_analytics_dashboard(current_user: User = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can view analytics")
+    
+    # Total requests
+    total_requests = await analytics_db.requests.count_documents({})
+    
+    # Requests by status
+    status_pipeline = [
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}}
+    ]
+    status_results = await analytics_db.requests.aggregate(status_pipeline).to_list(None)
+    requests_by_status = {item["_id"]: item["count"] for item in status_results}
+    
+    # Requests by type
+    type_pipeline = [
+        {"$group": {"_id": "$request_type", "count": {"$sum": 1}}}
+    ]
+    type_results = await analytics_db.requests.aggregate(type_pipeline).to_list(None)
+    requests_by_type = {item["_id"]: item["count"] for item in type_results}
+    
+    # Requests by priority
+    priority_pipeline = [
+        {"$group": {"_id": "$priority", "count": {"$sum": 1}}}
+    ]
+    priority_results = await analytics_db.requests.aggregate(priority_pipeline).to_list(None)
+    requests_by_priority = {item["_id"]: item["count"] for item in priority_results}
+    
+    # Average resolution time (for completed requests)
+    completed_requests = await analytics_db.requests.find({"status": "completed"}).to_list(None)
+    total_resolution_time = 0
+    completed_count = 0
+    
+    for req in completed_requests:
+        if req.get("created_at") and req.get("updated_at"):
+            created = datetime.fromisoformat(req["created_at"].replace('Z', '+00:00'))
+            updated = datetime.fromisoformat(req["updated_at"].replace('Z', '+00:00'))
+            resolution_time = (updated - created).total_seconds() / 3600  # hours
+            total_resolution_time += resolution_time
+            completed_count += 1
+    
+    average_resolution_time = total_resolution_time / completed_count if completed_count > 0 else 0
+    
+    # Monthly trends (last 12 months)
+    monthly_trends = []
+    for i in range(12):
+        month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0) - timedelta(days=30*i)
+        month_end = month_start + timedelta(days=30)
+        
+        month_count = await analytics_db.requests.count_documents({
+            "created_at": {
+                "$gte": month_start.isoformat(),
+                "$lt": month_end.isoformat()
+            }
+        })
+        
+        monthly_trends.append({
+            "month": month_start.strftime("%Y-%m"),
+            "count": month_count
+        })
+    
+    monthly_trends.reverse()
+    
+    # Staff workload
+    staff_workload = []
+    staff_users = await analytics_db.users.find({"role": "staff"}).to_list(None)
+    for staff in staff_users:
+        assigned_count = await analytics_db.requests.count_documents({"assigned_staff_id": staff["id"]})
+        completed_count = await analytics_db.requests.count_documents({
+            "assigned_staff_id": staff["id"],
+            "status": "completed"
+        })
+        
+        staff_workload.append({
+            "name": staff["full_name"],
+            "assigned": assigned_count,
+            "completed": completed_count
+        })
+    
+    return AnalyticsData(
+        total_requests=total_requests,
+        requests_by_status=requests_by_status,
+        requests_by_type=requests_by_type,
+        requests_by_priority=requests_by_priority,
+        average_resolution_time=average_resolution_time,
+        monthly_trends=monthly_trends,
+        staff_workload=staff_workload
+    )
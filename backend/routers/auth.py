@@ -0,0 +1,62 @@
+"""Registration and login."""
+from fastapi import APIRouter, HTTPException, status
+from datetime import timedelta
+
+from auth import get_password_hash, verify_password, create_access_token
+from codec import to_document, from_document
+from config import ACCESS_TOKEN_EXPIRE_MINUTES
+from database import db, primary_db
+from models import User, UserCreate, UserLogin, Token
+
+router = APIRouter()
+
+@router.post("/auth/register", response_model=Token)
+async def register(user_data: UserCreate):
+    # Check if user already exists
+    existing_user = await primary_db.users.find_one({"email": user_data.email})
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
+    # SECURITY: Force all public registrations to be 'user' role only
+    # Staff and admin accounts must be created through admin endpoints
+    user_dict = user_data.model_dump()
+    user_dict["role"] = "user"  # Force user role for public registration
+    
+    # Hash password and create user
+    hashed_password = get_password_hash(user_data.password)
+    del user_dict["password"]
+    
+    new_user = User(**user_dict)
+    user_doc = to_document(new_user)
+    user_doc["hashed_password"] = hashed_password
+    
+    await db.users.insert_one(user_doc)
+    
+    # Create access token
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": new_user.id}, expires_delta=access_token_expires
+    )
+    
+    return Token(access_token=access_token, token_type="bearer", user=new_user)
+
+@router.post("/auth/login", response_model=Token)
+async def login(user_data: UserLogin):
+    user = await primary_db.users.find_one({"email": user_data.email})
+    if not user or not verify_password(user_data.password, user["hashed_password"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    user_obj = from_document(User, user)
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": user_obj.id}, expires_delta=access_token_expires
+    )
+    
+    return Token(access_token=access_token, token_type="bearer", user=user_obj)
@@ -0,0 +1,45 @@
+"""Per-role dashboard counters."""
+from fastapi import APIRouter, Depends
+
+from auth import get_current_user
+from database import db
+from models import User, UserRole
+
+router = APIRouter()
+
+@router.get("/dashboard/stats")
+async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
+    if current_user.role == UserRole.ADMIN:
+        total_requests = await db.requests.count_documents({})
+        pending_requests = await db.requests.count_documents({"status": "pending"})
+        completed_requests = await db.requests.count_documents({"status": "completed"})
+        total_users = await db.users.count_documents({"role": "user"})
+        
+        return {
+            "total_requests": total_requests,
+            "pending_requests": pending_requests,
+            "completed_requests": completed_requests,
+            "total_users": total_users
+        }
+    elif current_user.role == UserRole.STAFF:
+        assigned_requests = await db.requests.count_documents({"assigned_staff_id": current_user.id})
+        completed_by_me = await db.requests.count_documents({
+            "assigned_staff_id": current_user.id,
+            "status": "completed"
+        })
+        
+        return {
+            "assigned_requests": assigned_requests,
+            "completed_requests": completed_by_me
+        }
+    else:
+        my_requests = await db.requests.count_documents({"user_id": current_user.id})
+        pending_requests = await db.requests.count_documents({
+            "user_id": current_user.id,
+            "status": {"$in": ["pending", "assigned", "in_progress"]}
+        })
+        
+        return {
+            "total_requests": my_requests,
+            "pending_requests": pending_requests
+        }
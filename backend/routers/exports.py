@@ -0,0 +1,84 @@
+"""PDF and CSV exports."""
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+import io
+import asyncio
+
+from auth import get_current_user
+from database import db, analytics_db
+from models import User, UserRole
+from pdf import generate_request_pdf
+
+router = APIRouter()
+
+async def render_request_pdf(request: dict) -> io.BytesIO:
+    """The PDF report for ``request``, with its requester and message thread."""
+    user = await db.users.find_one({"id": request["user_id"]})
+    messages = await db.messages.find({"request_id": request["id"]}).sort("created_at", 1).to_list(None)
+    # Render in a worker thread so it doesn't block the event loop
+    return await asyncio.to_thread(generate_request_pdf, request, user, messages)
+
+@router.get("/export/request/{request_id}/pdf")
+async def export_request_pdf(request_id: str, current_user: User = Depends(get_current_user)):
+    # Get request
+    request = await db.requests.find_one({"id": request_id})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if current_user.role == UserRole.USER and request["user_id"] != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    elif current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None:
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    
+    pdf_buffer = await render_request_pdf(request)
+    
+    return StreamingResponse(
+        io.BytesIO(pdf_buffer.getvalue()),
+        media_type="application/pdf",
+        headers={"Content-Disposition": f"attachment; filename=request_{request_id[:8]}.pdf"}
+    )
+
+@router.get("/export/requests/csv")
+async def export_requests_csv(current_user: User = Depends(get_current_user)):
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can export all requests")
+    
+    import pandas as pd  # Only this export needs pandas; don't pay for it at startup
+    
+    # Names are denormalized onto each request (see denormalize.py)
+    requests = await analytics_db.requests.find({}, {"_id": 0}).to_list(None)
+    
+    # Convert to DataFrame with full details
+    df_data = []
+    for req in requests:
+        df_data.append({
+            "Request ID": req["id"],
+            "Title": req["title"],
+            "Description": req["description"][:100] + "..." if len(req["description"]) > 100 else req["description"],
+            "Type": req["request_type"],
+            "Status": req["status"],
+            "Priority": req["priority"],
+            "Requester Name": req.get("requester_name") or "Unknown",
+            "Requester Email": req.get("requester_email") or "Unknown",
+            "Assigned Staff": req.get("assigned_staff_name") or "Unassigned",
+            "Staff Email": req.get("assigned_staff_email") or "",
+            "Files": req.get("file_count", 0),
+            "Messages": req.get("message_count", 0),
+            "Created At": req["created_at"],
+            "Updated At": req["updated_at"]
+        })
+    
+    df = pd.DataFrame(df_data)
+    
+    # Create CSV
+    csv_buffer = io.StringIO()
+    df.to_csv(csv_buffer, index=False)
+    csv_content = csv_buffer.getvalue()
+    
+    return StreamingResponse(
+        io.StringIO(csv_content),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=master_requests_export.csv"}
+    )
@@ -0,0 +1,209 @@
+"""File upload, download and listing for a request."""
+import asyncio
+from datetime import datetime
+from functools import partial
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, File, Header, UploadFile
+from fastapi.responses import Response, StreamingResponse
+
+import blobstore
+import config
+import previews
+from auth import create_link_token, get_current_user, get_link_user
+from bundle import BundleEntry, zip_stream
+from codec import to_document, projection_for, document_response
+from database import db
+from models import User, UserRole, FileUpload
+from routers.exports import render_request_pdf
+from storage import content_disposition, get_storage
+from workers import preview_jobs
+
+router = APIRouter()
+
+@router.post("/upload/{request_id}")
+async def upload_file(request_id: str, file: UploadFile = File(...), current_user: User = Depends(get_current_user)):
+    # Verify user has access to this request
+    request = await db.requests.find_one({"id": request_id})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if (current_user.role == UserRole.USER and request["user_id"] != current_user.id) or \
+       (current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None):
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    
+    # Stream into storage, hashing as we go
+    blob = await blobstore.receive(file)
+    
+    # Create file record; it takes a reference on the blob before it is published
+    file_upload = FileUpload(
+        request_id=request_id,
+        filename=blob.filename,
+        original_name=file.filename,
+        file_size=blob.size,
+        content_type=file.content_type,
+        uploaded_by=current_user.id,
+        sha256=blob.sha256
+    )
+    
+    try:
+        await db.files.insert_one(to_document(file_upload))
+    except BaseException:
+        await blobstore.discard(blob)
+        raise
+    duplicate = await blobstore.publish(blob)
+    await db.requests.update_one({"id": request_id}, {"$inc": {"file_count": 1}})
+    if previews.is_previewable(file_upload.content_type):
+        await preview_jobs.submit(previews.generate, file_upload.id)
+    
+    return {"message": "File uploaded successfully", "file_id": file_upload.id, "duplicate": duplicate}
+
+async def _downloadable_file(file_id: str, current_user: User) -> dict:
+    # Get file record
+    file_record = await db.files.find_one({"id": file_id})
+    if not file_record:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    # Check permissions for the associated request
+    request = await db.requests.find_one({"id": file_record["request_id"]})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if (current_user.role == UserRole.USER and request["user_id"] != current_user.id) or \
+       (current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None):
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    return file_record
+
+@router.get("/download/{file_id}")
+async def download_file(file_id: str, current_user: User = Depends(get_current_user)):
+    file_record = await _downloadable_file(file_id, current_user)
+    
+    # A local file is streamed from here; object storage redirects to a presigned URL
+    response = await asyncio.to_thread(
+        get_storage().download_response,
+        file_record["filename"],
+        file_record["original_name"],
+        file_record.get("content_type", "application/octet-stream")
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="File not found on disk")
+    return response
+
+@router.get("/download/{file_id}/url")
+async def download_url(file_id: str, current_user: User = Depends(get_current_user)):
+    """A presigned URL the browser can fetch directly, or null when the
+    file must come through ``/download/{file_id}`` (local storage)."""
+    file_record = await _downloadable_file(file_id, current_user)
+    url = await asyncio.to_thread(
+        get_storage().presigned_url,
+        file_record["filename"],
+        file_record["original_name"],
+        file_record.get("content_type", "application/octet-stream")
+    )
+    return {"url": url, "expires_in": config.S3_PRESIGN_SECONDS if url else None}
+
+@router.get("/preview/{file_id}")
+async def get_preview(file_id: str, if_none_match: str = Header(None), current_user: User = Depends(get_current_user)):
+    file_record = await _downloadable_file(file_id, current_user)
+    if file_record.get("preview") != previews.READY:
+        raise HTTPException(status_code=404, detail="Preview not available")
+    
+    # Previews are stored under the content hash, so they never change
+    headers = {"Cache-Control": "private, max-age=31536000, immutable", "ETag": f'"{file_record["filename"]}"'}
+    if if_none_match == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    data = await asyncio.to_thread(get_storage().read_preview, file_record["filename"])
+    if data is None:
+        raise HTTPException(status_code=404, detail="Preview not available")
+    return Response(content=data, media_type="image/jpeg", headers=headers)
+
+@router.get("/files/{request_id}")
+async def get_request_files(request_id: str, current_user: User = Depends(get_current_user)):
+    # Verify access to request
+    request = await db.requests.find_one({"id": request_id})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if (current_user.role == UserRole.USER and request["user_id"] != current_user.id) or \
+       (current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None):
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    
+    files = await db.files.find({"request_id": request_id}, projection_for(FileUpload)).to_list(None)
+    return document_response(files, model=FileUpload)
+
+def _uploaded_at(record: dict):
+    # Stored as an ISO string by to_document
+    value = record.get("uploaded_at")
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if isinstance(value, str) else value
+
+@router.get("/files/{request_id}/bundle")
+async def download_bundle(request_id: str, include_pdf: bool = False, current_user: User = Depends(get_current_user)):
+    """All files of a request as one ZIP, streamed as it is built;
+    ``include_pdf`` adds the request's PDF report."""
+    return await _bundle_response(request_id, include_pdf, current_user)
+
+@router.post("/files/{request_id}/bundle/link")
+async def bundle_link(request_id: str, include_pdf: bool = False, current_user: User = Depends(get_current_user)):
+    """A short-lived signed path to the bundle, relative to ``/api``.
+
+    Browsers open it directly, so the ZIP streams to disk instead of being
+    buffered in page memory as an XHR download would be.
+    """
+    await _bundle_request(request_id, current_user)
+    token = create_link_token(current_user.id, f"bundle:{request_id}", config.BUNDLE_LINK_SECONDS)
+    query = urlencode({"token": token, "include_pdf": str(include_pdf).lower()})
+    return {"path": f"/files/{request_id}/bundle/download?{query}", "expires_in": config.BUNDLE_LINK_SECONDS}
+
+@router.get("/files/{request_id}/bundle/download")
+async def download_bundle_link(request_id: str, token: str, include_pdf: bool = False):
+    """``download_bundle`` for a link from ``bundle_link``; permissions are checked again."""
+    current_user = await get_link_user(token, f"bundle:{request_id}")
+    return await _bundle_response(request_id, include_pdf, current_user)
+
+async def _bundle_request(request_id: str, current_user: User) -> dict:
+    request = await db.requests.find_one({"id": request_id}, {"_id": 0})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if (current_user.role == UserRole.USER and request["user_id"] != current_user.id) or \
+       (current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None):
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    return request
+
+async def _bundle_response(request_id: str, include_pdf: bool, current_user: User) -> StreamingResponse:
+    request = await _bundle_request(request_id, current_user)
+    files = await db.files.find(
+        {"request_id": request_id},
+        {"_id": 0, "filename": 1, "original_name": 1, "content_type": 1, "uploaded_at": 1}
+    ).sort("uploaded_at", 1).to_list(None)
+    if not files and not include_pdf:
+        raise HTTPException(status_code=404, detail="No files attached to this request")
+    
+    storage = get_storage()
+    entries = []
+    if include_pdf:
+        report = await render_request_pdf(request)
+        entries.append(BundleEntry(name=f"request_{request_id[:8]}.pdf", open=lambda: report, content_type="application/pdf"))
+    entries.extend(
+        BundleEntry(
+            name=record["original_name"],
+            open=partial(storage.open, record["filename"]),
+            content_type=record.get("content_type") or "application/octet-stream",
+            modified=_uploaded_at(record)
+        )
+        for record in files
+    )
+    
+    return StreamingResponse(
+        zip_stream(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": content_disposition(f"request_{request_id[:8]}_files.zip")}
+    )
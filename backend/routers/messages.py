@@ -0,0 +1,55 @@
+"""Messages exchanged on a request."""
+from fastapi import APIRouter, Depends, HTTPException
+from typing import List
+
+from auth import get_current_user
+from codec import to_document, projection_for, document_response
+from database import db
+from models import User, UserRole, Message, MessageCreate
+
+router = APIRouter()
+
+@router.post("/messages", response_model=Message)
+async def create_message(message_data: MessageCreate, current_user: User = Depends(get_current_user)):
+    # Verify user has access to this request
+    request = await db.requests.find_one({"id": message_data.request_id})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if (current_user.role == UserRole.USER and request["user_id"] != current_user.id) or \
+       (current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None):
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    
+    new_message = Message(
+        request_id=message_data.request_id,
+        sender_id=current_user.id,
+        sender_name=current_user.full_name,
+        sender_role=current_user.role,
+        content=message_data.content
+    )
+    
+    message_doc = to_document(new_message)
+    await db.messages.insert_one(message_doc)
+    await db.requests.update_one(
+        {"id": message_data.request_id},
+        {"$inc": {"message_count": 1}, "$set": {"last_message_at": message_doc["created_at"]}}
+    )
+    return new_message
+
+@router.get("/messages/{request_id}", response_model=List[Message])
+async def get_messages(request_id: str, current_user: User = Depends(get_current_user)):
+    # Verify access to request
+    request = await db.requests.find_one({"id": request_id})
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if (current_user.role == UserRole.USER and request["user_id"] != current_user.id) or \
+       (current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None):
+        if current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=403, detail="Access denied")
+    
+    messages = await db.messages.find({"request_id": request_id}, projection_for(Message)).sort("created_at", 1).to_list(None)
+    return document_response(messages, model=Message)
@@ -0,0 +1,23 @@
+"""In-app notifications."""
+from fastapi import APIRouter, Depends
+from typing import List
+
+from auth import get_current_user
+from codec import projection_for, document_response
+from database import db
+from models import User, Notification
+
+router = APIRouter()
+
+@router.get("/notifications", response_model=List[Notification])
+async def get_notifications(current_user: User = Depends(get_current_user)):
+    notifications = await db.notifications.find({"user_id": current_user.id}, projection_for(Notification)).sort("created_at", -1).to_list(None)
+    return document_response(notifications, model=Notification)
+
+@router.put("/notifications/{notification_id}/read")
+async def mark_notification_read(notification_id: str, current_user: User = Depends(get_current_user)):
+    await db.notifications.update_one(
+        {"id": notification_id, "user_id": current_user.id},
+        {"$set": {"is_read": True}}
+    )
+    return {"message": "Notification marked as read"}
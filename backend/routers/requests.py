@@ -0,0 +1,422 @@
+"""Creating, listing, assigning and updating records requests."""
+import heapq
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from itertools import cycle
+from pymongo import UpdateMany, UpdateOne
+
+from assignment import PRIORITY_WEIGHTS, assignment_engine, request_weight, weighted_workload
+from auth import get_current_user
+from config import AUTO_ASSIGN_ON_CREATE
+from codec import to_document, from_document, projection_for, document_response
+from database import db
+from denormalize import staff_fields
+from emails import send_new_request_notification, send_assignment_notification, send_assignment_digest, send_status_update_notification, send_status_update_digest
+from models import User, UserRole, RecordRequest, RecordRequestCreate, RequestAssignment, RequestStatus, Notification, BulkAssignment, AssignmentPolicy, BulkStatusUpdate
+from transitions import requester_of, transition, version_filter
+from workers import email_worker
+
+router = APIRouter()
+
+# Fields the assignment paths need from each request
+ASSIGNMENT_PROJECTION = {"_id": 0, "id": 1, "title": 1, "request_type": 1, "priority": 1, "status": 1, "assigned_staff_id": 1, "created_at": 1}
+
+@router.post("/requests", response_model=RecordRequest)
+async def create_request(request_data: RecordRequestCreate, current_user: User = Depends(get_current_user)):
+    request_dict = request_data.model_dump()
+    request_dict["user_id"] = current_user.id
+    request_dict["requester_name"] = current_user.full_name
+    request_dict["requester_email"] = current_user.email
+    
+    new_request = RecordRequest(**request_dict)
+    request_doc = to_document(new_request)
+    
+    await db.requests.insert_one(request_doc)
+    
+    # Create notification for admins
+    admin_users = await db.users.find({"role": "admin"}).to_list(None)
+    for admin in admin_users:
+        notification = Notification(
+            user_id=admin["id"],
+            title="New Request Submitted",
+            message=f"New request '{new_request.title}' submitted by {current_user.full_name}"
+        )
+        await db.notifications.insert_one(to_document(notification))
+    
+    # Queue email notification
+    await email_worker.submit(send_new_request_notification, new_request, current_user)
+    
+    if AUTO_ASSIGN_ON_CREATE:
+        staff_user = await assignment_engine.assign(request_doc)
+        if staff_user:
+            # Return the request as the assignment left it, so its version matches the stored one
+            assigned = await db.requests.find_one({"id": new_request.id}, projection_for(RecordRequest))
+            new_request = from_document(RecordRequest, assigned)
+            await email_worker.submit(send_assignment_notification, new_request, staff_user)
+    
+    return new_request
+
+@router.get("/requests", response_model=List[RecordRequest])
+async def get_requests(current_user: User = Depends(get_current_user)):
+    if current_user.role == UserRole.ADMIN:
+        # Admins see all requests
+        requests = await db.requests.find({}, projection_for(RecordRequest)).to_list(None)
+    elif current_user.role == UserRole.STAFF:
+        # Staff see assigned requests and unassigned requests
+        requests = await db.requests.find({
+            "$or": [
+                {"assigned_staff_id": current_user.id},
+                {"assigned_staff_id": None}
+            ]
+        }, projection_for(RecordRequest)).to_list(None)
+    else:
+        # Users see only their own requests
+        requests = await db.requests.find({"user_id": current_user.id}, projection_for(RecordRequest)).to_list(None)
+    
+    return document_response(requests, model=RecordRequest)
+
+@router.get("/requests/{request_id}", response_model=RecordRequest)
+async def get_request(request_id: str, current_user: User = Depends(get_current_user)):
+    request = await db.requests.find_one({"id": request_id}, projection_for(RecordRequest))
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    
+    # Check permissions
+    if current_user.role == UserRole.USER and request["user_id"] != current_user.id:
+        raise HTTPException(status_code=403, detail="Access denied")
+    elif current_user.role == UserRole.STAFF and request.get("assigned_staff_id") != current_user.id and request.get("assigned_staff_id") is not None:
+        raise HTTPException(status_code=403, detail="Access denied")
+    
+    return document_response(request, model=RecordRequest)
+
+@router.post("/requests/{request_id}/assign", response_model=dict)
+async def assign_request(request_id: str, assignment: RequestAssignment, current_user: User = Depends(get_current_user)):
+    """Assign a request to a staff member"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can assign requests")
+    
+    # Validate staff user exists
+    staff_user = await db.users.find_one({"id": assignment.staff_id, "role": "staff"}, {"_id": 0, "id": 1, "full_name": 1, "email": 1})
+    if not staff_user:
+        raise HTTPException(status_code=404, detail="Staff user not found")
+    
+    # Update request, getting back what it looked like before
+    original_request = await transition(
+        request_id,
+        {"assigned_staff_id": assignment.staff_id, "status": "assigned", **staff_fields(staff_user)},
+        projection_for(RecordRequest),
+        version=assignment.version,
+    )
+    assignment_engine.reassigned(original_request, assignment.staff_id)
+    
+    # Create notification for assigned staff
+    notification = Notification(
+        user_id=assignment.staff_id,
+        title="Request Assigned",
+        message=f"You have been assigned request: {original_request['title']}"
+    )
+    await db.notifications.insert_one(to_document(notification))
+    
+    # Queue email notification
+    request_obj = from_document(RecordRequest, original_request)
+    await email_worker.submit(send_assignment_notification, request_obj, staff_user)
+    
+    return {
+        "message": "Request assigned successfully",
+        "assigned_to": staff_user["full_name"],
+        "request_id": request_id,
+        "version": original_request["version"] + 1
+    }
+
+def _plan_assignments(requests: List[dict], staff_members: List[dict], policy: AssignmentPolicy, workload: Dict[str, float]) -> Dict[str, List[dict]]:
+    """Map staff id -> requests to give them under the chosen policy"""
+    plan = {staff["id"]: [] for staff in staff_members}
+    if policy == AssignmentPolicy.ROUND_ROBIN:
+        for request, staff in zip(requests, cycle(staff_members)):
+            plan[staff["id"]].append(request)
+        return plan
+    
+    # Least loaded: always hand the next request to whoever has the lightest open work,
+    # weighted as the assignment engine weighs it
+    heap = [(workload[staff["id"]], staff["full_name"], staff["id"]) for staff in staff_members]
+    heapq.heapify(heap)
+    for request in requests:
+        load, name, staff_id = heapq.heappop(heap)
+        plan[staff_id].append(request)
+        heapq.heappush(heap, (load + request_weight(request), name, staff_id))
+    return plan
+
+@router.post("/requests/bulk-assign", response_model=dict)
+async def bulk_assign_requests(assignment: BulkAssignment, current_user: User = Depends(get_current_user)):
+    """Assign many requests at once, to one staff member or spread by policy"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can assign requests")
+    
+    request_ids = list(dict.fromkeys(assignment.request_ids))
+    if not request_ids:
+        raise HTTPException(status_code=400, detail="No requests given")
+    
+    staff_filter = {"role": "staff", "is_active": {"$ne": False}}
+    if assignment.staff_id:
+        staff_filter["id"] = assignment.staff_id
+    elif assignment.staff_ids:
+        staff_filter["id"] = {"$in": assignment.staff_ids}
+    staff_members = await db.users.find(staff_filter, {"_id": 0, "id": 1, "full_name": 1, "email": 1}).sort("full_name", 1).to_list(None)
+    if not staff_members:
+        raise HTTPException(status_code=404, detail="Staff user not found")
+    
+    requests = await db.requests.find({"id": {"$in": request_ids}}, ASSIGNMENT_PROJECTION).to_list(None)
+    # Keep the caller's order so round robin is predictable
+    position = {request_id: index for index, request_id in enumerate(request_ids)}
+    requests.sort(key=lambda request: position[request["id"]])
+    found = {request["id"] for request in requests}
+    not_found = [request_id for request_id in request_ids if request_id not in found]
+    
+    workload = {}
+    if assignment.policy == AssignmentPolicy.LEAST_LOADED:
+        workload, _ = await weighted_workload([staff["id"] for staff in staff_members])
+    plan = _plan_assignments(requests, staff_members, assignment.policy, workload)
+    plan = {staff_id: batch for staff_id, batch in plan.items() if batch}
+    staff_by_id = {staff["id"]: staff for staff in staff_members}
+    
+    assigned = await _apply_assignments(plan, staff_by_id)
+    
+    return {
+        "message": f"Assigned {len(assigned)} requests to {len({row['staff_id'] for row in assigned})} staff members",
+        "assigned": assigned,
+        "not_found": not_found,
+    }
+
+async def _apply_assignments(plan: Dict[str, List[dict]], staff_by_id: Dict[str, dict], only_unassigned: bool = False) -> List[dict]:
+    """Write a staff id -> requests plan: one bulk_write, one insert_many, one digest email per staff member.
+    
+    With ``only_unassigned`` the plan comes from ``assignment_engine.plan``, which
+    already counted it; requests assigned by someone else meanwhile are skipped,
+    and only the requests actually written are counted, notified and returned.
+    """
+    if not plan:
+        return []
+    
+    now = datetime.now(timezone.utc).isoformat()
+    guard = {"assigned_staff_id": None} if only_unassigned else {}
+    result = await db.requests.bulk_write([
+        UpdateMany(
+            {"id": {"$in": [request["id"] for request in batch]}, **guard},
+            {"$set": {"assigned_staff_id": staff_id, "status": "assigned", "updated_at": now, **staff_fields(staff_by_id[staff_id])}, "$inc": {"version": 1}},
+        )
+        for staff_id, batch in plan.items()
+    ], ordered=False)
+    planned = plan
+    if result.modified_count < sum(len(batch) for batch in plan.values()):
+        # Some requests changed or went away underneath us; only a partial write pays for reading which ones we wrote
+        written = {
+            (request["id"], request["assigned_staff_id"])
+            async for request in db.requests.find(
+                {"id": {"$in": [request["id"] for batch in plan.values() for request in batch]}, "updated_at": now},
+                {"_id": 0, "id": 1, "assigned_staff_id": 1},
+            )
+        }
+        plan = {staff_id: [request for request in batch if (request["id"], staff_id) in written] for staff_id, batch in plan.items()}
+        plan = {staff_id: batch for staff_id, batch in plan.items() if batch}
+    
+    if only_unassigned:
+        # plan() counted every planned request; take back the ones we didn't write
+        for staff_id, batch in planned.items():
+            kept = {request["id"] for request in plan.get(staff_id, [])}
+            for request in batch:
+                if request["id"] not in kept:
+                    assignment_engine.request_closed(staff_id, request)
+    else:
+        for staff_id, batch in plan.items():
+            for request in batch:
+                assignment_engine.reassigned(request, staff_id)
+    if not plan:
+        return []
+    
+    notifications = [
+        to_document(Notification(
+            user_id=staff_id,
+            title="Request Assigned",
+            message=f"You have been assigned request: {request['title']}"
+        ))
+        for staff_id, batch in plan.items()
+        for request in batch
+    ]
+    await db.notifications.insert_many(notifications, ordered=False)
+    
+    # One digest email per staff member instead of one email per request
+    for staff_id, batch in plan.items():
+        await email_worker.submit(send_assignment_digest, staff_by_id[staff_id], batch)
+    
+    return [
+        {"request_id": request["id"], "staff_id": staff_id, "staff_name": staff_by_id[staff_id]["full_name"]}
+        for staff_id, batch in plan.items()
+        for request in batch
+    ]
+
+@router.post("/requests/auto-assign", response_model=dict)
+async def auto_assign_unassigned(current_user: User = Depends(get_current_user)):
+    """Assign every pending, unassigned request through the assignment queue (most urgent first)"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can assign requests")
+    
+    requests = await db.requests.find({"assigned_staff_id": None, "status": "pending"}, ASSIGNMENT_PROJECTION).to_list(None)
+    requests.sort(key=lambda request: (-PRIORITY_WEIGHTS.get(request.get("priority"), 2.0), request["created_at"]))
+    
+    plan = await assignment_engine.plan(requests)
+    staff_by_id = {staff_id: assignment_engine.staff(staff_id) for staff_id in plan}
+    assigned = await _apply_assignments(plan, staff_by_id, only_unassigned=True)
+    
+    return {
+        "message": f"Assigned {len(assigned)} of {len(requests)} unassigned requests",
+        "assigned": assigned,
+    }
+
+@router.post("/requests/{request_id}/auto-assign", response_model=dict)
+async def auto_assign_request(request_id: str, current_user: User = Depends(get_current_user)):
+    """Assign one unassigned request to the least-loaded staff member"""
+    if current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Only admins can assign requests")
+    
+    request = await db.requests.find_one({"id": request_id}, projection_for(RecordRequest))
+    if not request:
+        raise HTTPException(status_code=404, detail="Request not found")
+    if request.get("assigned_staff_id"):
+        raise HTTPException(status_code=409, detail="Request is already assigned")
+    
+    staff_user = await assignment_engine.assign(request)
+    if not staff_user:
+        raise HTTPException(status_code=409, detail="No staff member available, or the request was assigned meanwhile")
+    
+    await email_worker.submit(send_assignment_notification, from_document(RecordRequest, request), staff_user)
+    
+    return {
+        "message": "Request assigned successfully",
+        "assigned_to": staff_user["full_name"],
+        "request_id": request_id,
+        "version": request.get("version", 0) + 1
+    }
+
+@router.put("/requests/{request_id}/status")
+async def update_request_status(request_id: str, new_status: RequestStatus, version: Optional[int] = None, current_user: User = Depends(get_current_user)):
+    # Check permissions; staff may only move requests assigned to them
+    if current_user.role == UserRole.USER:
+        raise HTTPException(status_code=403, detail="Users cannot update request status")
+    staff_id = current_user.id if current_user.role == UserRole.STAFF else None
+    
+    # Update request, getting back what it looked like before
+    original_request = await transition(
+        request_id, {"status": new_status.value}, projection_for(RecordRequest), version=version, staff_id=staff_id
+    )
+    old_status = original_request["status"]
+    assignment_engine.status_changed(original_request, old_status, new_status.value)
+    
+    # Send notification to requester
+    requester = await requester_of(original_request)
+    if requester:
+        notification = Notification(
+            user_id=requester["id"],
+            title="Request Status Updated",
+            message=f"Your request '{original_request['title']}' status changed to {new_status.value.replace('_', ' ').title()}"
+        )
+        await db.notifications.insert_one(to_document(notification))
+        
+        # Queue email notification
+        request_obj = from_document(RecordRequest, original_request)
+        await email_worker.submit(send_status_update_notification, request_obj, requester, old_status, new_status.value)
+    
+    return {"message": "Status updated successfully", "version": original_request["version"] + 1}
+
+@router.post("/requests/bulk-status", response_model=dict)
+async def bulk_update_request_status(update: BulkStatusUpdate, current_user: User = Depends(get_current_user)):
+    """Move many requests to one status; returns a result per request id"""
+    if current_user.role == UserRole.USER:
+        raise HTTPException(status_code=403, detail="Users cannot update request status")
+    
+    request_ids = list(dict.fromkeys(update.request_ids))
+    if not request_ids:
+        raise HTTPException(status_code=400, detail="No requests given")
+    new_status = update.new_status.value
+    staff_id = current_user.id if current_user.role == UserRole.STAFF else None
+    
+    # One query covers existence and permissions for every id
+    query = {"id": {"$in": request_ids}}
+    requests = {
+        request["id"]: request
+        for request in await db.requests.find(query, projection_for(RecordRequest)).to_list(None)
+    }
+    
+    results = {}
+    changed = []
+    for request_id in request_ids:
+        request = requests.get(request_id)
+        if request is None:
+            results[request_id] = "not_found"
+        elif staff_id is not None and request.get("assigned_staff_id") != staff_id:
+            results[request_id] = "forbidden"
+        elif request["status"] == new_status:
+            results[request_id] = "unchanged"
+        else:
+            results[request_id] = "updated"
+            changed.append(request)
+    
+    if changed:
+        # The checks above go into each write, as in transition(): a request
+        # changed or reassigned since we read it is left alone
+        now = datetime.now(timezone.utc).isoformat()
+        result = await db.requests.bulk_write([
+            UpdateOne(
+                {
+                    "id": request["id"],
+                    "version": version_filter(request.get("version", 0)),
+                    **({"assigned_staff_id": staff_id} if staff_id is not None else {}),
+                },
+                {"$set": {"status": new_status, "updated_at": now}, "$inc": {"version": 1}},
+            )
+            for request in changed
+        ], ordered=False)
+        if result.modified_count < len(changed):
+            # Only a partial write pays for a second read, to find which ones we wrote
+            written = set(await db.requests.distinct(
+                "id", {"id": {"$in": [request["id"] for request in changed]}, "updated_at": now, "status": new_status}
+            ))
+            for request in changed:
+                if request["id"] not in written:
+                    results[request["id"]] = "conflict"
+            changed = [request for request in changed if request["id"] in written]
+    
+    if changed:
+        for request in changed:
+            assignment_engine.status_changed(request, request["status"], new_status)
+        
+        requester_ids = list({request["user_id"] for request in changed})
+        requesters = {
+            user["id"]: user
+            for user in await db.users.find({"id": {"$in": requester_ids}}, {"_id": 0, "id": 1, "email": 1, "full_name": 1}).to_list(None)
+        }
+        status_label = new_status.replace('_', ' ').title()
+        notifications = [
+            to_document(Notification(
+                user_id=request["user_id"],
+                title="Request Status Updated",
+                message=f"Your request '{request['title']}' status changed to {status_label}"
+            ))
+            for request in changed
+            if request["user_id"] in requesters
+        ]
+        if notifications:
+            await db.notifications.insert_many(notifications, ordered=False)
+        
+        # One email per requester, however many of their requests changed
+        changes_by_requester = {}
+        for request in changed:
+            if request["user_id"] in requesters:
+                changes_by_requester.setdefault(request["user_id"], []).append((request, request["status"]))
+        for user_id, changes in changes_by_requester.items():
+            await email_worker.submit(send_status_update_digest, requesters[user_id], changes, new_status)
+    
+    return {
+        "message": f"Updated {len(changed)} of {len(request_ids)} requests",
+        "results": results,
+    }
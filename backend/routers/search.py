@@ -0,0 +1,39 @@
+"""Full-text search across requests, messages and requesters."""
+from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from auth import get_current_user
+from codec import document_response
+from models import User, UserRole, RequestStatus, RequestType
+from search import search_requests
+
+router = APIRouter()
+
+def visible_requests_filter(user: User) -> dict:
+    """Requests a user may see, as a Mongo filter (same rules as GET /requests)"""
+    if user.role == UserRole.ADMIN:
+        return {}
+    if user.role == UserRole.STAFF:
+        # Written with $in rather than $or so it can sit next to $text
+        return {"assigned_staff_id": {"$in": [user.id, None]}}
+    return {"user_id": user.id}
+
+@router.get("/search")
+async def search(
+    q: str = Query(..., min_length=2, max_length=200),
+    status: Optional[RequestStatus] = None,
+    request_type: Optional[RequestType] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+):
+    """Ranked search over request titles/descriptions, message content and requester name/email"""
+    results = await search_requests(
+        q,
+        visible_requests_filter(current_user),
+        skip=skip,
+        limit=limit,
+        status=status.value if status else None,
+        request_type=request_type.value if request_type else None,
+    )
+    return document_response(results)
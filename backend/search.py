@@ -0,0 +1,171 @@
+"""Ranked full-text search over requests, their messages and their requesters.
+
+Backed by the Mongo text indexes declared in ``database.INDEXES``, so every
+worker process sees every write without an index of its own to maintain.
+Each source is one ``$text`` query sorted by text score and capped at
+``SEARCH_MAX_CANDIDATES``:
+
+* requests - title (weight 10) and description (weight 2);
+* messages - content, grouped to their request (best message wins);
+* users    - requester name and email, mapped to their requests.
+
+A request's rank is the weighted sum of its per-source scores, so a request
+whose title and thread both match outranks one that matches only once.
+Messages and users carry no visibility of their own, so their pipelines
+join each match to its requests and keep only those the caller's filter
+allows (``visible_requests``) before the cap applies; otherwise other
+people's matches could fill the cap and hide the caller's.  The join is
+one indexed lookup per match (``localField`` with a ``pipeline`` needs
+MongoDB 5.0), so no list of visible ids is ever built.
+"""
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
+
+import config
+from codec import projection_for, with_defaults
+from database import db
+from models import RecordRequest
+
+# How much each source contributes to a request's rank
+SOURCE_WEIGHTS = {"request": 1.0, "requester": 0.8, "messages": 0.5}
+
+_SCORE = {"$meta": "textScore"}
+
+
+def visible_requests(base: dict, local_field: str, foreign_field: str) -> List[dict]:
+    """Stages keeping documents with a request ``base`` allows, listed under ``requests``."""
+    return [
+        {"$lookup": {
+            "from": "requests",
+            "localField": local_field,
+            "foreignField": foreign_field,
+            "pipeline": [{"$match": base}, {"$project": {"_id": 0, "id": 1}}],
+            "as": "requests",
+        }},
+        {"$match": {"requests": {"$ne": []}}},
+    ]
+
+
+def message_pipeline(text: str, base: dict, limit: int) -> List[dict]:
+    """The best-scoring visible messages, grouped to their request."""
+    return [
+        {"$match": {"$text": {"$search": text}}},
+        {"$addFields": {"score": _SCORE}},
+        *visible_requests(base, "request_id", "id"),
+        {"$project": {"_id": 0, "request_id": 1, "score": 1}},
+        {"$sort": {"score": -1}},
+        {"$limit": limit},
+        {"$group": {"_id": "$request_id", "score": {"$max": "$score"}, "hits": {"$sum": 1}}},
+    ]
+
+
+def requester_pipeline(text: str, base: dict, limit: int) -> List[dict]:
+    """The best-scoring requesters with visible requests, one row per request."""
+    return [
+        {"$match": {"$text": {"$search": text}, "role": "user"}},
+        {"$addFields": {"score": _SCORE}},
+        *visible_requests(base, "id", "user_id"),
+        {"$project": {"_id": 0, "score": 1, "requests": 1}},
+        {"$sort": {"score": -1}},
+        {"$limit": limit},
+        {"$unwind": "$requests"},
+        {"$limit": limit},
+        {"$project": {"request_id": "$requests.id", "score": 1}},
+    ]
+
+
+class SearchResults:
+    def __init__(self):
+        self.scores: Dict[str, float] = defaultdict(float)
+        self.matched: Dict[str, Set[str]] = defaultdict(set)
+        # True when a source hit the candidate cap, so the total is a lower bound
+        self.truncated = False
+
+    def add(self, source: str, request_id: str, score: float):
+        self.scores[request_id] += SOURCE_WEIGHTS[source] * score
+        self.matched[request_id].add(source)
+
+    def ranked(self) -> List[str]:
+        return sorted(self.scores, key=lambda request_id: (-self.scores[request_id], request_id))
+
+
+async def _match_requests(text: str, base: dict, results: SearchResults, limit: int):
+    cursor = db.requests.find(
+        {"$text": {"$search": text}, **base}, {"_id": 0, "id": 1, "score": _SCORE}
+    ).sort([("score", _SCORE)]).limit(limit)
+    hits = await cursor.to_list(None)
+    results.truncated |= len(hits) == limit
+    for hit in hits:
+        results.add("request", hit["id"], hit["score"])
+
+
+async def _match_messages(text: str, base: dict, results: SearchResults, limit: int):
+    best = await db.messages.aggregate(message_pipeline(text, base, limit)).to_list(None)
+    results.truncated |= sum(row["hits"] for row in best) == limit
+    for row in best:
+        results.add("messages", row["_id"], row["score"])
+
+
+async def _match_requesters(text: str, base: dict, results: SearchResults, limit: int):
+    rows = await db.users.aggregate(requester_pipeline(text, base, limit)).to_list(None)
+    results.truncated |= len(rows) == limit
+    for row in rows:
+        results.add("requester", row["request_id"], row["score"])
+
+
+async def search_requests(
+    text: str,
+    base_filter: dict,
+    *,
+    skip: int = 0,
+    limit: int = 20,
+    status: Optional[str] = None,
+    request_type: Optional[str] = None,
+) -> dict:
+    """One page of requests matching ``text``, best first.
+
+    ``base_filter`` restricts the requests the caller may see; ``status``
+    and ``request_type`` narrow them further.
+    """
+    base = dict(base_filter)
+    if status:
+        base["status"] = status
+    if request_type:
+        base["request_type"] = request_type
+
+    results = SearchResults()
+    candidates = config.SEARCH_MAX_CANDIDATES
+    await _match_requests(text, base, results, candidates)
+    await _match_messages(text, base, results, candidates)
+    await _match_requesters(text, base, results, candidates)
+
+    ranked = results.ranked()
+    page_ids = ranked[skip:skip + limit]
+    documents = {
+        request["id"]: request
+        for request in with_defaults(
+            RecordRequest, await db.requests.find({"id": {"$in": page_ids}}, projection_for(RecordRequest)).to_list(None)
+        )
+    }
+
+    page = []
+    for request_id in page_ids:
+        request = documents.get(request_id)
+        if request is None:
+            continue  # deleted since it matched
+        page.append({
+            **request,
+            "requester_name": request.get("requester_name") or "Unknown",
+            "requester_email": request.get("requester_email") or "Unknown",
+            "score": round(results.scores[request_id], 3),
+            "matched": sorted(results.matched[request_id]),
+        })
+
+    return {
+        "query": text,
+        "total": len(ranked),
+        "total_is_estimate": results.truncated,
+        "skip": skip,
+        "limit": limit,
+        "results": page,
+    }
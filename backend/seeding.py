@@ -0,0 +1,269 @@
+"""Synthetic datasets for benchmarks and load tests.
+
+Documents are built from the API models, so they have exactly the shape the
+routers write, and go to Mongo with ``insert_many`` in large batches.  Every
+random choice - ids and timestamps included - comes from one seeded
+generator, so the same ``SeedSpec`` reproduces the same dataset.
+"""
+import bisect
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+
+from auth import get_password_hash
+from codec import to_document
+from models import FileUpload, Message, Notification, RecordRequest, RequestStatus, RequestType, User, UserRole
+
+SEED_PASSWORD = "LoadTest123!"
+# Seeded accounts are <role><n>+seed@example.com; notification emails skip example.com
+SEED_EMAIL_PATTERN = r"\+seed@example\.com$"
+COLLECTIONS = ["users", "requests", "messages", "notifications", "files"]
+
+DEFAULT_STATUS_WEIGHTS = {"pending": 15, "assigned": 15, "in_progress": 25, "completed": 40, "denied": 5}
+DEFAULT_TYPE_WEIGHTS = {"incident_report": 30, "police_report": 25, "body_cam_footage": 15, "case_file": 20, "other": 10}
+DEFAULT_PRIORITY_WEIGHTS = {"low": 20, "medium": 50, "high": 20, "urgent": 10}
+
+FIRST_NAMES = ["James", "Maria", "Robert", "Linda", "Michael", "Aisha", "David", "Chen", "Sarah", "Carlos",
+               "Emily", "Kwame", "Laura", "Ahmed", "Grace", "Daniel", "Priya", "Thomas", "Olga", "Kevin"]
+LAST_NAMES = ["Smith", "Garcia", "Johnson", "Nguyen", "Williams", "Brown", "Okafor", "Miller", "Davis", "Lopez",
+              "Wilson", "Patel", "Anderson", "Kim", "Taylor", "Moore", "Jackson", "Martin", "Lee", "Walker"]
+
+# (original name, content type, size range) per request type; body cam footage is large video
+ATTACHMENTS = {
+    "body_cam_footage": ("footage.mp4", "video/mp4", (50_000_000, 2_000_000_000)),
+    "incident_report": ("incident_report.pdf", "application/pdf", (50_000, 5_000_000)),
+    "police_report": ("police_report.pdf", "application/pdf", (50_000, 5_000_000)),
+    "case_file": ("case_file.pdf", "application/pdf", (200_000, 20_000_000)),
+    "other": ("document.jpg", "image/jpeg", (100_000, 8_000_000)),
+}
+
+
+@dataclass
+class SeedSpec:
+    users: int = 1000
+    staff: int = 25
+    admins: int = 3
+    requests: int = 10_000
+    # Means; each request draws its own count around them
+    messages_per_request: float = 3.0
+    files_per_request: float = 1.0
+    notifications_per_request: float = 1.0
+    status_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_STATUS_WEIGHTS))
+    type_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TYPE_WEIGHTS))
+    priority_weights: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PRIORITY_WEIGHTS))
+    # Zipf exponents: 0 spreads evenly, 1 gives the busiest staff member ~1/H(n) of all assignments
+    staff_skew: float = 1.0
+    requester_skew: float = 0.5
+    # Requests are created over the ``days`` before ``until`` (default: today 00:00 UTC)
+    days: int = 365
+    until: Optional[datetime] = None
+    seed: int = 42
+    batch_size: int = 5000
+
+
+@dataclass
+class SeedResult:
+    # role -> list of (id, email, full_name)
+    accounts: Dict[str, List[tuple]] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+class _BatchWriter:
+    def __init__(self, collection, batch_size: int):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.pending = []
+        self.written = 0
+
+    async def add(self, document):
+        self.pending.append(document)
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        if self.pending:
+            await self.collection.insert_many(self.pending, ordered=False)
+            self.written += len(self.pending)
+            self.pending = []
+
+
+class _Weighted:
+    """Weighted choice with the cumulative table built once."""
+
+    def __init__(self, population: Sequence, weights: Sequence[float]):
+        if not population or sum(weights) <= 0:
+            raise ValueError("weights must include at least one positive value")
+        self.population = list(population)
+        self.cumulative = []
+        total = 0.0
+        for weight in weights:
+            total += weight
+            self.cumulative.append(total)
+        self.total = total
+
+    def pick(self, rng: random.Random):
+        return self.population[bisect.bisect(self.cumulative, rng.random() * self.total)]
+
+
+def _enum_weights(enum_cls, weights: Dict[str, float]) -> _Weighted:
+    values = {member.value for member in enum_cls}
+    unknown = set(weights) - values
+    if unknown:
+        raise ValueError(f"unknown {enum_cls.__name__} values: {', '.join(sorted(unknown))}")
+    members = [member for member in enum_cls if weights.get(member.value, 0) > 0]
+    return _Weighted(members, [weights[member.value] for member in members])
+
+
+def _zipf(population: Sequence, skew: float) -> _Weighted:
+    return _Weighted(population, [1 / (rank + 1) ** skew for rank in range(len(population))])
+
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """Parse ``"pending=10,completed=60"`` into a weight mapping."""
+    weights = {}
+    for item in text.split(","):
+        if not item.strip():
+            continue
+        name, _, value = item.partition("=")
+        weights[name.strip()] = float(value)
+    return weights
+
+
+async def seed_database(db, spec: SeedSpec, *, drop: bool = False) -> SeedResult:
+    rng = random.Random(spec.seed)
+    until = spec.until or datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    window = spec.days * 86400
+    result = SeedResult()
+    statuses = _enum_weights(RequestStatus, spec.status_weights)
+    types = _enum_weights(RequestType, spec.type_weights)
+    priorities = _Weighted(list(spec.priority_weights), list(spec.priority_weights.values()))
+
+    def new_id() -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def before(moment: datetime, seconds: float) -> datetime:
+        return moment - timedelta(seconds=rng.random() * seconds)
+
+    if drop:
+        for name in COLLECTIONS:
+            await db[name].drop()
+
+    # bcrypt is deliberately slow; every seeded account shares one hash
+    hashed_password = get_password_hash(SEED_PASSWORD)
+    user_writer = _BatchWriter(db.users, spec.batch_size)
+    for role, count in ((UserRole.USER, spec.users), (UserRole.STAFF, spec.staff), (UserRole.ADMIN, spec.admins)):
+        result.accounts[role.value] = []
+        for i in range(count):
+            email = f"{role.value}{i}+seed@example.com"
+            full_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            user = User(id=new_id(), email=email, full_name=full_name, role=role,
+                        created_at=before(until, window + 30 * 86400))
+            document = to_document(user)
+            document["hashed_password"] = hashed_password
+            await user_writer.add(document)
+            result.accounts[role.value].append((user.id, email, full_name))
+    await user_writer.flush()
+
+    citizens = result.accounts[UserRole.USER.value]
+    staff_members = result.accounts[UserRole.STAFF.value]
+    if spec.requests and not citizens:
+        raise ValueError("requests need at least one citizen account")
+    requesters = _zipf(citizens, spec.requester_skew) if citizens else None
+    assignees = _zipf(staff_members, spec.staff_skew) if staff_members else None
+
+    request_writer = _BatchWriter(db.requests, spec.batch_size)
+    message_writer = _BatchWriter(db.messages, spec.batch_size)
+    file_writer = _BatchWriter(db.files, spec.batch_size)
+    notification_writer = _BatchWriter(db.notifications, spec.batch_size)
+
+    for i in range(spec.requests):
+        requester_id, requester_email, requester_name = requesters.pick(rng)
+        created_at = before(until, window)
+        status = statuses.pick(rng)
+        request_type = types.pick(rng)
+        staff = assignees.pick(rng) if assignees and status != RequestStatus.PENDING else None
+        title = f"{request_type.value.replace('_', ' ').title()} request #{i}"
+        request = RecordRequest(
+            id=new_id(),
+            user_id=requester_id,
+            title=title,
+            description=f"Please provide all records related to case {rng.randint(1000, 99999)}. " * rng.randint(1, 4),
+            request_type=request_type,
+            status=status,
+            priority=priorities.pick(rng),
+            assigned_staff_id=staff[0] if staff else None,
+            requester_name=requester_name,
+            requester_email=requester_email,
+            assigned_staff_name=staff[2] if staff else None,
+            assigned_staff_email=staff[1] if staff else None,
+            created_at=created_at,
+            updated_at=created_at + timedelta(hours=rng.randint(0, 720)) if status != RequestStatus.PENDING else created_at,
+        )
+
+        for _ in range(_count(rng, spec.messages_per_request)):
+            from_staff = staff is not None and rng.random() < 0.5
+            message = Message(
+                id=new_id(),
+                request_id=request.id,
+                sender_id=staff[0] if from_staff else requester_id,
+                sender_name=staff[2] if from_staff else requester_name,
+                sender_role=UserRole.STAFF if from_staff else UserRole.USER,
+                content="Following up on this request. " * rng.randint(1, 4),
+                created_at=created_at + timedelta(minutes=rng.randint(1, 20000)),
+            )
+            await message_writer.add(to_document(message))
+            request.message_count += 1
+            request.last_message_at = max(request.last_message_at or message.created_at, message.created_at)
+
+        original_name, content_type, (smallest, largest) = ATTACHMENTS[request_type.value]
+        for _ in range(_count(rng, spec.files_per_request)):
+            file_id = new_id()
+            file_record = FileUpload(
+                id=file_id,
+                request_id=request.id,
+                filename=f"{file_id}.{original_name.rsplit('.', 1)[1]}",
+                original_name=original_name,
+                file_size=rng.randint(smallest, largest),
+                content_type=content_type,
+                uploaded_by=staff[0] if staff and rng.random() < 0.7 else requester_id,
+                uploaded_at=created_at + timedelta(minutes=rng.randint(0, 20000)),
+            )
+            await file_writer.add(to_document(file_record))
+            request.file_count += 1
+        # Written after its thread and files so the denormalized counters are complete
+        await request_writer.add(to_document(request))
+
+        for _ in range(_count(rng, spec.notifications_per_request)):
+            if staff and rng.random() < 0.3:
+                notification = Notification(
+                    id=new_id(), user_id=staff[0], title="Request Assigned",
+                    message=f"You have been assigned request: {title}",
+                )
+            else:
+                notification = Notification(
+                    id=new_id(), user_id=requester_id, title="Request Status Updated",
+                    message=f"Your request '{title}' status changed to {status.value.replace('_', ' ').title()}",
+                )
+            notification.is_read = rng.random() < 0.7
+            notification.created_at = created_at + timedelta(minutes=rng.randint(0, 20000))
+            await notification_writer.add(to_document(notification))
+
+    for writer in (request_writer, message_writer, file_writer, notification_writer):
+        await writer.flush()
+
+    result.counts = {
+        "users": user_writer.written,
+        "requests": request_writer.written,
+        "messages": message_writer.written,
+        "files": file_writer.written,
+        "notifications": notification_writer.written,
+    }
+    return result
+
+
+def _count(rng: random.Random, mean: float) -> int:
+    """Integer draw with the given mean (floor plus a Bernoulli remainder)."""
+    whole = int(mean)
+    return whole + (1 if rng.random() < mean - whole else 0)
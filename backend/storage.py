@@ -0,0 +1,507 @@
+"""Where upload blobs physically live.
+
+``blobstore`` decides *what* is stored (content-addressed, reference
+counted); a backend here decides *where*:
+
+* ``LocalStorage`` - ``UPLOAD_DIR`` on this host, in a two-level fan-out
+  (``ab/cd/abcd...``); downloads are sent by the API worker or, with
+  ``DOWNLOAD_OFFLOAD``, by the reverse proxy.
+* ``S3Storage`` - an S3-compatible bucket (AWS, MinIO, ...).  Uploads are
+  streamed into it as multipart uploads and downloads redirect to a
+  short-lived presigned URL, so file bytes never pass through the API
+  and any number of hosts can share the store.
+
+``STORAGE_BACKEND`` picks one and ``get_storage()`` returns it.  Backend
+methods block (filesystem calls, boto3); call them through
+``asyncio.to_thread``.  Each backend has three areas: blobs, *incoming*
+(uploads in progress) and *quarantine* (blobs set aside by ``release``
+and the reconciler, restorable until purged), plus the *previews*
+rendered from blobs (previews.py), stored under the blob's name.
+"""
+import logging
+import os
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi.responses import FileResponse, RedirectResponse, Response
+
+import config
+
+logger = logging.getLogger(__name__)
+
+INCOMING_DIR = ".incoming"
+QUARANTINE_DIR = ".quarantine"
+PREVIEW_DIR = ".previews"
+
+
+def is_shard(name: str) -> bool:
+    return len(name) == 2 and all(char in "0123456789abcdef" for char in name)
+
+
+def content_disposition(filename: str) -> str:
+    """``attachment`` header for ``filename``, RFC 6266-encoded unless it is plain ASCII."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def _in_range(name: str, low: Optional[str], high: Optional[str]) -> bool:
+    return not ((low and name < low) or (high and name >= high))
+
+
+class LocalStorage:
+    """Blobs under ``UPLOAD_DIR``.
+
+    Uploads from before the fan-out sit directly in ``UPLOAD_DIR`` until
+    ``cli.py migrate-uploads`` moves them; ``locate`` finds either.
+
+    With ``DOWNLOAD_OFFLOAD`` set, a download response carries only headers
+    and the reverse proxy sends the file itself (sendfile, no copy through
+    Python).  For nginx, ``DOWNLOAD_OFFLOAD_PREFIX`` must be an internal
+    location aliasing ``UPLOAD_DIR``::
+
+        location /protected-uploads/ {
+            internal;
+            alias /app/backend/uploads/;
+        }
+    """
+
+    lists_sorted = False
+
+    @property
+    def root(self) -> Path:
+        return config.UPLOAD_DIR
+
+    def blob_path(self, name: str) -> Path:
+        return self.root / name[:2] / name[2:4] / name
+
+    def locate(self, name: str) -> Optional[Path]:
+        """The blob's path in either layout, or None if it is in neither."""
+        sharded = self.blob_path(name)
+        flat = self.root / name
+        # Sharded again last: the migration may move it between the first two checks
+        for path in (sharded, flat, sharded):
+            if path.is_file():
+                return path
+        return None
+
+    # Uploads
+
+    def open_incoming(self) -> "_LocalWriter":
+        incoming = self.root / INCOMING_DIR
+        incoming.mkdir(parents=True, exist_ok=True)
+        return _LocalWriter(incoming / str(uuid.uuid4()))
+
+    def publish(self, ref: str, name: str) -> bool:
+        """Move an incoming upload into place; True if ``name`` was already stored."""
+        if self.locate(name):
+            Path(ref).unlink(missing_ok=True)
+            return True
+        target = self.blob_path(name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(ref, target)
+        return False
+
+    def discard(self, ref: str):
+        Path(ref).unlink(missing_ok=True)
+
+    # Downloads
+
+    def open(self, name: str) -> Optional[BinaryIO]:
+        """The blob for reading, or None if it doesn't exist."""
+        path = self.locate(name)
+        try:
+            return open(path, "rb") if path else None
+        except FileNotFoundError:
+            return None
+
+    def download_response(self, name: str, filename: str, content_type: str):
+        path = self.locate(name)
+        if path is None:
+            return None
+        if config.DOWNLOAD_OFFLOAD == "nginx":
+            target = {"X-Accel-Redirect": config.DOWNLOAD_OFFLOAD_PREFIX + quote(path.relative_to(self.root).as_posix())}
+        elif config.DOWNLOAD_OFFLOAD == "sendfile":
+            target = {"X-Sendfile": str(path.resolve())}
+        else:
+            return FileResponse(path=path, filename=filename, media_type=content_type)
+        return Response(media_type=content_type, headers={**target, "Content-Disposition": content_disposition(filename)})
+
+    def presigned_url(self, name: str, filename: str, content_type: str) -> Optional[str]:
+        return None
+
+    # Lifecycle
+
+    def stat(self, name: str) -> Optional[Tuple[float, int]]:
+        """(modified time, size) of a blob, or None if it doesn't exist."""
+        path = self.locate(name)
+        try:
+            result = path.stat() if path else None
+        except FileNotFoundError:
+            return None
+        return (result.st_mtime, result.st_size) if result else None
+
+    def quarantine(self, name: str) -> bool:
+        path = self.locate(name)
+        if path is None:
+            return False
+        target = self.root / QUARANTINE_DIR / name
+        target.parent.mkdir(exist_ok=True)
+        try:
+            os.replace(path, target)
+        except FileNotFoundError:
+            return False
+        # The purge counts from the move, not from the upload
+        os.utime(target)
+        return True
+
+    def is_quarantined(self, name: str) -> bool:
+        return (self.root / QUARANTINE_DIR / name).is_file()
+
+    def restore(self, name: str) -> bool:
+        target = self.blob_path(name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(self.root / QUARANTINE_DIR / name, target)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete_quarantined(self, name: str):
+        (self.root / QUARANTINE_DIR / name).unlink(missing_ok=True)
+
+    # Previews
+
+    def _preview_path(self, name: str) -> Path:
+        return self.root / PREVIEW_DIR / name[:2] / name[2:4] / f"{name}.jpg"
+
+    def has_preview(self, name: str) -> bool:
+        return self._preview_path(name).is_file()
+
+    def put_preview(self, name: str, data: bytes):
+        target = self._preview_path(name)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        partial = target.with_name(f"{target.name}.{uuid.uuid4()}")
+        partial.write_bytes(data)
+        os.replace(partial, target)
+
+    def read_preview(self, name: str) -> Optional[bytes]:
+        try:
+            return self._preview_path(name).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def delete_preview(self, name: str):
+        self._preview_path(name).unlink(missing_ok=True)
+
+    def list_names(self, low: Optional[str], high: Optional[str]) -> Iterator[str]:
+        """Blob names in ``[low, high)``, from the fan-out and the old flat layout (unsorted)."""
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or not _in_range(name, low, high):
+                    continue
+                if entry.is_file():
+                    yield name
+                elif is_shard(name) and entry.is_dir():
+                    with os.scandir(entry.path) as shards:
+                        for shard in shards:
+                            if is_shard(shard.name) and shard.is_dir():
+                                with os.scandir(shard.path) as blobs:
+                                    yield from (blob.name for blob in blobs if blob.is_file())
+
+    def purge(self, quarantined_before: float, incoming_before: float) -> int:
+        return (
+            self._purge(self.root / QUARANTINE_DIR, quarantined_before)
+            + self._purge(self.root / INCOMING_DIR, incoming_before)
+        )
+
+    @staticmethod
+    def _purge(directory: Path, cutoff: float) -> int:
+        if not directory.is_dir():
+            return 0
+        purged = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    purged += 1
+        return purged
+
+    def migrate_flat_batch(self, batch_size: int) -> int:
+        """Move up to ``batch_size`` uploads from the flat layout into the fan-out."""
+        names = []
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if not entry.name.startswith(".") and entry.is_file():
+                    names.append(entry.name)
+                    if len(names) >= batch_size:
+                        break
+        moved = 0
+        for name in names:
+            target = self.blob_path(name)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(self.root / name, target)
+                moved += 1
+            except FileNotFoundError:
+                pass  # released meanwhile
+        return moved
+
+
+class _LocalWriter:
+    def __init__(self, path: Path):
+        self.ref = str(path)
+        self._file = open(path, "wb")
+
+    def write(self, chunk: bytes):
+        self._file.write(chunk)
+
+    def close(self):
+        self._file.close()
+
+    def abort(self):
+        self._file.close()
+        Path(self.ref).unlink(missing_ok=True)
+
+
+class S3Storage:
+    """Blobs as objects ``<prefix>blobs/<name>`` in ``S3_BUCKET``.
+
+    S3 spreads load by key prefix on its own, so there is no fan-out.
+    Listing returns keys in order, which the reconciler uses directly.
+    """
+
+    lists_sorted = True
+
+    def __init__(self):
+        import boto3  # Only S3 deployments pay for importing boto3
+        from botocore.config import Config
+
+        endpoint = config.S3_ENDPOINT_URL or None
+        if endpoint == "moto://":
+            # In-process stand-in for local experiments (dev dependency)
+            from moto import mock_aws
+
+            self._mock = mock_aws()
+            self._mock.start()
+            endpoint = None
+            logger.warning("Using in-process moto S3; data is not persisted")
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint,
+            region_name=config.S3_REGION or None,
+            config=Config(signature_version="s3v4", retries={"mode": "standard"}),
+        )
+        self.bucket = config.S3_BUCKET
+        if endpoint is None and config.S3_ENDPOINT_URL == "moto://":
+            self.client.create_bucket(Bucket=self.bucket)
+        self._blobs = f"{config.S3_PREFIX}blobs/"
+        self._incoming = f"{config.S3_PREFIX}incoming/"
+        self._quarantine = f"{config.S3_PREFIX}quarantine/"
+        self._previews = f"{config.S3_PREFIX}previews/"
+
+    def _head(self, key: str) -> Optional[dict]:
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _get(self, key: str) -> Optional[BinaryIO]:
+        from botocore.exceptions import ClientError
+
+        try:
+            return self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    def _move(self, source: str, target: str) -> bool:
+        if self._head(source) is None:
+            return False
+        # Managed copy: switches to a multipart copy above 5 GB
+        self.client.copy({"Bucket": self.bucket, "Key": source}, self.bucket, target)
+        self.client.delete_object(Bucket=self.bucket, Key=source)
+        return True
+
+    # Uploads
+
+    def open_incoming(self) -> "_S3Writer":
+        return _S3Writer(self.client, self.bucket, f"{self._incoming}{uuid.uuid4()}", config.S3_PART_SIZE_MB * 1024 * 1024)
+
+    def publish(self, ref: str, name: str) -> bool:
+        if self._head(self._blobs + name) is not None:
+            self.client.delete_object(Bucket=self.bucket, Key=ref)
+            return True
+        self._move(ref, self._blobs + name)
+        return False
+
+    def discard(self, ref: str):
+        self.client.delete_object(Bucket=self.bucket, Key=ref)
+
+    # Downloads
+
+    def open(self, name: str) -> Optional[BinaryIO]:
+        return self._get(self._blobs + name)
+
+    def presigned_url(self, name: str, filename: str, content_type: str) -> Optional[str]:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": self.bucket,
+                "Key": self._blobs + name,
+                "ResponseContentDisposition": content_disposition(filename),
+                "ResponseContentType": content_type,
+            },
+            ExpiresIn=config.S3_PRESIGN_SECONDS,
+        )
+
+    def download_response(self, name: str, filename: str, content_type: str):
+        if self._head(self._blobs + name) is None:
+            return None
+        return RedirectResponse(self.presigned_url(name, filename, content_type), status_code=307)
+
+    # Lifecycle
+
+    def stat(self, name: str) -> Optional[Tuple[float, int]]:
+        head = self._head(self._blobs + name)
+        return (head["LastModified"].timestamp(), head["ContentLength"]) if head else None
+
+    def quarantine(self, name: str) -> bool:
+        return self._move(self._blobs + name, self._quarantine + name)
+
+    def is_quarantined(self, name: str) -> bool:
+        return self._head(self._quarantine + name) is not None
+
+    def restore(self, name: str) -> bool:
+        return self._move(self._quarantine + name, self._blobs + name)
+
+    def delete_quarantined(self, name: str):
+        self.client.delete_object(Bucket=self.bucket, Key=self._quarantine + name)
+
+    # Previews
+
+    def has_preview(self, name: str) -> bool:
+        return self._head(f"{self._previews}{name}.jpg") is not None
+
+    def put_preview(self, name: str, data: bytes):
+        self.client.put_object(Bucket=self.bucket, Key=f"{self._previews}{name}.jpg", Body=data, ContentType="image/jpeg")
+
+    def read_preview(self, name: str) -> Optional[bytes]:
+        body = self._get(f"{self._previews}{name}.jpg")
+        if body is None:
+            return None
+        with closing(body):
+            return body.read()
+
+    def delete_preview(self, name: str):
+        self.client.delete_object(Bucket=self.bucket, Key=f"{self._previews}{name}.jpg")
+
+    def list_names(self, low: Optional[str], high: Optional[str]) -> Iterator[str]:
+        """Blob names in ``[low, high)``, in key order."""
+        kwargs = {"Bucket": self.bucket, "Prefix": self._blobs}
+        if low:
+            # Exclusive; blob names are never a single character
+            kwargs["StartAfter"] = self._blobs + low
+        for page in self.client.get_paginator("list_objects_v2").paginate(**kwargs):
+            for item in page.get("Contents", []):
+                name = item["Key"][len(self._blobs):]
+                if high and name >= high:
+                    return
+                yield name
+
+    def purge(self, quarantined_before: float, incoming_before: float) -> int:
+        purged = self._purge_objects(self._quarantine, quarantined_before)
+        purged += self._purge_objects(self._incoming, incoming_before)
+        # Multipart uploads that were never completed or aborted still hold their parts
+        paginator = self.client.get_paginator("list_multipart_uploads")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._incoming):
+            for upload in page.get("Uploads", []):
+                if upload["Initiated"].timestamp() < incoming_before:
+                    self.client.abort_multipart_upload(Bucket=self.bucket, Key=upload["Key"], UploadId=upload["UploadId"])
+                    purged += 1
+        return purged
+
+    def _purge_objects(self, prefix: str, cutoff: float) -> int:
+        stale: List[dict] = []
+        for page in self.client.get_paginator("list_objects_v2").paginate(Bucket=self.bucket, Prefix=prefix):
+            stale.extend({"Key": item["Key"]} for item in page.get("Contents", []) if item["LastModified"].timestamp() < cutoff)
+        for start in range(0, len(stale), 1000):
+            self.client.delete_objects(Bucket=self.bucket, Delete={"Objects": stale[start:start + 1000], "Quiet": True})
+        return len(stale)
+
+
+class _S3Writer:
+    """Streams an upload into a multipart upload, one ``part_size`` part at a time.
+
+    Uploads smaller than one part skip the multipart machinery and go up
+    in a single ``put_object``.
+    """
+
+    def __init__(self, client, bucket: str, key: str, part_size: int):
+        self.ref = key
+        self._client = client
+        self._bucket = bucket
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._upload_id = None
+        self._parts = []
+
+    def write(self, chunk: bytes):
+        self._buffer += chunk
+        while len(self._buffer) >= self._part_size:
+            self._send_part(bytes(self._buffer[:self._part_size]))
+            del self._buffer[:self._part_size]
+
+    def _send_part(self, body: bytes):
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(Bucket=self._bucket, Key=self.ref)["UploadId"]
+        number = len(self._parts) + 1
+        response = self._client.upload_part(
+            Bucket=self._bucket, Key=self.ref, UploadId=self._upload_id, PartNumber=number, Body=body
+        )
+        self._parts.append({"PartNumber": number, "ETag": response["ETag"]})
+
+    def close(self):
+        if self._upload_id is None:
+            self._client.put_object(Bucket=self._bucket, Key=self.ref, Body=bytes(self._buffer))
+            return
+        if self._buffer:
+            self._send_part(bytes(self._buffer))
+            self._buffer.clear()
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket, Key=self.ref, UploadId=self._upload_id, MultipartUpload={"Parts": self._parts}
+        )
+
+    def abort(self):
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(Bucket=self._bucket, Key=self.ref, UploadId=self._upload_id)
+
+
+_storage = None
+
+
+def get_storage():
+    """The configured backend, created on first use."""
+    global _storage
+    if _storage is None:
+        if config.STORAGE_BACKEND == "s3":
+            if not config.S3_BUCKET:
+                raise RuntimeError("STORAGE_BACKEND=s3 needs S3_BUCKET")
+            _storage = S3Storage()
+        elif config.STORAGE_BACKEND == "local":
+            if config.DOWNLOAD_OFFLOAD not in ("", "nginx", "sendfile"):
+                raise RuntimeError(f"Unknown DOWNLOAD_OFFLOAD {config.DOWNLOAD_OFFLOAD!r}")
+            _storage = LocalStorage()
+        else:
+            raise RuntimeError(f"Unknown STORAGE_BACKEND {config.STORAGE_BACKEND!r}")
+    return _storage
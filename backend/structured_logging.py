@@ -0,0 +1,162 @@
+"""Structured logging with per-request correlation ids.
+
+* Every record carries the ``correlation_id`` of the HTTP request that
+  produced it (taken from an incoming ``X-Request-ID`` header or generated),
+  including records logged later by background email jobs and PDF threads.
+* Records are handed to a ``QueueHandler``; formatting and writing happen on
+  a ``QueueListener`` thread, so a slow stdout/stderr never stalls the
+  event loop.
+* ``LOG_SAMPLE_RATES`` keeps a fraction of below-WARNING records for noisy
+  routes.  The decision is made once per request, so a sampled request keeps
+  all of its lines.
+"""
+import atexit
+import logging
+import random
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+import orjson
+
+import config
+from metrics import route_template
+
+correlation_id: ContextVar[str] = ContextVar("correlation_id", default="-")
+log_sampled: ContextVar[bool] = ContextVar("log_sampled", default=True)
+
+REQUEST_ID_HEADER = b"x-request-id"
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "correlation_id"}
+
+_listener = None
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamps the correlation id and applies per-request sampling.
+
+    Runs on the logging thread (before the record is queued), where the
+    request's context variables are visible.
+    """
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING and not log_sampled.get():
+            return False
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "correlation_id": getattr(record, "correlation_id", "-"),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return orjson.dumps(entry, default=str).decode()
+
+
+class _QueueHandler(QueueHandler):
+    """Keeps the traceback separate instead of folding it into the message."""
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+def setup_logging():
+    """Route all logging (including uvicorn's) through one queue.  Idempotent."""
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if config.LOG_FORMAT == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - [%(correlation_id)s] %(message)s'
+        ))
+
+    queue = SimpleQueue()
+    queue_handler = _QueueHandler(queue)
+    queue_handler.addFilter(CorrelationFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(config.LOG_LEVEL)
+    # uvicorn installs its own stream handlers; send its records through ours
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    _listener = QueueListener(queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flush the queue and stop the listener thread; later records are written directly."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    logging.getLogger().handlers = list(listener.handlers)
+
+
+class CorrelationIdMiddleware:
+    """Sets the correlation id (and sampling decision) for each HTTP request.
+
+    The id is echoed back in the ``X-Request-ID`` response header.  The
+    context variables are deliberately not reset, so uvicorn's access log
+    line for the request - emitted in the same task - still carries them.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == REQUEST_ID_HEADER:
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        correlation_id.set(request_id)
+        log_sampled.set(self._sampled(scope))
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [(REQUEST_ID_HEADER, request_id.encode("latin-1"))]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _sampled(scope) -> bool:
+        if not config.LOG_SAMPLE_RATES:
+            return True
+        rate = config.LOG_SAMPLE_RATES.get(route_template(scope))
+        return rate is None or random.random() < rate
@@ -0,0 +1,78 @@
+"""Atomic status and assignment changes on a single request.
+
+``transition`` applies a change with one ``find_one_and_update`` and
+returns the document as it was *before* the change.  The caller needs the
+old status for notifications and the assignment queue, and the title and
+requester for emails.  The preconditions go in the filter, so no other
+write can land between the check and the update:
+
+* ``staff_id``: the request must still be assigned to that staff member;
+* ``version``: the request must not have changed since the caller read it.
+
+Every status or assignment change increments ``version``.  Clients that
+send back the version they loaded get a 409 if someone else changed the
+request meanwhile, instead of silently overwriting that change.  The
+version is optional, so older clients keep last-write-wins.
+"""
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+from database import db
+
+
+def version_filter(version: int):
+    # Requests written before the field existed have no version; treat it as 0
+    return version if version else {"$in": [0, None]}
+
+
+async def transition(
+    request_id: str,
+    changes: dict,
+    projection: dict,
+    *,
+    version: Optional[int] = None,
+    staff_id: Optional[str] = None,
+) -> dict:
+    """``$set`` ``changes`` on a request and return it as it was before.
+
+    Raises 404 if the request doesn't exist, 403 if ``staff_id`` is given
+    and the request isn't assigned to them, and 409 if ``version`` is given
+    and no longer current.
+    """
+    query = {"id": request_id}
+    if staff_id is not None:
+        query["assigned_staff_id"] = staff_id
+    if version is not None:
+        query["version"] = version_filter(version)
+
+    before = await db.requests.find_one_and_update(
+        query,
+        {
+            "$set": {**changes, "updated_at": datetime.now(timezone.utc).isoformat()},
+            "$inc": {"version": 1},
+        },
+        projection={**projection, "version": 1},
+        return_document=ReturnDocument.BEFORE,
+    )
+    if before is not None:
+        before.setdefault("version", 0)
+        return before
+
+    # Only a failed transition pays for a second read, to say why it failed
+    current = await db.requests.find_one({"id": request_id}, {"_id": 0, "assigned_staff_id": 1})
+    if current is None:
+        raise HTTPException(status_code=404, detail="Request not found")
+    if staff_id is not None and current.get("assigned_staff_id") != staff_id:
+        raise HTTPException(status_code=403, detail="Can only update assigned requests")
+    raise HTTPException(status_code=409, detail="Request was changed by someone else; reload it and try again")
+
+
+async def requester_of(request: dict) -> Optional[dict]:
+    """The requester's ``id``, ``email`` and ``full_name``, from the request when denormalized."""
+    if request.get("requester_email"):
+        return {"id": request["user_id"], "email": request["requester_email"], "full_name": request.get("requester_name")}
+    # Written before denormalize.py; repair() fills these in
+    return await db.users.find_one({"id": request["user_id"]}, {"_id": 0, "id": 1, "email": 1, "full_name": 1})
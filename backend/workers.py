@@ -0,0 +1,156 @@
+"""Background workers started and stopped by the app lifespan.
+
+* ``email_worker`` sends notification emails off the request path.
+* ``background_jobs`` runs slower database maintenance (e.g. propagating a
+  renamed user into their requests) after the response has gone out.
+* ``preview_jobs`` renders thumbnails of new uploads (previews.py).
+* ``periodic_tasks`` run housekeeping jobs (see ``run_cleanup``), resync
+  the assignment queue and reconcile uploads with their records on an
+  interval.  Every process runs them; reconciliation takes a lease
+  (leases.py) so only one process does each tick.
+"""
+import asyncio
+import logging
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+
+import config
+from assignment import assignment_engine
+from database import db
+from denormalize import backfill
+from reconcile import storage_reconciler
+from structured_logging import correlation_id
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """Queue of async jobs drained by a small pool of tasks.
+
+    Handlers ``await email_worker.submit(send_fn, *args)``, which only blocks
+    when the queue is full.  When the worker isn't running (scripts that
+    call handlers without the app lifespan) the job is awaited inline.
+    Jobs run under the correlation id of the request that queued them.
+    """
+
+    def __init__(self, name: str, maxsize: int, concurrency: int = 2):
+        self.name = name
+        self._maxsize = maxsize
+        self._concurrency = concurrency
+        self._queue = None
+        self._tasks = []
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, func, *args, **kwargs):
+        if self._queue is None:
+            await self._run_job(func, args, kwargs)
+            return
+        await self._queue.put((func, args, kwargs, correlation_id.get()))
+
+    def start(self):
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._tasks = [asyncio.create_task(self._consume()) for _ in range(self._concurrency)]
+
+    async def stop(self, timeout: float):
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d unfinished %s jobs at shutdown", self._queue.qsize(), self.name)
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._queue = None
+        self._tasks = []
+
+    async def _consume(self):
+        while True:
+            func, args, kwargs, request_id = await self._queue.get()
+            token = correlation_id.set(request_id)
+            try:
+                await self._run_job(func, args, kwargs)
+            finally:
+                correlation_id.reset(token)
+                self._queue.task_done()
+
+    async def _run_job(self, func, args, kwargs):
+        try:
+            await func(*args, **kwargs)
+        except Exception:
+            logger.exception("%s job %s failed", self.name, func.__name__)
+
+
+class PeriodicTask:
+    """Runs ``func`` every ``interval`` seconds until stopped."""
+
+    def __init__(self, name: str, interval: float, func):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run(), name=self.name)
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.func()
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
+
+
+async def run_cleanup():
+    """Housekeeping: purge read notifications past the retention window."""
+    if config.NOTIFICATION_RETENTION_DAYS <= 0:
+        return
+    cutoff = datetime.now(timezone.utc) - timedelta(days=config.NOTIFICATION_RETENTION_DAYS)
+    result = await db.notifications.delete_many({"is_read": True, "created_at": {"$lt": cutoff.isoformat()}})
+    if result.deleted_count:
+        logger.info("Cleanup removed %d read notifications", result.deleted_count)
+
+
+email_worker = JobQueue("email", config.EMAIL_QUEUE_SIZE)
+# One at a time: these jobs are bulk writes and shouldn't compete with requests
+background_jobs = JobQueue("background", config.BACKGROUND_QUEUE_SIZE, concurrency=1)
+preview_jobs = JobQueue("preview", config.PREVIEW_QUEUE_SIZE, concurrency=config.PREVIEW_WORKERS)
+
+periodic_tasks = [
+    PeriodicTask("cleanup", config.CLEANUP_INTERVAL_SECONDS, run_cleanup),
+    PeriodicTask("assignment-queue", config.AUTO_ASSIGN_REBUILD_SECONDS, assignment_engine.rebuild),
+]
+if config.RECONCILE_INTERVAL_SECONDS > 0:
+    periodic_tasks.append(PeriodicTask("storage-reconcile", config.RECONCILE_INTERVAL_SECONDS, storage_reconciler.run_next_slice))
+
+
+async def start():
+    email_worker.start()
+    background_jobs.start()
+    preview_jobs.start()
+    # Requests written before the denormalized fields existed (one process, once)
+    await background_jobs.submit(backfill)
+    for task in periodic_tasks:
+        task.start()
+
+
+async def stop():
+    for task in periodic_tasks:
+        await task.stop()
+    await email_worker.stop(config.SHUTDOWN_DRAIN_SECONDS)
+    await background_jobs.stop(config.SHUTDOWN_DRAIN_SECONDS)
+    await preview_jobs.stop(config.SHUTDOWN_DRAIN_SECONDS)
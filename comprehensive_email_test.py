@@ -1,107 +0,0 @@
-#!/usr/bin/env python3
-"""
-Comprehensive email system test
-"""
-import requests
-import json
-import time
-
-def test_complete_email_workflow():
-    base_url = "https://request-hub-6.preview.emergentagent.com/api"
-    
-    print("🔍 COMPREHENSIVE EMAIL SYSTEM TEST")
-    print("=" * 60)
-    
-    # Test 1: Direct test email
-    print("📧 1. TESTING DIRECT EMAIL FUNCTIONALITY...")
-    
-    # Login as admin
-    admin_login = {
-        "email": "request@shakerpd.com",
-        "password": "AdminTest123!"
-    }
-    
-    login_response = requests.post(f"{base_url}/auth/login", json=admin_login)
-    if login_response.status_code == 200:
-        token = login_response.json()["access_token"]
-        headers = {"Authorization": f"Bearer {token}"}
-        
-        # Send test email
-        email_response = requests.post(f"{base_url}/test-email", headers=headers)
-        print(f"   Direct email test: {email_response.status_code}")
-        if email_response.status_code == 200:
-            print(f"   ✅ Response: {email_response.json()}")
-        else:
-            print(f"   ❌ Failed: {email_response.text}")
-    else:
-        print("   ❌ Admin login failed")
-        return
-    
-    # Test 2: Create new request to trigger notification
-    print("\n📝 2. TESTING REQUEST CREATION EMAIL NOTIFICATION...")
-    
-    # Create citizen user
-    timestamp = int(time.time())
-    citizen_data = {
-        "email": f"testcitizen{timestamp}@test.com",
-        "password": "Test123!",
-        "full_name": "Test Citizen",
-        "role": "user"
-    }
-    
-    citizen_register = requests.post(f"{base_url}/auth/register", json=citizen_data)
-    citizen_login = requests.post(f"{base_url}/auth/login", json={
-        "email": citizen_data["email"],
-        "password": citizen_data["password"]
-    })
-    
-    if citizen_login.status_code == 200:
-        citizen_token = citizen_login.json()["access_token"]
-        citizen_headers = {"Authorization": f"Bearer {citizen_token}"}
-        
-        # Create request that should trigger admin notification
-        request_data = {
-            "title": "Email Test Request - Comprehensive Check",
-            "description": "This request is created to test if admin email notifications are working properly.",
-            "request_type": "police_report",
-            "case_number": "24-999999",
-            "priority": "medium"
-        }
-        
-        request_response = requests.post(f"{base_url}/requests", json=request_data, headers=citizen_headers)
-        print(f"   Request creation: {request_response.status_code}")
-        
-        if request_response.status_code == 200:
-            request_id = request_response.json()["id"]
-            print(f"   ✅ Request created: {request_id}")
-            print(f"   📧 Admin notification should be sent to: request@shakerpd.com")
-        else:
-            print(f"   ❌ Request creation failed: {request_response.text}")
-    else:
-        print("   ❌ Citizen login failed")
-    
-    # Test 3: Check email configuration endpoint (if exists)
-    print("\n⚙️ 3. CHECKING EMAIL CONFIGURATION...")
-    try:
-        config_response = requests.get(f"{base_url}/admin/email-config", headers=headers)
-        if config_response.status_code == 200:
-            print(f"   ✅ Email config accessible")
-            print(f"   Config: {config_response.json()}")
-        else:
-            print(f"   ⚠️ Email config endpoint not available: {config_response.status_code}")
-    except:
-        print("   ⚠️ Email config check skipped (endpoint may not exist)")
-    
-    print("\n📊 SUMMARY:")
-    print("   - Direct email test endpoint working")
-    print("   - Request creation triggers admin notifications")
-    print("   - SMTP configured for: request@shakerpd.com")
-    print("   - Dreamhost SMTP server: smtp.dreamhost.com:587")
-    print("\n💡 If you're still seeing configuration warnings, they may be:")
-    print("   - Cached browser messages")
-    print("   - Old frontend messages")
-    print("   - Development environment notices")
-    print("\n✅ EMAIL SYSTEM IS OPERATIONAL!")
-
-if __name__ == "__main__":
-    test_complete_email_workflow()
\ No newline at end of file
@@ -1,462 +0,0 @@
-import requests
-import sys
-import json
-from datetime import datetime
-import time
-
-class FocusedPoliceRecordsAPITester:
-    def __init__(self, base_url="https://request-hub-6.preview.emergentagent.com/api"):
-        self.base_url = base_url
-        self.tokens = {}
-        self.users = {}
-        self.requests_created = []
-        self.tests_run = 0
-        self.tests_passed = 0
-        self.critical_failures = []
-
-    def run_test(self, name, method, endpoint, expected_status, data=None, token=None):
-        """Run a single API test"""
-        url = f"{self.base_url}/{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
-        if token:
-            headers['Authorization'] = f'Bearer {token}'
-
-        self.tests_run += 1
-        print(f"\n🔍 Testing {name}...")
-        
-        try:
-            if method == 'GET':
-                response = requests.get(url, headers=headers)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=headers)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=headers)
-
-            success = response.status_code == expected_status
-            if success:
-                self.tests_passed += 1
-                print(f"✅ PASS - Status: {response.status_code}")
-                try:
-                    return True, response.json()
-                except:
-                    return True, {}
-            else:
-                print(f"❌ FAIL - Expected {expected_status}, got {response.status_code}")
-                try:
-                    error_detail = response.json()
-                    print(f"   Error: {error_detail}")
-                except:
-                    print(f"   Response: {response.text}")
-                return False, {}
-
-        except Exception as e:
-            print(f"❌ FAIL - Error: {str(e)}")
-            return False, {}
-
-    def test_registration_security_comprehensive(self):
-        """CRITICAL: Test registration security - force user role only"""
-        print("\n" + "="*70)
-        print("🔒 CRITICAL TEST: REGISTRATION SECURITY")
-        print("="*70)
-        
-        timestamp = datetime.now().strftime('%H%M%S%f')
-        
-        # Test attempts to register with elevated roles
-        test_cases = [
-            {"role": "staff", "description": "Staff role bypass attempt"},
-            {"role": "admin", "description": "Admin role bypass attempt"},
-            {"role": "ADMIN", "description": "Admin role (uppercase) bypass attempt"},
-            {"role": "Staff", "description": "Staff role (capitalized) bypass attempt"},
-            {"role": "user", "description": "Normal user registration"}
-        ]
-        
-        security_passed = True
-        
-        for i, test_case in enumerate(test_cases):
-            user_data = {
-                "email": f"security_test_{i}_{timestamp}@test.com",
-                "password": "TestPass123!",
-                "full_name": f"Security Test User {i}",
-                "role": test_case["role"]
-            }
-            
-            success, response = self.run_test(
-                test_case["description"],
-                "POST",
-                "auth/register",
-                200,
-                data=user_data
-            )
-            
-            if success:
-                actual_role = response.get('user', {}).get('role')
-                if actual_role == 'user':
-                    print(f"   ✅ SECURITY PASS: {test_case['role']} → forced to 'user'")
-                    # Store token for the normal user
-                    if test_case["role"] == "user":
-                        self.tokens['user'] = response['access_token']
-                        self.users['user'] = response['user']
-                else:
-                    print(f"   🚨 SECURITY BREACH: {test_case['role']} → got '{actual_role}'")
-                    self.critical_failures.append(f"Registration security bypass: {test_case['role']} became {actual_role}")
-                    security_passed = False
-            else:
-                print(f"   ❌ Registration failed for {test_case['role']}")
-                
-        if security_passed:
-            print(f"\n🛡️  REGISTRATION SECURITY: PASSED")
-        else:
-            print(f"\n🚨 REGISTRATION SECURITY: FAILED - CRITICAL VULNERABILITY")
-
-    def test_request_creation_and_body_cam_acknowledgment(self):
-        """Test request creation including body camera footage with cost acknowledgment"""
-        print("\n" + "="*70)
-        print("📋 TESTING REQUEST CREATION & BODY CAM ACKNOWLEDGMENT")
-        print("="*70)
-        
-        if 'user' not in self.tokens:
-            print("❌ No user token available")
-            return
-            
-        # Test different request types including body camera footage
-        request_tests = [
-            {
-                "title": "Police Report for Insurance Claim",
-                "description": "Requesting police report from traffic accident on Main St for insurance purposes",
-                "request_type": "police_report",
-                "priority": "high"
-            },
-            {
-                "title": "Body Camera Footage Request - Legal Case",
-                "description": "Requesting body camera footage from Officer Badge #123 on January 15th, 2024. I understand and acknowledge that processing this request may involve costs for copying and administrative processing. I agree to pay any applicable fees.",
-                "request_type": "body_cam_footage",
-                "priority": "high"
-            },
-            {
-                "title": "Incident Report Request",
-                "description": "Need incident report from domestic disturbance call last Tuesday",
-                "request_type": "incident_report",
-                "priority": "medium"
-            },
-            {
-                "title": "Case File Access Request",
-                "description": "Requesting access to case file #2024-001234 for legal proceedings",
-                "request_type": "case_file",
-                "priority": "high"
-            }
-        ]
-        
-        body_cam_created = False
-        
-        for request_data in request_tests:
-            success, response = self.run_test(
-                f"Create {request_data['request_type']} request",
-                "POST",
-                "requests",
-                200,
-                data=request_data,
-                token=self.tokens['user']
-            )
-            
-            if success and 'id' in response:
-                self.requests_created.append(response['id'])
-                print(f"   ✅ Created: {response['id'][:8]}...")
-                
-                # Special verification for body camera footage
-                if request_data['request_type'] == 'body_cam_footage':
-                    body_cam_created = True
-                    print(f"   🎥 BODY CAM REQUEST: Successfully accepted with cost acknowledgment")
-                    print(f"   💰 Cost acknowledgment text included in description")
-        
-        if body_cam_created:
-            print(f"\n✅ BODY CAMERA FOOTAGE REQUESTS: WORKING")
-        else:
-            print(f"\n❌ BODY CAMERA FOOTAGE REQUESTS: FAILED")
-            self.critical_failures.append("Body camera footage requests not working")
-
-    def test_email_notification_triggers(self):
-        """Test that request creation triggers email notifications"""
-        print("\n" + "="*70)
-        print("📧 TESTING EMAIL NOTIFICATION TRIGGERS")
-        print("="*70)
-        
-        if not self.requests_created:
-            print("❌ No requests created to test email notifications")
-            return
-            
-        # Create one more request to test email notifications
-        email_test_request = {
-            "title": "Email Notification Test Request",
-            "description": "This request is created to test email notification system",
-            "request_type": "other",
-            "priority": "low"
-        }
-        
-        success, response = self.run_test(
-            "Create request to trigger email notifications",
-            "POST",
-            "requests",
-            200,
-            data=email_test_request,
-            token=self.tokens['user']
-        )
-        
-        if success:
-            print(f"   ✅ Request created - should trigger admin email notifications")
-            print(f"   📧 Email system should filter out fake @example.com addresses")
-            print(f"   🎯 Only real admin emails should receive notifications")
-        
-        print(f"\n✅ EMAIL NOTIFICATION SYSTEM: Backend endpoints working")
-
-    def test_user_request_access(self):
-        """Test user can access their own requests"""
-        print("\n" + "="*70)
-        print("👤 TESTING USER REQUEST ACCESS")
-        print("="*70)
-        
-        if 'user' not in self.tokens:
-            print("❌ No user token available")
-            return
-            
-        # Test getting all requests for user
-        success, response = self.run_test(
-            "Get user's own requests",
-            "GET",
-            "requests",
-            200,
-            token=self.tokens['user']
-        )
-        
-        if success:
-            request_count = len(response)
-            print(f"   ✅ User can access {request_count} of their own requests")
-            
-            # Test accessing specific request
-            if self.requests_created:
-                request_id = self.requests_created[0]
-                success, response = self.run_test(
-                    "Get specific request details",
-                    "GET",
-                    f"requests/{request_id}",
-                    200,
-                    token=self.tokens['user']
-                )
-                
-                if success:
-                    print(f"   ✅ User can access specific request details")
-
-    def test_dashboard_functionality(self):
-        """Test dashboard statistics"""
-        print("\n" + "="*70)
-        print("📊 TESTING DASHBOARD FUNCTIONALITY")
-        print("="*70)
-        
-        if 'user' not in self.tokens:
-            print("❌ No user token available")
-            return
-            
-        success, response = self.run_test(
-            "Get user dashboard stats",
-            "GET",
-            "dashboard/stats",
-            200,
-            token=self.tokens['user']
-        )
-        
-        if success:
-            total_requests = response.get('total_requests', 0)
-            pending_requests = response.get('pending_requests', 0)
-            print(f"   ✅ Dashboard shows {total_requests} total, {pending_requests} pending")
-
-    def test_permission_enforcement(self):
-        """Test that permission system properly denies unauthorized access"""
-        print("\n" + "="*70)
-        print("🔐 TESTING PERMISSION ENFORCEMENT")
-        print("="*70)
-        
-        if 'user' not in self.tokens:
-            print("❌ No user token available")
-            return
-            
-        # Test admin endpoints are properly protected
-        admin_endpoints = [
-            ("admin/users", "GET"),
-            ("admin/staff-members", "GET"),
-            ("admin/requests-master-list", "GET"),
-            ("admin/unassigned-requests", "GET"),
-            ("test-email", "POST"),
-            ("analytics/dashboard", "GET")
-        ]
-        
-        permissions_working = True
-        
-        for endpoint, method in admin_endpoints:
-            success, response = self.run_test(
-                f"User tries to access {endpoint} (should be denied)",
-                method,
-                endpoint,
-                403,  # Should be forbidden
-                token=self.tokens['user']
-            )
-            
-            if success:
-                print(f"   ✅ Access properly denied to {endpoint}")
-            else:
-                print(f"   🚨 SECURITY ISSUE: User gained access to {endpoint}")
-                permissions_working = False
-                self.critical_failures.append(f"Permission bypass: user accessed {endpoint}")
-        
-        # Test staff creation endpoint
-        staff_data = {
-            "email": "unauthorized@test.com",
-            "password": "Pass123!",
-            "full_name": "Unauthorized Staff",
-            "role": "staff"
-        }
-        
-        success, response = self.run_test(
-            "User tries to create staff (should be denied)",
-            "POST",
-            "admin/create-staff",
-            403,
-            data=staff_data,
-            token=self.tokens['user']
-        )
-        
-        if success:
-            print(f"   ✅ Staff creation properly denied")
-        else:
-            permissions_working = False
-            self.critical_failures.append("Permission bypass: user can create staff")
-        
-        if permissions_working:
-            print(f"\n🛡️  PERMISSION SYSTEM: WORKING CORRECTLY")
-        else:
-            print(f"\n🚨 PERMISSION SYSTEM: SECURITY VULNERABILITIES DETECTED")
-
-    def test_messaging_system(self):
-        """Test messaging functionality"""
-        print("\n" + "="*70)
-        print("💬 TESTING MESSAGING SYSTEM")
-        print("="*70)
-        
-        if not self.requests_created or 'user' not in self.tokens:
-            print("❌ No requests or user token available")
-            return
-            
-        request_id = self.requests_created[0]
-        
-        # Create a message
-        message_data = {
-            "request_id": request_id,
-            "content": "This is a test message for the request"
-        }
-        
-        success, response = self.run_test(
-            "Create message on request",
-            "POST",
-            "messages",
-            200,
-            data=message_data,
-            token=self.tokens['user']
-        )
-        
-        if success:
-            print(f"   ✅ Message created successfully")
-            
-            # Get messages for the request
-            success, response = self.run_test(
-                "Get messages for request",
-                "GET",
-                f"messages/{request_id}",
-                200,
-                token=self.tokens['user']
-            )
-            
-            if success:
-                message_count = len(response)
-                print(f"   ✅ Retrieved {message_count} messages for request")
-
-    def test_notifications_system(self):
-        """Test notification system"""
-        print("\n" + "="*70)
-        print("🔔 TESTING NOTIFICATIONS SYSTEM")
-        print("="*70)
-        
-        if 'user' not in self.tokens:
-            print("❌ No user token available")
-            return
-            
-        success, response = self.run_test(
-            "Get user notifications",
-            "GET",
-            "notifications",
-            200,
-            token=self.tokens['user']
-        )
-        
-        if success:
-            notification_count = len(response)
-            print(f"   ✅ User has {notification_count} notifications")
-
-    def run_comprehensive_test(self):
-        """Run all focused tests"""
-        print("🚀 FOCUSED POLICE RECORDS API TESTING")
-        print("="*70)
-        print("🎯 FOCUS: Registration Security, Request Management, Email System")
-        print("🔍 Testing core functionality that can be verified without admin access")
-        print("="*70)
-        
-        try:
-            # Run all tests
-            self.test_registration_security_comprehensive()
-            self.test_request_creation_and_body_cam_acknowledgment()
-            self.test_email_notification_triggers()
-            self.test_user_request_access()
-            self.test_dashboard_functionality()
-            self.test_permission_enforcement()
-            self.test_messaging_system()
-            self.test_notifications_system()
-            
-        except Exception as e:
-            print(f"\n❌ Testing failed with error: {str(e)}")
-            self.critical_failures.append(f"Test execution error: {str(e)}")
-            
-        # Print comprehensive results
-        print("\n" + "="*70)
-        print("🏁 COMPREHENSIVE TEST RESULTS")
-        print("="*70)
-        print(f"📊 Tests Passed: {self.tests_passed}/{self.tests_run}")
-        print(f"📈 Success Rate: {(self.tests_passed/self.tests_run)*100:.1f}%")
-        
-        if self.critical_failures:
-            print(f"\n🚨 CRITICAL SECURITY ISSUES DETECTED:")
-            for i, failure in enumerate(self.critical_failures, 1):
-                print(f"   {i}. ❌ {failure}")
-        else:
-            print(f"\n🛡️  NO CRITICAL SECURITY ISSUES DETECTED")
-        
-        # Summary by category
-        print(f"\n📋 FUNCTIONALITY SUMMARY:")
-        print(f"   🔒 Registration Security: {'✅ SECURE' if not any('Registration security' in f for f in self.critical_failures) else '❌ VULNERABLE'}")
-        print(f"   📋 Request Management: {'✅ WORKING' if self.requests_created else '❌ FAILED'}")
-        print(f"   🎥 Body Cam Requests: {'✅ ACCEPTED' if any('body_cam_footage' in str(r) for r in self.requests_created) else '❌ FAILED'}")
-        print(f"   🔐 Permission System: {'✅ SECURE' if not any('Permission bypass' in f for f in self.critical_failures) else '❌ VULNERABLE'}")
-        print(f"   📧 Email Triggers: ✅ WORKING (backend endpoints functional)")
-        
-        if self.tests_passed >= (self.tests_run * 0.8) and not self.critical_failures:
-            print(f"\n🎉 SYSTEM STATUS: READY FOR PRODUCTION")
-            print(f"✅ All critical functionality verified working")
-            return 0
-        else:
-            print(f"\n⚠️  SYSTEM STATUS: ISSUES DETECTED")
-            print(f"❌ {len(self.critical_failures)} critical issues need attention")
-            return 1
-
-def main():
-    tester = FocusedPoliceRecordsAPITester()
-    return tester.run_comprehensive_test()
-
-if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
@@ -35,6 +35,7 @@ const AdminPanel = () => {
   const [loading, setLoading] = useState(true);
   const [activeTab, setActiveTab] = useState('overview');
   const [searchTerm, setSearchTerm] = useState('');
+  const [searchResults, setSearchResults] = useState(null); // ranked request ids from /search
   
   // Staff creation form
   const [newStaffForm, setNewStaffForm] = useState({
@@ -56,6 +57,23 @@ const AdminPanel = () => {
     fetchAdminData();
   }, []);
 
+  useEffect(() => {
+    const term = searchTerm.trim();
+    if (term.length < 3) {
+      setSearchResults(null);
+      return;
+    }
+    const timer = setTimeout(async () => {
+      try {
+        const response = await axios.get(`${API}/search`, { params: { q: term, limit: 100 } });
+        setSearchResults(response.data.results.map((result) => result.id));
+      } catch (error) {
+        setSearchResults(null); // fall back to filtering the loaded list
+      }
+    }, 300);
+    return () => clearTimeout(timer);
+  }, [searchTerm, API]);
+
   const fetchAdminData = async () => {
     setLoading(true);
     try {
@@ -150,6 +168,19 @@ const AdminPanel = () => {
     }
   };
 
+  const handleBulkAssign = async () => {
+    try {
+      // Weighted by priority and request type on the server
+      const response = await axios.post(`${API}/requests/auto-assign`);
+      
+      toast.success(response.data.message);
+      fetchAdminData(); // Refresh data
+    } catch (error) {
+      const errorMessage = error.response?.data?.detail || 'Failed to assign requests';
+      toast.error(errorMessage);
+    }
+  };
+
   // New function to update user role
   const handleUpdateUserRole = async (userId, newRole) => {
     try {
@@ -162,6 +193,17 @@ const AdminPanel = () => {
     }
   };
 
+  const handleUpdateUserName = async (userId, newName) => {
+    try {
+      await axios.put(`${API}/admin/users/${userId}/name`, { full_name: newName });
+      toast.success('User name updated successfully');
+      fetchAdminData(); // Refresh data
+    } catch (error) {
+      const errorMessage = error.response?.data?.detail || 'Failed to update user name';
+      toast.error(errorMessage);
+    }
+  };
+
   // New function to update user email
   const handleUpdateUserEmail = async (userId, newEmail) => {
     try {
@@ -303,13 +345,18 @@ const AdminPanel = () => {
     });
   };
 
-  // Filter requests based on search term
-  const filteredRequests = masterRequests.filter(request =>
+  // Filter requests based on search term; longer terms use ranked server search
+  // (which also matches descriptions, messages and requester emails)
+  const localMatches = masterRequests.filter(request =>
     request.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
     request.requester_name.toLowerCase().includes(searchTerm.toLowerCase()) ||
     request.status.toLowerCase().includes(searchTerm.toLowerCase()) ||
     request.request_type.toLowerCase().includes(searchTerm.toLowerCase())
   );
+  const requestsById = Object.fromEntries(masterRequests.map((request) => [request.id, request]));
+  const filteredRequests = searchResults
+    ? searchResults.map((id) => requestsById[id]).filter(Boolean)
+    : localMatches;
 
   if (loading) {
     return (
@@ -508,6 +555,24 @@ const AdminPanel = () => {
                         </Select>
                       </div>
                       
+                      <div className="space-y-2">
+                        <Label className="text-xs">Name</Label>
+                        <Input
+                          defaultValue={user.full_name}
+                          className="w-48"
+                          onBlur={(e) => {
+                            if (e.target.value.trim() && e.target.value !== user.full_name) {
+                              handleUpdateUserName(user.id, e.target.value);
+                            }
+                          }}
+                          onKeyPress={(e) => {
+                            if (e.key === 'Enter' && e.target.value.trim() && e.target.value !== user.full_name) {
+                              handleUpdateUserName(user.id, e.target.value);
+                            }
+                          }}
+                        />
+                      </div>
+                      
                       <div className="space-y-2">
                         <Label className="text-xs">Email</Label>
                         <Input
@@ -836,8 +901,18 @@ const AdminPanel = () => {
         <TabsContent value="assignments" className="space-y-6">
           <Card>
             <CardHeader>
-              <CardTitle>Request Assignments</CardTitle>
-              <CardDescription>Assign unassigned requests to available staff members</CardDescription>
+              <div className="flex items-center justify-between">
+                <div>
+                  <CardTitle>Request Assignments</CardTitle>
+                  <CardDescription>Assign unassigned requests to available staff members</CardDescription>
+                </div>
+                {unassignedRequests.length > 0 && staff.length > 0 && (
+                  <Button onClick={handleBulkAssign} variant="outline">
+                    <UserCheck className="w-4 h-4 mr-2" />
+                    Auto-Assign All ({unassignedRequests.length})
+                  </Button>
+                )}
+              </div>
             </CardHeader>
             <CardContent>
               <div className="space-y-4">
@@ -1,4 +1,4 @@
-import React, { useState, useCallback, useContext } from 'react';
+import React, { useState, useCallback, useContext, useEffect } from 'react';
 import { useDropzone } from 'react-dropzone';
 import { AuthContext } from '../App';
 import { Button } from './ui/button';
@@ -20,6 +20,41 @@ import {
 import { toast } from 'sonner';
 import axios from 'axios';
 
+// Whether the API hands out presigned URLs (object storage); learned from the first download
+let presignedDownloads = true;
+
+// Thumbnail of an image or PDF, rendered by the API after upload; falls back to the type icon
+const FilePreview = ({ file, fallback }) => {
+  const [src, setSrc] = useState(null);
+  const { API } = useContext(AuthContext);
+
+  useEffect(() => {
+    if (file.preview !== 'ready') return undefined;
+    let url = null;
+    let cancelled = false;
+    axios.get(`${API}/preview/${file.id}`, { responseType: 'blob' })
+      .then((response) => {
+        if (cancelled) return;
+        url = window.URL.createObjectURL(response.data);
+        setSrc(url);
+      })
+      .catch(() => {});
+    return () => {
+      cancelled = true;
+      if (url) window.URL.revokeObjectURL(url);
+    };
+  }, [API, file.id, file.preview]);
+
+  if (!src) return fallback;
+  return (
+    <img
+      src={src}
+      alt={file.original_name}
+      className="w-12 h-12 object-cover rounded border bg-white"
+    />
+  );
+};
+
 const FileManager = ({ requestId, files = [], onFilesUpdate, disabled = false }) => {
   const [uploading, setUploading] = useState(false);
   const [uploadProgress, setUploadProgress] = useState({});
@@ -100,6 +135,17 @@ const FileManager = ({ requestId, files = [], onFilesUpdate, disabled = false })
 
   const handleDownload = async (fileId, filename) => {
     try {
+      // Object storage hands out a presigned URL the browser fetches directly;
+      // local storage never does, so after one null answer stop asking
+      if (presignedDownloads) {
+        const { data: presigned } = await axios.get(`${API}/download/${fileId}/url`);
+        if (presigned.url) {
+          window.location.assign(presigned.url);
+          return;
+        }
+        presignedDownloads = false;
+      }
+
       const response = await axios.get(`${API}/download/${fileId}`, {
         responseType: 'blob',
       });
@@ -119,6 +165,20 @@ const FileManager = ({ requestId, files = [], onFilesUpdate, disabled = false })
     }
   };
 
+  const handleDownloadAll = async () => {
+    try {
+      // One ZIP of every file plus the request's PDF report, built on the fly by the API.
+      // The browser opens a short-lived signed link itself, so the ZIP streams to disk
+      // instead of being held in page memory (body cam bundles run to gigabytes)
+      const { data: link } = await axios.post(`${API}/files/${requestId}/bundle/link`, null, {
+        params: { include_pdf: true },
+      });
+      window.location.assign(`${API}${link.path}`);
+    } catch (error) {
+      toast.error('Failed to download files');
+    }
+  };
+
   return (
     <div className="space-y-6">
       {/* Upload Area */}
@@ -173,10 +233,18 @@ const FileManager = ({ requestId, files = [], onFilesUpdate, disabled = false })
       {files && files.length > 0 && (
         <Card>
           <CardHeader>
-            <CardTitle className="flex items-center gap-2">
-              <FileText className="w-5 h-5" />
-              Attached Files ({files.length})
-            </CardTitle>
+            <div className="flex items-center justify-between">
+              <CardTitle className="flex items-center gap-2">
+                <FileText className="w-5 h-5" />
+                Attached Files ({files.length})
+              </CardTitle>
+              {files.length > 1 && (
+                <Button variant="outline" size="sm" onClick={handleDownloadAll}>
+                  <FileArchive className="w-4 h-4 mr-2" />
+                  Download All
+                </Button>
+              )}
+            </div>
             <CardDescription>
               Documents and files related to this request
             </CardDescription>
@@ -186,7 +254,7 @@ const FileManager = ({ requestId, files = [], onFilesUpdate, disabled = false })
               {files.map((file) => (
                 <div key={file.id} className="flex items-center justify-between p-4 bg-slate-50 rounded-lg border">
                   <div className="flex items-center gap-3 flex-1">
-                    {getFileIcon(file.original_name, file.content_type)}
+                    <FilePreview file={file} fallback={getFileIcon(file.original_name, file.content_type)} />
                     <div className="flex-1 min-w-0">
                       <p className="font-medium text-slate-800 truncate">
                         {file.original_name}
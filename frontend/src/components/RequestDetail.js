@@ -103,14 +103,20 @@ const RequestDetail = () => {
   const handleStatusUpdate = async (newStatus) => {
     setUpdatingStatus(true);
     try {
+      // Sending the version we loaded makes the server reject a concurrent edit
       await axios.put(`${API}/requests/${id}/status`, null, {
-        params: { new_status: newStatus }
+        params: { new_status: newStatus, version: request.version }
       });
       
       toast.success('Status updated successfully');
       fetchRequestDetails(); // Refresh request data
     } catch (error) {
-      toast.error('Failed to update status');
+      if (error.response?.status === 409) {
+        toast.error('This request was changed by someone else. It has been reloaded.');
+        fetchRequestDetails();
+      } else {
+        toast.error('Failed to update status');
+      }
       console.error('Status update error:', error);
     } finally {
       setUpdatingStatus(false);
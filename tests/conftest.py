@@ -0,0 +1,148 @@
+"""Shared fixtures: an in-process mongomock database, a temporary upload
+directory, stored users and requests, and a way to stage a concurrent write.
+
+The backend modules import each other as top-level modules (``import
+config``), so ``backend/`` goes on the path first, and the environment is
+set before ``config`` reads it.
+"""
+import asyncio
+import hashlib
+import inspect
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+os.environ["MONGO_URL"] = "mongomock://"
+os.environ["DB_NAME"] = "records_test"
+os.environ.setdefault("LOG_LEVEL", "ERROR")
+
+import config  # noqa: E402
+import database  # noqa: E402
+import storage  # noqa: E402
+from models import User, UserRole  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    # A fresh mongomock client per test, so every test starts empty
+    await database.connect()
+    yield database.db
+    database.close()
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STORAGE_BACKEND", "local")
+    monkeypatch.setattr(config, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(storage, "_storage", None)
+    yield tmp_path
+    storage._storage = None
+
+
+@pytest.fixture
+def put_blob(upload_dir):
+    """Store ``data`` as a published blob the way an upload does; returns its name (the SHA-256)."""
+
+    def put(data: bytes) -> str:
+        store = storage.get_storage()
+        writer = store.open_incoming()
+        writer.write(data)
+        writer.close()
+        name = hashlib.sha256(data).hexdigest()
+        store.publish(writer.ref, name)
+        return name
+
+    return put
+
+
+@pytest.fixture
+def admin():
+    return User(id="admin-1", email="admin@example.org", full_name="Ada Admin", role=UserRole.ADMIN)
+
+
+@pytest.fixture
+def make_request():
+    """Build a stored request document; keyword arguments override fields."""
+
+    def make(request_id: str, **fields) -> dict:
+        return {
+            "id": request_id,
+            "user_id": "user-1",
+            "requester_name": "Riley Requester",
+            "requester_email": "riley@example.org",
+            "title": f"Request {request_id}",
+            "description": "Records, please",
+            "request_type": "police_report",
+            "priority": "medium",
+            "status": "pending",
+            "assigned_staff_id": None,
+            "version": 0,
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "updated_at": "2026-01-01T00:00:00+00:00",
+            **fields,
+        }
+
+    return make
+
+
+@pytest.fixture
+async def requester(db):
+    user = User(id="user-1", email="riley@example.org", full_name="Riley Requester", role=UserRole.USER)
+    await db.users.insert_one(user.model_dump(mode="json"))
+    return user
+
+
+@pytest.fixture
+async def staff(db):
+    """Two stored staff members, s1 (Avery) and s2 (Blake)."""
+    members = [
+        User(id=staff_id, email=f"{staff_id}@example.org", full_name=name, role=UserRole.STAFF)
+        for staff_id, name in (("s1", "Avery"), ("s2", "Blake"))
+    ]
+    await db.users.insert_many([member.model_dump(mode="json") for member in members])
+    return members
+
+
+@pytest.fixture
+def race(monkeypatch):
+    """Have another process write while the code under test is mid-operation.
+
+    ``race(cls, "method", interloper)`` runs ``await interloper(*args)`` with
+    the call's arguments just before each call of ``cls.method`` (``after=True``:
+    just after).  Synchronous methods, which the code runs in worker threads,
+    hand the interloper back to the test's event loop.
+    """
+
+    def install(cls, name: str, interloper, after: bool = False):
+        original = getattr(cls, name)
+
+        if inspect.iscoroutinefunction(original):
+            async def patched(self, *args, **kwargs):
+                if not after:
+                    await interloper(*args)
+                result = await original(self, *args, **kwargs)
+                if after:
+                    await interloper(*args)
+                return result
+        else:
+            loop = asyncio.get_running_loop()
+
+            def patched(self, *args, **kwargs):
+                if not after:
+                    asyncio.run_coroutine_threadsafe(interloper(*args), loop).result()
+                result = original(self, *args, **kwargs)
+                if after:
+                    asyncio.run_coroutine_threadsafe(interloper(*args), loop).result()
+                return result
+
+        monkeypatch.setattr(cls, name, patched)
+
+    return install
@@ -0,0 +1,92 @@
+import pytest
+
+import routers.requests as requests_router
+from assignment import AssignmentEngine, assignment_engine, request_weight
+from models import RecordRequestCreate
+
+pytestmark = pytest.mark.anyio
+
+
+def test_weight_is_priority_times_type():
+    assert request_weight({"priority": "urgent", "request_type": "body_cam_footage"}) == 15.0
+    assert request_weight({"priority": "low", "request_type": "case_file"}) == 1.5
+    # Unknown values count as a medium, ordinary request
+    assert request_weight({"priority": None, "request_type": "mystery"}) == 2.0
+
+
+async def test_rebuild_weighs_open_requests_and_skips_inactive_staff(db, staff, make_request):
+    await db.users.insert_one({**staff[0].model_dump(mode="json"), "id": "s3", "full_name": "Casey", "is_active": False})
+    await db.requests.insert_many([
+        make_request("r1", status="assigned", assigned_staff_id="s1", priority="urgent", request_type="body_cam_footage"),
+        make_request("r2", status="in_progress", assigned_staff_id="s2", priority="low"),
+        make_request("r3", status="in_progress", assigned_staff_id="s2", priority="low"),
+        # Closed work doesn't count
+        make_request("r4", status="completed", assigned_staff_id="s2", priority="urgent"),
+    ])
+    engine = AssignmentEngine()
+    await engine.rebuild()
+
+    snapshot = engine.snapshot()
+
+    assert [row["staff_id"] for row in snapshot] == ["s2", "s1"]
+    assert {row["staff_id"]: (row["weighted_load"], row["open_requests"]) for row in snapshot} == {
+        "s1": (15.0, 1),
+        "s2": (2.0, 2),
+    }
+
+
+async def test_plan_hands_each_request_to_the_least_loaded(db, staff, make_request):
+    await db.requests.insert_one(make_request("r0", status="assigned", assigned_staff_id="s1", priority="high"))
+    engine = AssignmentEngine()
+
+    plan = await engine.plan([
+        make_request("a", priority="urgent"),
+        make_request("b", priority="low"),
+        make_request("c", priority="low"),
+    ])
+
+    # s2 starts empty and takes the urgent one (5), after which s1 (3) is lighter for both low ones
+    assert {staff_id: [request["id"] for request in batch] for staff_id, batch in plan.items()} == {
+        "s2": ["a"],
+        "s1": ["b", "c"],
+    }
+    assert {row["staff_id"]: row["weighted_load"] for row in engine.snapshot()} == {"s1": 5.0, "s2": 5.0}
+
+
+async def test_auto_assign_reports_only_requests_it_wrote(db, admin, staff, make_request, race, monkeypatch):
+    digests = []
+
+    async def record_digest(staff, batch):
+        digests.append((staff["id"], [request["id"] for request in batch]))
+
+    monkeypatch.setattr(requests_router, "send_assignment_digest", record_digest)
+    monkeypatch.setattr(assignment_engine, "_stale", True)
+    await db.requests.insert_many([make_request(f"r{index}", created_at=f"2026-01-0{index + 1}") for index in range(3)])
+
+    async def assign_r0_elsewhere(operations):
+        # Someone else assigns r0 between the plan and the write
+        await db.requests.update_one({"id": "r0"}, {"$set": {"assigned_staff_id": "s2", "status": "assigned"}})
+
+    race(type(db.requests), "bulk_write", assign_r0_elsewhere)
+
+    result = await requests_router.auto_assign_unassigned(admin)
+
+    assert sorted(row["request_id"] for row in result["assigned"]) == ["r1", "r2"]
+    assert sorted(request_id for _, batch in digests for request_id in batch) == ["r1", "r2"]
+    assert await db.notifications.count_documents({}) == 2
+    # The planned load for r0 was taken back: each staff member holds one of r1, r2
+    assert {row["staff_id"]: row["open_requests"] for row in assignment_engine.snapshot()} == {"s1": 1, "s2": 1}
+
+
+async def test_auto_assigned_request_is_returned_as_stored(db, requester, staff, monkeypatch):
+    monkeypatch.setattr(requests_router, "AUTO_ASSIGN_ON_CREATE", True)
+    monkeypatch.setattr(assignment_engine, "_stale", True)
+
+    created = await requests_router.create_request(
+        RecordRequestCreate(title="Footage", description="Camera 4", request_type="body_cam_footage"), requester
+    )
+
+    stored = await db.requests.find_one({"id": created.id})
+    assert (created.status, created.assigned_staff_id, created.assigned_staff_name) == ("assigned", "s1", "Avery")
+    # A client echoing this version back must not get a 409
+    assert created.version == stored["version"] == 1
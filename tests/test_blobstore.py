@@ -0,0 +1,59 @@
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+import blobstore
+from storage import get_storage
+
+pytestmark = pytest.mark.anyio
+
+
+async def upload(db, record_id: str, data: bytes) -> tuple:
+    """Store ``data`` the way upload_file does: receive, insert the record, publish."""
+    blob = await blobstore.receive(UploadFile(io.BytesIO(data), filename="clip.mp4"))
+    await db.files.insert_one({"id": record_id, "request_id": "r1", "filename": blob.filename})
+    return blob, await blobstore.publish(blob)
+
+
+async def test_identical_content_is_stored_once(db, upload_dir):
+    data = b"frame" * 100_000
+
+    first, duplicate_first = await upload(db, "f1", data)
+    second, duplicate_second = await upload(db, "f2", data)
+
+    assert first.filename == second.filename == hashlib.sha256(data).hexdigest()
+    assert (duplicate_first, duplicate_second) == (False, True)
+    assert get_storage().open(first.filename).read() == data
+    assert not any((upload_dir / ".incoming").iterdir())
+
+
+async def test_blob_outlives_all_but_its_last_record(db, upload_dir):
+    blob, _ = await upload(db, "f1", b"shared")
+    await upload(db, "f2", b"shared")
+    storage = get_storage()
+
+    await db.files.delete_one({"id": "f1"})
+    assert await blobstore.release([blob.filename]) == 0
+    assert storage.stat(blob.filename) is not None
+
+    await db.files.delete_one({"id": "f2"})
+    assert await blobstore.release([blob.filename, blob.filename]) == 1
+    assert storage.stat(blob.filename) is None
+    assert not storage.is_quarantined(blob.filename)
+
+
+async def test_release_puts_back_a_blob_claimed_while_set_aside(db, upload_dir, race):
+    blob, _ = await upload(db, "f1", b"contested")
+    await db.files.delete_one({"id": "f1"})
+    storage = get_storage()
+
+    async def reupload(name):
+        # An upload of the same content inserts its record while the blob is set aside
+        await db.files.insert_one({"id": "f2", "request_id": "r2", "filename": name})
+
+    race(type(storage), "quarantine", reupload, after=True)
+
+    assert await blobstore.release([blob.filename]) == 0
+    assert storage.open(blob.filename).read() == b"contested"
@@ -0,0 +1,64 @@
+import orjson
+import pytest
+
+import routers.admin as admin_router
+from cache import TTLCache
+from models import RequestStatus, RequestType
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(admin_router, "browse_cache", TTLCache(30))
+
+
+@pytest.fixture
+async def seeded(db, staff, make_request):
+    rows = [
+        # id, status, type, staff, month
+        ("a", "pending", "police_report", None, "2026-01"),
+        ("b", "pending", "police_report", None, "2026-02"),
+        ("c", "pending", "body_cam_footage", None, "2026-01"),
+        ("d", "assigned", "police_report", "s1", "2026-01"),
+        ("e", "completed", "case_file", "s2", "2026-02"),
+    ]
+    await db.requests.insert_many([
+        make_request(request_id, status=status, request_type=request_type, assigned_staff_id=staff_id, created_at=f"{month}-10T00:00:00+00:00")
+        for request_id, status, request_type, staff_id, month in rows
+    ])
+
+
+async def browse(admin, **filters) -> dict:
+    params = {"status": None, "request_type": None, "priority": None, "assigned_staff_id": None, "month": None, "skip": 0, "limit": 50}
+    response = await admin_router.browse_requests(**{**params, **filters}, current_user=admin)
+    return orjson.loads(response.body)
+
+
+def counts(body: dict, facet: str) -> dict:
+    return {bucket["value"]: bucket["count"] for bucket in body["facets"][facet]}
+
+
+async def test_each_facet_counts_under_the_other_filters_only(seeded, admin):
+    body = await browse(admin, status=RequestStatus.PENDING, request_type=RequestType.POLICE_REPORT)
+
+    assert sorted(request["id"] for request in body["results"]) == ["a", "b"]
+    assert body["total"] == 2
+    # Status ignores the status filter: every police report, by status
+    assert counts(body, "status") == {"pending": 2, "assigned": 1}
+    # Type ignores the type filter: every pending request, by type
+    assert counts(body, "request_type") == {"police_report": 2, "body_cam_footage": 1}
+    # Unfiltered facets count under both filters
+    assert counts(body, "month") == {"2026-01": 1, "2026-02": 1}
+    assert counts(body, "assigned_staff") == {None: 2}
+
+
+async def test_a_single_filter_leaves_its_own_facet_unfiltered(seeded, admin):
+    body = await browse(admin, assigned_staff_id="unassigned")
+
+    assert body["total"] == 3
+    assert counts(body, "assigned_staff") == {None: 3, "s1": 1, "s2": 1}
+    assert counts(body, "status") == {"pending": 3}
+    assert {bucket["value"]: bucket["label"] for bucket in body["facets"]["assigned_staff"]} == {
+        None: "Unassigned", "s1": "Avery", "s2": "Blake",
+    }
@@ -0,0 +1,69 @@
+import pytest
+from fastapi import HTTPException
+
+import routers.requests as requests_router
+from models import AssignmentPolicy, BulkAssignment
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def digests(monkeypatch):
+    sent = []
+
+    async def record(staff, batch):
+        sent.append((staff["id"], [request["id"] for request in batch]))
+
+    monkeypatch.setattr(requests_router, "send_assignment_digest", record)
+    return sent
+
+
+async def test_round_robin_follows_the_given_order(db, admin, staff, make_request, digests):
+    await db.requests.insert_many([make_request(f"r{index}") for index in range(3)])
+
+    result = await requests_router.bulk_assign_requests(
+        BulkAssignment(request_ids=["r2", "r0", "missing", "r1"], policy=AssignmentPolicy.ROUND_ROBIN), admin
+    )
+
+    assert [(row["request_id"], row["staff_id"]) for row in result["assigned"]] == [("r2", "s1"), ("r1", "s1"), ("r0", "s2")]
+    assert result["not_found"] == ["missing"]
+    stored = {request["id"]: request async for request in db.requests.find()}
+    assert stored["r0"]["assigned_staff_name"] == "Blake"
+    assert {(request["status"], request["version"]) for request in stored.values()} == {("assigned", 1)}
+    # One digest per staff member
+    assert sorted(digests) == [("s1", ["r2", "r1"]), ("s2", ["r0"])]
+
+
+async def test_least_loaded_weighs_open_work_like_the_engine(db, admin, staff, make_request):
+    await db.requests.insert_many([
+        # s1: two routine requests (weight 2); s2: one urgent body cam request (weight 15)
+        *(make_request(f"open{index}", status="in_progress", assigned_staff_id="s1", priority="low") for index in range(2)),
+        make_request("footage", status="assigned", assigned_staff_id="s2", priority="urgent", request_type="body_cam_footage"),
+        *(make_request(f"r{index}") for index in range(4)),
+    ])
+
+    result = await requests_router.bulk_assign_requests(BulkAssignment(request_ids=[f"r{index}" for index in range(4)]), admin)
+
+    # Four medium requests (2 each) still leave s1 lighter than s2
+    assert [row["staff_id"] for row in result["assigned"]] == ["s1"] * 4
+
+
+async def test_deactivated_staff_get_nothing(db, admin, staff, make_request):
+    await db.users.update_one({"id": "s1"}, {"$set": {"is_active": False}})
+    await db.requests.insert_many([make_request(f"r{index}") for index in range(2)])
+
+    result = await requests_router.bulk_assign_requests(
+        BulkAssignment(request_ids=["r0", "r1"], policy=AssignmentPolicy.ROUND_ROBIN), admin
+    )
+
+    assert [row["staff_id"] for row in result["assigned"]] == ["s2", "s2"]
+    with pytest.raises(HTTPException) as error:
+        await requests_router.bulk_assign_requests(BulkAssignment(request_ids=["r0"], staff_id="s1"), admin)
+    assert error.value.status_code == 404
+
+
+async def test_needs_requests(db, admin, staff):
+    with pytest.raises(HTTPException) as error:
+        await requests_router.bulk_assign_requests(BulkAssignment(request_ids=[]), admin)
+
+    assert error.value.status_code == 400
@@ -0,0 +1,64 @@
+import pytest
+from fastapi import HTTPException
+
+import routers.requests as requests_router
+from models import BulkStatusUpdate
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def digests(monkeypatch):
+    sent = []
+
+    async def record(user, changes, new_status):
+        sent.append((user["id"], [request["id"] for request, _ in changes]))
+
+    monkeypatch.setattr(requests_router, "send_status_update_digest", record)
+    return sent
+
+
+async def test_reports_a_result_per_request(db, requester, staff, make_request, digests):
+    await db.requests.insert_many([
+        make_request("mine", status="assigned", assigned_staff_id="s1"),
+        make_request("done", status="completed", assigned_staff_id="s1"),
+        make_request("theirs", status="assigned", assigned_staff_id="s2"),
+    ])
+
+    result = await requests_router.bulk_update_request_status(
+        BulkStatusUpdate(request_ids=["mine", "done", "theirs", "missing"], new_status="completed"), staff[0]
+    )
+
+    assert result["results"] == {"mine": "updated", "done": "unchanged", "theirs": "forbidden", "missing": "not_found"}
+    stored = await db.requests.find_one({"id": "mine"})
+    assert (stored["status"], stored["version"]) == ("completed", 1)
+    assert (await db.requests.find_one({"id": "theirs"}))["status"] == "assigned"
+    assert digests == [("user-1", ["mine"])]
+
+
+async def test_leaves_requests_changed_meanwhile(db, requester, staff, make_request, race, digests):
+    await db.requests.insert_many([make_request(f"r{index}", status="assigned", assigned_staff_id="s1") for index in range(3)])
+
+    async def reassign_r1(operations):
+        # After the permission check, before the write
+        await db.requests.update_one({"id": "r1"}, {"$set": {"assigned_staff_id": "s2"}, "$inc": {"version": 1}})
+
+    race(type(db.requests), "bulk_write", reassign_r1)
+
+    result = await requests_router.bulk_update_request_status(
+        BulkStatusUpdate(request_ids=["r0", "r1", "r2"], new_status="denied"), staff[0]
+    )
+
+    assert result["results"] == {"r0": "updated", "r1": "conflict", "r2": "updated"}
+    assert (await db.requests.find_one({"id": "r1"}))["status"] == "assigned"
+    assert digests == [("user-1", ["r0", "r2"])]
+
+
+async def test_rejects_requesters_and_empty_lists(db, requester, staff):
+    with pytest.raises(HTTPException) as error:
+        await requests_router.bulk_update_request_status(BulkStatusUpdate(request_ids=["r0"], new_status="denied"), requester)
+    assert error.value.status_code == 403
+
+    with pytest.raises(HTTPException) as error:
+        await requests_router.bulk_update_request_status(BulkStatusUpdate(request_ids=[], new_status="denied"), staff[0])
+    assert error.value.status_code == 400
@@ -0,0 +1,115 @@
+import io
+import zipfile
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+import routers.files as files_router
+from auth import create_access_token, get_current_user
+from bundle import MISSING_NOTE, BundleEntry, zip_stream
+
+
+def entry(name: str, data, content_type: str = "text/plain", **fields) -> BundleEntry:
+    return BundleEntry(name=name, open=lambda: None if data is None else io.BytesIO(data), content_type=content_type, **fields)
+
+
+def build(entries) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(b"".join(zip_stream(entries))))
+
+
+def test_archive_holds_every_entry():
+    video = bytes(range(256)) * 8192
+    archive = build([
+        entry("bodycam.mp4", video, "video/mp4"),
+        entry("narrative.txt", b"incident narrative " * 5000),
+    ])
+
+    assert archive.testzip() is None
+    assert archive.read("bodycam.mp4") == video
+    assert archive.read("narrative.txt") == b"incident narrative " * 5000
+    # Video is stored as is; text is deflated
+    assert archive.getinfo("bodycam.mp4").compress_type == zipfile.ZIP_STORED
+    assert archive.getinfo("narrative.txt").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_names_are_flat_and_unique():
+    archive = build([
+        entry("../../etc/passwd", b"a"),
+        entry("report.txt", b"b"),
+        entry("Report.txt", b"c"),
+    ])
+
+    assert archive.namelist() == ["_.._etc_passwd", "report.txt", "Report (2).txt"]
+
+
+def test_missing_content_is_listed_instead_of_failing():
+    archive = build([entry("gone.pdf", None), entry("here.txt", b"here")])
+
+    assert archive.namelist() == ["here.txt", MISSING_NOTE]
+    assert archive.read(MISSING_NOTE) == b"gone.pdf\n"
+
+
+def test_members_carry_their_modified_time():
+    uploaded = datetime(2024, 3, 5, 10, 20, 30, tzinfo=timezone.utc)
+
+    archive = build([entry("old.txt", b"old", modified=uploaded)])
+
+    assert archive.getinfo("old.txt").date_time == (2024, 3, 5, 10, 20, 30)
+
+
+def test_streams_in_chunks():
+    chunks = list(zip_stream([entry("big.bin", b"\0" * (3 * 1024 * 1024 + 5), "application/zip")]))
+
+    assert len(chunks) > 3
+    assert max(len(chunk) for chunk in chunks) <= 1024 * 1024 + 1024
+
+
+@pytest.fixture
+async def attached(db, put_blob, make_request):
+    await db.requests.insert_many([make_request("r1"), make_request("r2")])
+    await db.files.insert_one({
+        "id": "f1", "request_id": "r1", "filename": put_blob(b"clip"), "original_name": "clip.mp4",
+        "content_type": "video/mp4", "uploaded_at": "2026-01-02T00:00:00+00:00",
+    })
+
+
+def link_token(link: dict) -> str:
+    return parse_qs(urlparse(link["path"]).query)["token"][0]
+
+
+@pytest.mark.anyio
+async def test_signed_link_streams_the_bundle(attached, requester):
+    link = await files_router.bundle_link("r1", False, requester)
+
+    assert link["path"].startswith("/files/r1/bundle/download?")
+    response = await files_router.download_bundle_link("r1", link_token(link))
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    assert zipfile.ZipFile(io.BytesIO(body)).read("clip.mp4") == b"clip"
+
+
+@pytest.mark.anyio
+async def test_signed_link_opens_only_its_own_bundle(attached, requester):
+    token = link_token(await files_router.bundle_link("r1", False, requester))
+
+    for attempt in (
+        files_router.download_bundle_link("r2", token),
+        # Not a bearer token, and a bearer token is not a link
+        get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)),
+        files_router.download_bundle_link("r1", create_access_token({"sub": requester.id})),
+    ):
+        with pytest.raises(HTTPException) as error:
+            await attempt
+        assert error.value.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_link_is_only_issued_to_those_who_may_download(db, attached, staff):
+    await db.requests.update_one({"id": "r1"}, {"$set": {"assigned_staff_id": "s2"}})
+
+    with pytest.raises(HTTPException) as error:
+        await files_router.bundle_link("r1", False, staff[0])
+
+    assert error.value.status_code == 403
@@ -0,0 +1,74 @@
+import pytest
+
+import cascade
+import config
+import routers.admin as admin_router
+from storage import get_storage
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def no_transactions(monkeypatch, db):
+    # mongomock has no sessions; the cascade must not ask for one unless configured to
+    monkeypatch.setattr(config, "CASCADE_TRANSACTIONS", False)
+
+    def start_session(*args, **kwargs):
+        raise AssertionError("no session without CASCADE_TRANSACTIONS")
+
+    monkeypatch.setattr(db.client, "start_session", start_session, raising=False)
+
+
+@pytest.fixture
+async def attachments(db, put_blob, make_request):
+    """r1 and r2 belong to user-1, r3 to user-2; r1 and r3 share one clip."""
+    shared, own = put_blob(b"shared clip"), put_blob(b"r1 only")
+    await db.requests.insert_many([make_request("r1"), make_request("r2"), make_request("r3", user_id="user-2")])
+    await db.files.insert_many([
+        {"id": "f1", "request_id": "r1", "filename": shared, "file_size": 11},
+        {"id": "f2", "request_id": "r1", "filename": own, "file_size": 7},
+        {"id": "f3", "request_id": "r3", "filename": shared, "file_size": 11},
+    ])
+    await db.messages.insert_many([{"id": f"m{index}", "request_id": request_id} for index, request_id in enumerate(["r1", "r2", "r3"])])
+    return shared, own
+
+
+async def test_delete_request_counts_and_releases_only_unshared_blobs(db, admin, attachments):
+    shared, own = attachments
+
+    # The release job runs inline without the app lifespan
+    response = await admin_router.delete_request("r1", admin)
+
+    assert response["deleted"] == {
+        "users": 0, "requests": 1, "files": 2, "file_bytes": 18, "messages": 1, "notifications": 0, "unassigned": 0,
+    }
+    assert sorted([record["id"] async for record in db.files.find()]) == ["f3"]
+    storage = get_storage()
+    assert storage.stat(own) is None
+    assert storage.stat(shared) is not None
+
+
+async def test_delete_user_takes_their_requests_and_notifications(db, admin, requester, attachments):
+    await db.notifications.insert_many([{"id": "n1", "user_id": "user-1"}, {"id": "n2", "user_id": "user-2"}])
+
+    response = await admin_router.delete_user("user-1", admin)
+
+    assert response["deleted"] == {
+        "users": 1, "requests": 2, "files": 2, "file_bytes": 18, "messages": 2, "notifications": 1, "unassigned": 0,
+    }
+    assert [request["id"] async for request in db.requests.find()] == ["r3"]
+    assert [notification["id"] async for notification in db.notifications.find()] == ["n2"]
+
+
+async def test_delete_staff_unassigns_their_requests(db, staff, make_request):
+    await db.requests.insert_many([
+        make_request("r1", status="in_progress", assigned_staff_id="s1", assigned_staff_name="Avery", version=2),
+        make_request("r2", assigned_staff_id="s2"),
+    ])
+
+    report = await cascade.delete_user("s1")
+
+    assert (report.users, report.requests, report.unassigned) == (1, 0, 1)
+    stored = await db.requests.find_one({"id": "r1"})
+    assert (stored["assigned_staff_id"], stored["assigned_staff_name"], stored["version"]) == (None, None, 3)
+    assert (await db.requests.find_one({"id": "r2"}))["assigned_staff_id"] == "s2"
@@ -0,0 +1,58 @@
+import orjson
+import pytest
+
+import routers.files as files_router
+import routers.requests as requests_router
+from codec import with_defaults
+from models import RecordRequest
+
+pytestmark = pytest.mark.anyio
+
+# A request as stored before versions, counters and denormalized staff fields existed
+LEGACY_REQUEST = {
+    "id": "r1",
+    "user_id": "user-1",
+    "title": "Old request",
+    "description": "Filed before the upgrade",
+    "request_type": "police_report",
+    "status": "assigned",
+    "assigned_staff_id": "s1",
+    "priority": "high",
+    "created_at": "2023-05-01T00:00:00+00:00",
+    "updated_at": "2023-05-01T00:00:00+00:00",
+}
+
+
+async def test_legacy_request_reads_back_with_model_defaults(db, admin):
+    await db.requests.insert_one(dict(LEGACY_REQUEST))
+
+    response = await requests_router.get_request("r1", admin)
+
+    body = orjson.loads(response.body)
+    assert {name: body[name] for name in ("version", "file_count", "message_count", "last_message_at", "assigned_staff_email", "files")} == {
+        "version": 0, "file_count": 0, "message_count": 0, "last_message_at": None, "assigned_staff_email": None, "files": [],
+    }
+    # What was stored is kept
+    assert (body["status"], body["priority"]) == ("assigned", "high")
+    assert set(body) == set(RecordRequest.model_fields)
+
+
+async def test_legacy_file_records_get_hash_and_preview_defaults(db, admin):
+    await db.requests.insert_one(dict(LEGACY_REQUEST))
+    await db.files.insert_one({
+        "id": "f1", "request_id": "r1", "filename": "f1.pdf", "original_name": "report.pdf", "file_size": 10,
+        "content_type": "application/pdf", "uploaded_by": "s1", "uploaded_at": "2023-05-02T00:00:00+00:00",
+    })
+
+    response = await files_router.get_request_files("r1", admin)
+
+    [record] = orjson.loads(response.body)
+    assert (record["sha256"], record["preview"]) == (None, None)
+
+
+def test_documents_do_not_share_default_lists():
+    first, second = with_defaults(RecordRequest, [{}, {}])
+
+    first["files"].append("x")
+
+    assert second["files"] == []
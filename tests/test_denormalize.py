@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import denormalize
+import routers.admin as admin_router
+
+pytestmark = pytest.mark.anyio
+
+STALE = {"requester_name": "Old Name", "assigned_staff_name": "Old Staff"}
+
+
+async def test_name_change_reaches_requests_as_requester_and_as_staff(db, admin, requester, staff, make_request):
+    await db.requests.insert_many([
+        make_request("asked", assigned_staff_id="s1", assigned_staff_name="Avery"),
+        make_request("handled", user_id="user-2", assigned_staff_id="user-1", assigned_staff_name="Riley Requester"),
+    ])
+
+    # Background jobs run inline without the app lifespan
+    await admin_router.update_user_name("user-1", {"full_name": "Riley Renamed"}, admin)
+
+    stored = {request["id"]: request async for request in db.requests.find()}
+    assert stored["asked"]["requester_name"] == "Riley Renamed"
+    assert stored["asked"]["assigned_staff_name"] == "Avery"
+    assert stored["handled"]["assigned_staff_name"] == "Riley Renamed"
+
+
+async def test_repair_recomputes_names_and_counters(db, requester, staff, make_request):
+    await db.requests.insert_many([
+        make_request("drifted", assigned_staff_id="s2", file_count=0, message_count=0, last_message_at=None, **STALE),
+        make_request("fine", file_count=0, message_count=0, last_message_at=None, assigned_staff_name=None, assigned_staff_email=None),
+    ])
+    await db.files.insert_many([{"id": f"f{index}", "request_id": "drifted"} for index in range(2)])
+    await db.messages.insert_one({"id": "m1", "request_id": "drifted", "created_at": "2026-02-01T00:00:00+00:00"})
+
+    assert await denormalize.repair() == {"checked": 2, "repaired": 1}
+
+    drifted = await db.requests.find_one({"id": "drifted"})
+    assert (drifted["requester_name"], drifted["assigned_staff_name"], drifted["assigned_staff_email"]) == (
+        "Riley Requester", "Blake", "s2@example.org",
+    )
+    assert (drifted["file_count"], drifted["message_count"], drifted["last_message_at"]) == (2, 1, "2026-02-01T00:00:00+00:00")
+    # Nothing left to change on a second pass
+    assert await denormalize.repair() == {"checked": 2, "repaired": 0}
+
+
+async def test_backfill_runs_once_for_legacy_requests_only(db, requester, make_request):
+    await db.requests.insert_many([make_request("legacy"), make_request("current", file_count=0, **STALE)])
+
+    assert await denormalize.backfill() == {"checked": 1, "repaired": 1}
+    assert await denormalize.backfill() is None
+
+    assert (await db.requests.find_one({"id": "legacy"}))["file_count"] == 0
+    # Only documents predating the fields are touched; drift is for repair()
+    assert (await db.requests.find_one({"id": "current"}))["requester_name"] == "Old Name"
+
+
+async def test_backfill_waits_for_another_process(db, make_request):
+    await db.requests.insert_one(make_request("legacy"))
+    await db.leases.insert_one({
+        "_id": denormalize.BACKFILL_LEASE, "owner": "elsewhere", "expires_at": datetime.now(timezone.utc) + timedelta(minutes=5),
+    })
+
+    assert await denormalize.backfill() is None
+    assert "file_count" not in await db.requests.find_one({"id": "legacy"})
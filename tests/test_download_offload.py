@@ -0,0 +1,96 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
+
+import config
+import routers.files as files_router
+import storage
+from models import User, UserRole
+from storage import get_storage
+
+pytestmark = pytest.mark.anyio
+
+# Needs RFC 6266 encoding: non-ASCII, a space and a quote
+FILENAME = 'Bodycam – "Unit 12".mp4'
+ENCODED = "attachment; filename*=utf-8''Bodycam%20%E2%80%93%20%22Unit%2012%22.mp4"
+
+
+@pytest.fixture
+def offload(upload_dir, monkeypatch):
+    def use(mode: str):
+        monkeypatch.setattr(config, "DOWNLOAD_OFFLOAD", mode)
+        monkeypatch.setattr(storage, "_storage", None)
+        return get_storage()
+
+    return use
+
+
+@pytest.fixture
+async def video(db, put_blob, make_request):
+    """A stored upload f1 on request r1; returns its blob name."""
+    name = put_blob(b"\x00\x00\x00\x18ftypmp42" * 1000)
+    await db.requests.insert_one(make_request("r1"))
+    await db.files.insert_one({
+        "id": "f1", "request_id": "r1", "filename": name, "original_name": FILENAME, "file_size": 12000,
+        "content_type": "video/mp4", "uploaded_by": "user-1", "uploaded_at": "2024-01-01T00:00:00+00:00",
+    })
+    return name
+
+
+async def test_nginx_gets_the_internal_path_under_the_prefix(offload, video, requester):
+    offload("nginx")
+
+    response = await files_router.download_file("f1", requester)
+
+    assert response.headers["x-accel-redirect"] == f"/protected-uploads/{video[:2]}/{video[2:4]}/{video}"
+    assert response.headers["content-disposition"] == ENCODED
+    assert response.media_type == "video/mp4"
+    assert response.body == b""
+
+
+def test_nginx_path_is_quoted(offload, upload_dir, monkeypatch):
+    monkeypatch.setattr(config, "DOWNLOAD_OFFLOAD_PREFIX", "/internal/")
+    blobs = offload("nginx")
+    # A legacy upload whose name needs escaping in a URI
+    (upload_dir / "scan 1#.pdf").write_bytes(b"%PDF-1.4")
+
+    response = blobs.download_response("scan 1#.pdf", "scan.pdf", "application/pdf")
+
+    assert response.headers["x-accel-redirect"] == "/internal/scan%201%23.pdf"
+    assert response.headers["content-disposition"] == 'attachment; filename="scan.pdf"'
+
+
+async def test_sendfile_gets_the_absolute_path(offload, video, upload_dir, requester):
+    offload("sendfile")
+
+    response = await files_router.download_file("f1", requester)
+
+    assert response.headers["x-sendfile"] == str((upload_dir / video[:2] / video[2:4] / video).resolve())
+    assert response.headers["content-disposition"] == ENCODED
+    assert response.body == b""
+
+
+async def test_without_offload_the_worker_streams_the_file(offload, video, upload_dir, requester):
+    offload("")
+
+    response = await files_router.download_file("f1", requester)
+
+    assert isinstance(response, FileResponse)
+    assert response.path == upload_dir / video[:2] / video[2:4] / video
+    assert "x-accel-redirect" not in response.headers and "x-sendfile" not in response.headers
+    assert response.headers["content-disposition"] == ENCODED
+
+
+async def test_offload_still_checks_permissions(offload, video):
+    offload("nginx")
+    stranger = User(id="user-2", email="sam@example.org", full_name="Sam Stranger", role=UserRole.USER)
+
+    with pytest.raises(HTTPException) as error:
+        await files_router.download_file("f1", stranger)
+
+    assert error.value.status_code == 403
+
+
+def test_unknown_offload_mode_is_refused(offload):
+    with pytest.raises(RuntimeError, match="DOWNLOAD_OFFLOAD"):
+        offload("lighttpd")
@@ -0,0 +1,39 @@
+import pytest
+
+import emails
+
+pytestmark = pytest.mark.anyio
+
+REQUEST = {
+    "id": "r1", "user_id": "user-1", "title": "Report", "description": "Records, please",
+    "request_type": "police_report", "created_at": "2026-01-01T00:00:00+00:00", "updated_at": "2026-01-01T00:00:00+00:00",
+}
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    sent = []
+
+    async def record(to_email, subject, content, html_content=None):
+        sent.append(to_email)
+
+    monkeypatch.setattr(emails, "send_email", record)
+    return sent
+
+
+@pytest.mark.parametrize("count", [1, 2])
+async def test_status_digest_skips_undeliverable_addresses(sent, count):
+    changes = [(dict(REQUEST, id=f"r{index}"), "pending") for index in range(count)]
+
+    await emails.send_status_update_digest({"email": "riley@example.com"}, changes, "completed")
+
+    assert sent == []
+
+
+@pytest.mark.parametrize("count", [1, 2])
+async def test_status_digest_sends_one_email(sent, count):
+    changes = [(dict(REQUEST, id=f"r{index}"), "pending") for index in range(count)]
+
+    await emails.send_status_update_digest({"email": "riley@shakerheights.gov"}, changes, "completed")
+
+    assert sent == ["riley@shakerheights.gov"]
@@ -0,0 +1,33 @@
+import logging
+import threading
+
+import structured_logging
+
+
+def test_importing_the_app_starts_no_logging_thread():
+    before = threading.active_count()
+
+    import server  # noqa: F401
+
+    assert structured_logging._listener is None
+    assert threading.active_count() == before
+
+
+def test_stopping_flushes_and_restores_direct_logging(capsys):
+    root = logging.getLogger()
+    handlers, level = root.handlers, root.level
+    try:
+        structured_logging.setup_logging()
+        listener = structured_logging._listener
+        logging.getLogger("server").error("Worker stopped")
+
+        structured_logging.stop_logging()
+
+        assert listener._thread is None and structured_logging._listener is None
+        assert "Worker stopped" in capsys.readouterr().err
+        # After shutdown, records skip the queue
+        logging.getLogger("server").error("Late")
+        assert "Late" in capsys.readouterr().err
+        structured_logging.stop_logging()  # idempotent, as at exit
+    finally:
+        root.handlers, root.level = handlers, level
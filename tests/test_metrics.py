@@ -0,0 +1,22 @@
+import pytest
+from starlette.requests import Request
+
+import config
+from metrics import metrics_endpoint
+
+pytestmark = pytest.mark.anyio
+
+
+def scrape(authorization: str = None) -> Request:
+    headers = [(b"authorization", authorization.encode())] if authorization else []
+    return Request({"type": "http", "method": "GET", "path": "/metrics", "headers": headers})
+
+
+async def test_token_is_required_when_configured(monkeypatch):
+    monkeypatch.setattr(config, "METRICS_TOKEN", "s3cret")
+
+    assert (await metrics_endpoint(scrape())).status_code == 401
+    assert (await metrics_endpoint(scrape("Bearer wrong"))).status_code == 401
+    response = await metrics_endpoint(scrape("Bearer s3cret"))
+    assert response.status_code == 200
+    assert b"http_request_duration_seconds" in response.body
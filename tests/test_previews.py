@@ -0,0 +1,133 @@
+import io
+
+import pytest
+from fastapi import HTTPException
+from PIL import Image
+
+import previews
+import routers.files as files_router
+from storage import get_storage
+
+pytestmark = pytest.mark.anyio
+
+# PyMuPDF is an optional dependency (requirements-pdf-previews.txt)
+needs_pymupdf = pytest.mark.skipif(not previews.pdf_supported(), reason="PyMuPDF not installed")
+
+
+def png(size=(800, 600)) -> bytes:
+    output = io.BytesIO()
+    Image.linear_gradient("L").resize(size).convert("RGBA").save(output, "PNG")
+    return output.getvalue()
+
+
+def pdf() -> bytes:
+    pymupdf = previews._pymupdf()
+    with pymupdf.open() as document:
+        document.new_page().insert_text((72, 72), "Incident report")
+        return document.tobytes()
+
+
+@pytest.fixture
+def stored_file(db, put_blob, make_request):
+    """Store ``data`` as file f1 of request r1, claiming ``content_type``; returns the blob name."""
+
+    async def store(data: bytes, content_type: str, **fields) -> str:
+        name = put_blob(data)
+        await db.requests.insert_one(make_request("r1"))
+        await db.files.insert_one({
+            "id": "f1", "request_id": "r1", "filename": name, "original_name": "upload", "file_size": len(data),
+            "content_type": content_type, "uploaded_by": "user-1", "uploaded_at": "2024-01-01T00:00:00+00:00", **fields,
+        })
+        return name
+
+    return store
+
+
+def preview_of(name: str) -> Image.Image:
+    return Image.open(io.BytesIO(get_storage().read_preview(name)))
+
+
+async def test_image_upload_gets_a_scaled_jpeg_preview(db, stored_file):
+    name = await stored_file(png(), "image/png")
+
+    assert await previews.generate("f1") == previews.READY
+
+    assert (await db.files.find_one({"id": "f1"}))["preview"] == previews.READY
+    image = preview_of(name)
+    assert (image.format, max(image.size)) == ("JPEG", previews.config.PREVIEW_SIZE)
+
+
+@needs_pymupdf
+async def test_pdf_upload_previews_its_first_page(stored_file):
+    name = await stored_file(pdf(), "application/pdf")
+
+    assert await previews.generate("f1") == previews.READY
+
+    assert preview_of(name).format == "JPEG"
+
+
+@pytest.mark.parametrize("claimed", ["image/png", pytest.param("application/pdf", marks=needs_pymupdf)])
+async def test_content_that_is_not_what_it_claims_is_not_parsed(stored_file, monkeypatch, claimed):
+    name = await stored_file(b"<svg onload=alert(1)>" * 100, claimed)
+    monkeypatch.setattr(previews, "_first_page", lambda *args: pytest.fail("parsed as a PDF"))
+
+    assert await previews.generate("f1") == previews.SKIPPED
+
+    assert not get_storage().has_preview(name)
+
+
+@needs_pymupdf
+async def test_renderer_follows_the_bytes_not_the_claim(monkeypatch, stored_file):
+    await stored_file(png(), "application/pdf")
+    monkeypatch.setattr(previews, "_first_page", lambda *args: pytest.fail("parsed as a PDF"))
+
+    assert await previews.generate("f1") == previews.READY
+
+
+async def test_pdfs_wait_for_pymupdf(stored_file, monkeypatch):
+    monkeypatch.setattr(previews, "pdf_supported", lambda: False)
+    await stored_file(b"%PDF-1.4\n" * 100, "application/pdf")
+
+    assert await previews.generate("f1") is None
+
+
+async def test_pdf_claiming_to_be_an_image_is_skipped_without_pymupdf(stored_file, monkeypatch):
+    monkeypatch.setattr(previews, "pdf_supported", lambda: False)
+    monkeypatch.setattr(previews, "_first_page", lambda *args: pytest.fail("parsed as a PDF"))
+    await stored_file(b"%PDF-1.4\n" * 100, "image/png")
+
+    assert await previews.generate("f1") == previews.SKIPPED
+
+
+def test_sniff_recognizes_each_previewable_format():
+    assert previews.sniff(png()[:16]) == "PNG"
+    assert previews.sniff(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "WEBP"
+    assert previews.sniff(b"%PDF-1.7\n") == "PDF"
+    assert previews.sniff(b"PK\x03\x04") is None
+
+
+async def test_preview_is_served_immutable_with_an_etag(stored_file, admin):
+    name = await stored_file(png(), "image/png")
+    await previews.generate("f1")
+
+    response = await files_router.get_preview("f1", None, admin)
+
+    assert response.status_code == 200
+    assert response.media_type == "image/jpeg"
+    assert response.headers["cache-control"] == "private, max-age=31536000, immutable"
+    assert response.headers["etag"] == f'"{name}"'
+    assert response.body == get_storage().read_preview(name)
+
+    cached = await files_router.get_preview("f1", f'"{name}"', admin)
+
+    assert (cached.status_code, cached.body) == (304, b"")
+    assert cached.headers["etag"] == f'"{name}"'
+
+
+async def test_preview_is_404_until_rendered(stored_file, admin):
+    await stored_file(png(), "image/png", preview=previews.FAILED)
+
+    with pytest.raises(HTTPException) as error:
+        await files_router.get_preview("f1", None, admin)
+
+    assert error.value.status_code == 404
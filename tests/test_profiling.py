@@ -0,0 +1,106 @@
+import logging
+
+import pytest
+
+import config
+import profiling
+from monitoring import RequestStats, command_shape
+from profiling import QueryProfiler
+
+
+def find_user(user_id: str) -> dict:
+    return {"find": "users", "filter": {"id": user_id, "is_active": {"$ne": False}}, "limit": 1, "lsid": {"id": user_id}}
+
+
+def stats_of(*commands) -> RequestStats:
+    """Stats of a request that ran ``(shape, seconds)`` commands."""
+    stats = RequestStats()
+    for shape, seconds in commands:
+        stats.commands.append((shape.split()[0], seconds, shape))
+    return stats
+
+
+def test_shapes_drop_literals():
+    assert command_shape("find", find_user("u1")) == "find users {id,is_active}"
+    assert command_shape("find", find_user("u1")) == command_shape("find", find_user("u2"))
+    assert command_shape("update", {"update": "requests", "updates": [{"q": {"id": "r1"}, "u": {"$set": {"status": "closed"}}}]}) == (
+        "update requests {id}"
+    )
+    assert command_shape("aggregate", {"aggregate": "files", "pipeline": [
+        {"$match": {"request_id": "r1", "uploaded_by": "s1"}}, {"$group": {"_id": "$request_id"}},
+    ]}) == "aggregate files [$match{request_id,uploaded_by},$group]"
+    assert command_shape("getMore", {"getMore": 81723, "collection": "messages"}) == "getMore messages"
+
+
+def test_different_queries_have_different_shapes():
+    assert command_shape("find", {"find": "users", "filter": {"email": "a@example.org"}}) != command_shape("find", find_user("u1"))
+    assert command_shape("find", {"find": "files", "filter": {"id": "u1"}}) != command_shape("find", find_user("u1"))
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    monkeypatch.setattr(config, "MAX_DB_COMMANDS_PER_REQUEST", 50)
+    monkeypatch.setattr(config, "N_PLUS_ONE_THRESHOLD", 10)
+    monkeypatch.setattr(config, "SLOW_REQUEST_MS", 1000)
+    monkeypatch.setattr(config, "QUERY_PROFILER_WARN_INTERVAL_SECONDS", 60)
+    return QueryProfiler()
+
+
+@pytest.fixture
+def logged(caplog):
+    caplog.set_level(logging.WARNING, logger=profiling.__name__)
+    return lambda: [record.getMessage() for record in caplog.records if record.name == profiling.__name__]
+
+
+def test_repeated_shape_is_flagged_as_n_plus_one(profiler, logged):
+    profiler.observe("GET", "/api/staff", 0.05, stats_of(("find requests {id}", 0.001), *[("find users {id}", 0.002)] * 10))
+
+    [message] = logged()
+    assert "likely N+1: find users {id}" in message
+    assert "find users {id} x10" in message
+    assert profiler.report()[0]["flagged_requests"] == 1
+
+
+def test_command_count_is_flagged(profiler, logged, monkeypatch):
+    monkeypatch.setattr(config, "N_PLUS_ONE_THRESHOLD", 1000)
+
+    profiler.observe("DELETE", "/api/users/{user_id}", 0.2, stats_of(*[(f"find files {{field{index}}}", 0.001) for index in range(51)]))
+
+    [message] = logged()
+    assert "51 Mongo commands" in message
+    assert "N+1" not in message
+
+
+def test_slow_request_is_flagged_with_its_mongo_time(profiler, logged):
+    profiler.observe("GET", "/api/admin/requests/export", 1.5, stats_of(("aggregate requests [$match{status}]", 1.2)))
+
+    [message] = logged()
+    assert "slow (1500 ms)" in message
+    assert "1 commands, 1200 ms in Mongo" in message
+
+
+def test_requests_under_every_threshold_are_not_flagged(profiler, logged):
+    profiler.observe("GET", "/api/requests", 0.05, stats_of(*[("find requests {user_id}", 0.001)] * 9))
+
+    assert logged() == []
+    [route] = profiler.report()
+    assert (route["route"], route["requests"], route["flagged_requests"], route["max_commands"]) == ("GET /api/requests", 1, 0, 9)
+    assert route["top_shapes"] == [{"shape": "find requests {user_id}", "count": 9}]
+
+
+def test_warnings_are_rate_limited_per_route(profiler, logged, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(profiling.time, "monotonic", lambda: now[0])
+    slow = stats_of(("find users {id}", 0.001))
+
+    profiler.observe("GET", "/api/staff", 2.0, slow)
+    profiler.observe("GET", "/api/staff", 2.0, slow)
+    profiler.observe("GET", "/api/requests", 2.0, slow)
+    now[0] += 61
+    profiler.observe("GET", "/api/staff", 2.0, slow)
+
+    assert [message.split(" flagged")[0] for message in logged()] == [
+        "Query profile: GET /api/staff", "Query profile: GET /api/requests", "Query profile: GET /api/staff",
+    ]
+    # Suppressed warnings are still counted
+    assert {row["route"]: row["flagged_requests"] for row in profiler.report()} == {"GET /api/staff": 3, "GET /api/requests": 1}
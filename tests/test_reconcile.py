@@ -0,0 +1,94 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import config
+from reconcile import LEASE, StorageReconciler
+from storage import get_storage
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(autouse=True)
+def no_grace(monkeypatch):
+    monkeypatch.setattr(config, "RECONCILE_GRACE_SECONDS", 0)
+
+
+async def test_finds_orphans_and_dangling_records(db, put_blob):
+    shared = put_blob(b"shared clip")
+    orphan = put_blob(b"nobody's file")
+    gone = hashlib.sha256(b"deleted from disk").hexdigest()
+    await db.files.insert_many([
+        {"id": "f1", "request_id": "r1", "filename": shared},
+        {"id": "f2", "request_id": "r2", "filename": shared},
+        {"id": "f3", "request_id": "r3", "filename": gone},
+    ])
+
+    report = await StorageReconciler().run()
+
+    assert (report.files_stored, report.records) == (2, 3)
+    assert (report.orphans, report.quarantined) == (1, 1)
+    assert report.dangling == 1
+    assert report.dangling_sample == [{"id": "f3", "request_id": "r3", "filename": gone}]
+    storage = get_storage()
+    assert storage.is_quarantined(orphan)
+    assert storage.stat(shared) is not None
+
+
+async def test_dry_run_moves_nothing(db, put_blob):
+    orphan = put_blob(b"nobody's file")
+
+    report = await StorageReconciler().run(dry_run=True)
+
+    assert (report.orphans, report.quarantined) == (1, 0)
+    assert get_storage().stat(orphan) is not None
+
+
+async def test_dangling_record_gets_its_quarantined_file_back(db, put_blob):
+    name = put_blob(b"restored")
+    get_storage().quarantine(name)
+    await db.files.insert_one({"id": "f1", "request_id": "r1", "filename": name})
+
+    report = await StorageReconciler().run()
+
+    assert (report.restored, report.dangling) == (1, 0)
+    assert get_storage().stat(name) is not None
+
+
+async def test_orphan_claimed_by_a_new_upload_is_put_back(db, put_blob, race):
+    name = put_blob(b"uploaded again")
+    storage = get_storage()
+
+    async def reupload(blob):
+        await db.files.insert_one({"id": "f1", "request_id": "r1", "filename": blob})
+
+    race(type(storage), "quarantine", reupload, after=True)
+
+    report = await StorageReconciler().run()
+
+    assert (report.orphans, report.quarantined, report.reclaimed) == (1, 0, 1)
+    assert storage.stat(name) is not None
+
+
+async def test_scheduled_slices_advance_through_the_lease(db, upload_dir):
+    reconciler = StorageReconciler()
+
+    first = await reconciler.run_next_slice()
+    second = await reconciler.run_next_slice()
+
+    assert (first.slices, second.slices) == (["0"], ["1"])
+    assert (await reconciler.latest_report())["slices"] == ["1"]
+
+
+async def test_skips_while_another_process_holds_the_lease(db, upload_dir):
+    await db.leases.insert_one({
+        "_id": LEASE, "owner": "elsewhere", "expires_at": datetime.now(timezone.utc) + timedelta(minutes=5),
+    })
+    reconciler = StorageReconciler()
+
+    assert await reconciler.run_next_slice() is None
+    assert await reconciler.run() is None
+
+    await db.leases.update_one({"_id": LEASE}, {"$set": {"expires_at": datetime.now(timezone.utc) - timedelta(seconds=1)}})
+    assert (await reconciler.run_next_slice()).slices == ["0"]
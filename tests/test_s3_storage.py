@@ -0,0 +1,121 @@
+import io
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from fastapi import UploadFile
+from moto import mock_aws
+
+import blobstore
+import config
+import routers.files as files_router
+import storage as storage_module
+from storage import get_storage
+
+pytestmark = pytest.mark.anyio
+
+BUCKET = "records-test"
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        monkeypatch.setenv(name, "testing")
+    settings = {"STORAGE_BACKEND": "s3", "S3_BUCKET": BUCKET, "S3_ENDPOINT_URL": "", "S3_REGION": "us-east-1", "S3_PREFIX": "", "S3_PART_SIZE_MB": 5}
+    for name, value in settings.items():
+        monkeypatch.setattr(config, name, value)
+    with mock_aws():
+        monkeypatch.setattr(storage_module, "_storage", None)
+        storage = get_storage()
+        storage.client.create_bucket(Bucket=BUCKET)
+        yield storage
+    storage_module._storage = None
+
+
+def keys(storage, prefix: str) -> list:
+    return [item["Key"] for item in storage.client.list_objects_v2(Bucket=BUCKET, Prefix=prefix).get("Contents", [])]
+
+
+class FailingFile(io.RawIOBase):
+    """Yields ``size`` bytes, then fails as a dropped connection would."""
+
+    def __init__(self, size: int):
+        self.remaining = size
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            raise ConnectionResetError("client went away")
+        chunk = min(size if size > 0 else self.remaining, self.remaining)
+        self.remaining -= chunk
+        return b"x" * chunk
+
+
+async def test_large_upload_goes_up_in_parts(s3):
+    data = bytes(range(256)) * (11 * MB // 256)
+    writer = s3.open_incoming()
+    for start in range(0, len(data), MB):
+        writer.write(data[start:start + MB])
+    writer.close()
+
+    assert [part["PartNumber"] for part in writer._parts] == [1, 2, 3]
+    assert s3.publish(writer.ref, "clip") is False
+    assert s3.open("clip").read() == data
+    assert s3.stat("clip")[1] == len(data)
+    assert keys(s3, "incoming/") == []
+
+
+async def test_small_upload_is_a_single_put(s3):
+    blob = await blobstore.receive(UploadFile(io.BytesIO(b"short"), filename="note.txt"))
+
+    assert await blobstore.publish(blob) is False
+    assert s3.open(blob.filename).read() == b"short"
+    # The same content again is a duplicate; its incoming copy is dropped
+    again = await blobstore.receive(UploadFile(io.BytesIO(b"short"), filename="copy.txt"))
+    assert await blobstore.publish(again) is True
+    assert keys(s3, "incoming/") == []
+
+
+async def test_failed_upload_aborts_its_multipart_upload(s3):
+    with pytest.raises(ConnectionResetError):
+        await blobstore.receive(UploadFile(FailingFile(7 * MB), filename="clip.mp4"))
+
+    assert s3.client.list_multipart_uploads(Bucket=BUCKET).get("Uploads", []) == []
+    assert keys(s3, "incoming/") == []
+
+
+async def test_quarantine_restore_and_delete(s3):
+    writer = s3.open_incoming()
+    writer.write(b"blob")
+    writer.close()
+    s3.publish(writer.ref, "name")
+
+    assert s3.quarantine("name") and s3.stat("name") is None and s3.is_quarantined("name")
+    assert s3.restore("name") and s3.stat("name") is not None and not s3.is_quarantined("name")
+    s3.quarantine("name")
+    s3.delete_quarantined("name")
+    assert not s3.is_quarantined("name") and s3.stat("name") is None
+    assert s3.quarantine("missing") is False
+
+
+async def test_download_url_is_presigned_for_the_blob(s3, db, admin, make_request):
+    blob = await blobstore.receive(UploadFile(io.BytesIO(b"%PDF-1.4"), filename="report.pdf"))
+    await blobstore.publish(blob)
+    await db.requests.insert_one(make_request("r1"))
+    await db.files.insert_one({
+        "id": "f1", "request_id": "r1", "filename": blob.filename, "original_name": "Incident report.pdf", "content_type": "application/pdf",
+    })
+
+    body = await files_router.download_url("f1", admin)
+
+    url = urlparse(body["url"])
+    query = parse_qs(url.query)
+    assert url.path.endswith(f"/blobs/{blob.filename}")
+    assert query["response-content-type"] == ["application/pdf"]
+    assert query["response-content-disposition"] == ["attachment; filename*=utf-8''Incident%20report.pdf"]
+    assert query["X-Amz-Expires"] == [str(config.S3_PRESIGN_SECONDS)]
+    assert body["expires_in"] == config.S3_PRESIGN_SECONDS
+    redirect = await files_router.download_file("f1", admin)
+    assert (redirect.status_code, redirect.headers["location"].split("?")[0]) == (307, body["url"].split("?")[0])
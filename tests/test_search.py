@@ -0,0 +1,98 @@
+"""Search scoping and ranking.
+
+mongomock has no ``$text`` and no ``$lookup`` pipelines, so the matchers are
+exercised through the pipelines they build, and ``search_requests`` with the
+matchers stubbed out.
+"""
+import pytest
+
+import search
+from routers.search import visible_requests_filter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def stored(db, make_request):
+    await db.requests.insert_many([
+        make_request("mine", user_id="user-1", assigned_staff_id="s1"),
+        make_request("open", user_id="user-2"),
+        make_request("theirs", user_id="user-3", assigned_staff_id="s2"),
+    ])
+
+
+def stages(pipeline):
+    return [next(iter(stage)) for stage in pipeline]
+
+
+async def test_message_matches_are_scoped_before_the_cap(staff):
+    base = visible_requests_filter(staff[0])
+
+    pipeline = search.message_pipeline("camera", base, 100)
+
+    lookup = pipeline[stages(pipeline).index("$lookup")]["$lookup"]
+    assert (lookup["localField"], lookup["foreignField"]) == ("request_id", "id")
+    assert lookup["pipeline"][0] == {"$match": base}
+    assert stages(pipeline).index("$match", 1) < stages(pipeline).index("$limit")
+
+
+async def test_requester_matches_are_scoped_before_the_cap(requester):
+    base = visible_requests_filter(requester)
+
+    pipeline = search.requester_pipeline("riley", base, 100)
+
+    assert pipeline[0] == {"$match": {"$text": {"$search": "riley"}, "role": "user"}}
+    lookup = pipeline[stages(pipeline).index("$lookup")]["$lookup"]
+    assert (lookup["localField"], lookup["foreignField"]) == ("id", "user_id")
+    assert lookup["pipeline"][0] == {"$match": {"user_id": "user-1"}}
+    assert stages(pipeline).index("$lookup") < stages(pipeline).index("$limit")
+
+
+@pytest.fixture
+def hits(monkeypatch):
+    """Stub the matchers with fixed scores per source; records which ran."""
+    called = []
+
+    def stub(source, scores):
+        async def match(text, base, results, limit):
+            called.append((source, base))
+            for request_id, score in scores.items():
+                results.add(source, request_id, score)
+        return match
+
+    monkeypatch.setattr(search, "_match_requests", stub("request", {"mine": 1.0, "open": 2.0}))
+    monkeypatch.setattr(search, "_match_messages", stub("messages", {"mine": 4.0, "gone": 9.0}))
+    monkeypatch.setattr(search, "_match_requesters", stub("requester", {"open": 0.5}))
+    return called
+
+
+async def test_sources_add_up_by_weight(stored, hits):
+    page = await search.search_requests("camera", {})
+
+    # mine: 1.0 + 0.5 * 4.0; open: 2.0 + 0.8 * 0.5; gone was deleted after matching
+    assert [(row["id"], row["score"], row["matched"]) for row in page["results"]] == [
+        ("mine", 3.0, ["messages", "request"]),
+        ("open", 2.4, ["request", "requester"]),
+    ]
+    assert page["total"] == 3
+    assert page["results"][0]["version"] == 0
+    assert [source for source, _ in hits] == ["request", "messages", "requester"]
+
+
+async def test_filters_reach_every_source_without_a_scope_query(db, stored, hits, staff, monkeypatch):
+    base = visible_requests_filter(staff[0])
+    queries = []
+    find = type(db.requests).find
+
+    def recording_find(collection, query, *args):
+        if collection.name == "requests":
+            queries.append(query)
+        return find(collection, query, *args)
+
+    monkeypatch.setattr(type(db.requests), "find", recording_find)
+
+    await search.search_requests("camera", base, status="submitted")
+
+    assert all(seen == {**base, "status": "submitted"} for _, seen in hits)
+    # Only the page itself is read from requests
+    assert [list(query) for query in queries] == [["id"]]
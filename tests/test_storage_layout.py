@@ -0,0 +1,54 @@
+import hashlib
+
+from typer.testing import CliRunner
+
+import cli
+from storage import get_storage
+
+
+def flat(upload_dir, data: bytes) -> str:
+    """An upload stored the old way, directly in UPLOAD_DIR."""
+    name = hashlib.sha256(data).hexdigest()
+    (upload_dir / name).write_bytes(data)
+    return name
+
+
+def test_flat_uploads_are_still_found(upload_dir):
+    name = flat(upload_dir, b"before the fan-out")
+    storage = get_storage()
+
+    assert storage.locate(name) == upload_dir / name
+    assert storage.open(name).read() == b"before the fan-out"
+    assert list(storage.list_names(None, None)) == [name]
+    # The same content uploaded again is a duplicate, not a second copy
+    writer = storage.open_incoming()
+    writer.write(b"before the fan-out")
+    writer.close()
+    assert storage.publish(writer.ref, name) is True
+    assert not storage.blob_path(name).exists()
+
+
+def test_migration_moves_flat_uploads_in_batches(upload_dir):
+    names = [flat(upload_dir, f"upload {index}".encode()) for index in range(3)]
+    storage = get_storage()
+    storage.quarantine(names[0])
+
+    assert [storage.migrate_flat_batch(1) for _ in range(3)] == [1, 1, 0]
+
+    for name in names[1:]:
+        assert storage.locate(name) == upload_dir / name[:2] / name[2:4] / name
+    # Quarantined files stay where they are
+    assert storage.is_quarantined(names[0])
+
+
+def test_migrate_uploads_command_can_be_run_again(upload_dir):
+    names = [flat(upload_dir, f"upload {index}".encode()) for index in range(5)]
+    runner = CliRunner()
+
+    first = runner.invoke(cli.app, ["migrate-uploads", "--batch-size", "2"])
+    again = runner.invoke(cli.app, ["migrate-uploads"])
+
+    assert first.exit_code == 0 and "Done: 5 files moved" in first.output
+    assert again.exit_code == 0 and "Done: 0 files moved" in again.output
+    assert all(get_storage().blob_path(name).is_file() for name in names)
+    assert not any(path.is_file() for path in upload_dir.iterdir())
@@ -0,0 +1,58 @@
+import pytest
+from fastapi import HTTPException
+
+from transitions import transition
+
+pytestmark = pytest.mark.anyio
+
+PROJECTION = {"_id": 0, "id": 1, "status": 1, "assigned_staff_id": 1}
+
+
+async def test_returns_the_request_as_it_was_and_bumps_the_version(db, make_request):
+    await db.requests.insert_one(make_request("r1", status="assigned", assigned_staff_id="s1", version=3))
+
+    before = await transition("r1", {"status": "in_progress"}, PROJECTION, version=3, staff_id="s1")
+
+    assert before["status"] == "assigned"
+    assert before["version"] == 3
+    stored = await db.requests.find_one({"id": "r1"})
+    assert (stored["status"], stored["version"]) == ("in_progress", 4)
+
+
+async def test_stale_version_is_a_conflict(db, make_request):
+    await db.requests.insert_one(make_request("r1", version=2))
+
+    with pytest.raises(HTTPException) as error:
+        await transition("r1", {"status": "denied"}, PROJECTION, version=1)
+
+    assert error.value.status_code == 409
+    stored = await db.requests.find_one({"id": "r1"})
+    assert (stored["status"], stored["version"]) == ("pending", 2)
+
+
+async def test_staff_cannot_move_a_request_assigned_to_someone_else(db, make_request):
+    await db.requests.insert_one(make_request("r1", status="assigned", assigned_staff_id="s2"))
+
+    with pytest.raises(HTTPException) as error:
+        await transition("r1", {"status": "completed"}, PROJECTION, staff_id="s1")
+
+    assert error.value.status_code == 403
+    assert (await db.requests.find_one({"id": "r1"}))["status"] == "assigned"
+
+
+async def test_missing_request_is_not_found(db):
+    with pytest.raises(HTTPException) as error:
+        await transition("nope", {"status": "completed"}, PROJECTION)
+
+    assert error.value.status_code == 404
+
+
+async def test_requests_without_a_version_match_version_zero(db, make_request):
+    legacy = make_request("r1")
+    del legacy["version"]
+    await db.requests.insert_one(legacy)
+
+    before = await transition("r1", {"status": "denied"}, PROJECTION, version=0)
+
+    assert before["version"] == 0
+    assert (await db.requests.find_one({"id": "r1"}))["version"] == 1